@@ -0,0 +1,4 @@
+"""
+Local benchmarks and load tools for the ProductPulse fetch/analyze pipeline
+Run modules with: python -m benchmarks.<module>
+"""
@@ -0,0 +1,83 @@
+"""
+Before/after comparison of analysis prompt cost
+Runs the pipeline benchmark twice on the same generated data: once against the
+convex/ functions of a git ref (checked out in a temporary worktree) and once
+against this checkout, then compares Gemini tokens per item, analyze latency
+and tracked-term recall.
+
+    python -m benchmarks.analysis_tokens --before HEAD~1 --long-body-rate 0.3
+"""
+import argparse
+import os
+import subprocess
+import tempfile
+
+from benchmarks.pipeline import REPO_ROOT, build_parser, run_benchmark
+
+
+def summarize(results):
+    """Comparable numbers from one pipeline run"""
+    analyze = results['stages']['analyze_item']
+    gemini = results['meta']['gemini']
+    tokens = results['meta']['tokensPerItem']
+    return {
+        'Prompt tokens / item': tokens['prompt'],
+        'Uncached tokens / item': tokens['uncached'],
+        'Output tokens / item': tokens['output'],
+        'Billed USD / 1k items': results['meta']['billedUsdPer1kItems'],
+        'Gemini requests': gemini['requests'],
+        'Context caches created': gemini.get('caches_created', 0),
+        'Insights created': analyze['insightsCreated'],
+        'Term recall': analyze.get('termRecall'),
+        'analyze_item p50 ms': analyze['p50Ms'],
+        'analyze_item p95 ms': analyze['p95Ms'],
+        'analyze_item per sec': analyze['throughputPerSec'],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare analysis token usage between a git ref and this checkout')
+    parser.add_argument('--before', default='HEAD', help='Git ref for the baseline (default: HEAD)')
+    parser.add_argument('--long-body-rate', type=float, default=0.3)
+    parser.add_argument('--analyze-limit', type=int, default=200)
+    parser.add_argument('--gemini-latency-ms', type=int, default=150)
+    parser.add_argument('--gemini-ms-per-1k-tokens', type=float, default=200.0)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    # Small dataset: only the analyze stage matters here
+    bench_args = build_parser().parse_args([
+        '--projects', '3', '--sources', '12', '--history-days', '1', '--insights-per-day', '1',
+        '--parse-feeds', '3', '--parse-rounds', '1', '--query-rounds', '1',
+        '--analyze-limit', str(args.analyze_limit),
+        '--long-body-rate', str(args.long_body_rate),
+        '--gemini-latency-ms', str(args.gemini_latency_ms),
+        '--gemini-ms-per-1k-tokens', str(args.gemini_ms_per_1k_tokens),
+        '--seed', str(args.seed),
+    ])
+
+    with tempfile.TemporaryDirectory() as tmp:
+        worktree = os.path.join(tmp, 'before')
+        subprocess.run(['git', 'worktree', 'add', '--detach', worktree, args.before],
+                       cwd=REPO_ROOT, check=True, capture_output=True)
+        try:
+            bench_args.convex_dir = os.path.join(worktree, 'convex')
+            before = summarize(run_benchmark(bench_args))
+        finally:
+            subprocess.run(['git', 'worktree', 'remove', '--force', worktree], cwd=REPO_ROOT, check=False)
+
+    bench_args.convex_dir = None
+    after = summarize(run_benchmark(bench_args))
+
+    print(f'\n{"":<26} {args.before:>12} {"working tree":>14} {"change":>8}')
+    for name, old in before.items():
+        new = after[name]
+        if isinstance(old, (int, float)) and isinstance(new, (int, float)) and old:
+            change = f'{(new - old) / old:+.0%}'
+        else:
+            change = ''
+        print(f'{name:<26} {old if old is not None else "-":>12} {new if new is not None else "-":>14} {change:>8}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,209 @@
+"""
+Synthetic RSS/Atom corpus generator
+Produces feeds shaped like the ones ProductPulse ingests: Reddit (Atom, HTML
+content), Hacker News (RSS, CDATA descriptions) and StackExchange (Atom,
+escaped HTML summaries), with entities and non-ASCII text mixed in. A share of
+long posts (--long-body-rate) only names the product deep into the body.
+
+    python -m benchmarks.corpus --out corpus/ --feeds 30 --items 25
+"""
+import argparse
+import hashlib
+import os
+import random
+import time
+from email.utils import formatdate
+from xml.sax.saxutils import escape
+
+FLAVORS = ['reddit', 'hackernews', 'stackexchange']
+
+PRODUCTS = ['Notion', 'Linear', 'Jira', 'Asana', 'Trello', 'ClickUp', 'Monday', 'Obsidian']
+TOPICS = [
+    'pricing change', 'mobile app performance', 'offline sync', 'API rate limits',
+    'dark mode', 'keyboard shortcuts', 'SSO & SCIM', 'export to CSV', 'search speed',
+    'onboarding flow', 'integrations', 'customer support',
+]
+PHRASES = [
+    'Has anyone else noticed {topic} in {product} lately?',
+    'Switched from {product} to {other} because of {topic}.',
+    '{product} vs {other}: which handles {topic} better?',
+    'Why is {topic} so bad in {product} after the last update?',
+    'Really impressed with {topic} in {product} - "it just works".',
+    'Ask: how do you deal with {topic} when using {product} at scale?',
+]
+FILLER = [
+    'We have about 40 people on the team & most of them use it daily.',
+    'The docs say <b>one thing</b> but support told us another.',
+    'Tried clearing the cache, reinstalling, and logging out – no luck.',
+    'Honestly the rest of the product is great, this is the only blocker.',
+    'Our admin filed a ticket two weeks ago and is still waiting.',
+    'Pricing went from $8 to $12 per seat which is hard to justify.',
+    'Performance is fine on desktop but the Android app takes ~6s to open.',
+    'Would love to hear how other teams have set this up. Café meeting notes are a mess.',
+]
+
+# Long write-ups: generic title, product named far into the body
+LONG_TITLES = [
+    'A year of running our team on one tool - long write-up',
+    'Lessons from migrating 300 projects (long post)',
+    'Our whole workflow, start to finish',
+]
+LONG_MENTION = 'In the end we settled on {product} over {other}, mostly because of {topic}.'
+
+
+def _rng(*parts):
+    """Deterministic RNG for a feed/item so corpora are reproducible"""
+    digest = hashlib.sha256('|'.join(map(str, parts)).encode('utf-8')).digest()
+    return random.Random(int.from_bytes(digest[:8], 'big'))
+
+
+def make_post(feed_id, index, seed=0, long_body_rate=0.0):
+    """Title, HTML body and author of one synthetic post"""
+    rng = _rng(seed, feed_id, index)
+    product, other = rng.sample(PRODUCTS, 2)
+    title = rng.choice(PHRASES).format(product=product, other=other, topic=rng.choice(TOPICS))
+    if long_body_rate and rng.random() < long_body_rate:
+        title = rng.choice(LONG_TITLES)
+        paragraphs = [rng.choice(FILLER) for _ in range(rng.randint(40, 70))]
+        mention = LONG_MENTION.format(product=product, other=other, topic=rng.choice(TOPICS))
+        paragraphs.insert(rng.randint(len(paragraphs) * 2 // 3, len(paragraphs)), mention)
+    else:
+        paragraphs = [rng.choice(FILLER) for _ in range(rng.randint(2, 6))]
+    body = ''.join(f'<p>{p}</p>' for p in paragraphs)
+    if rng.random() < 0.3:
+        body += f'<pre><code>curl -H "Accept: application/json" https://api.{product.lower()}.com/v1/items?limit=100</code></pre>'
+    author = f'user_{rng.randint(1000, 99999)}'
+    return title, body, author
+
+
+def _timestamps(item_count, now, spacing_s):
+    return [now - i * spacing_s for i in range(item_count)]
+
+
+def _iso(ts):
+    return time.strftime('%Y-%m-%dT%H:%M:%S+00:00', time.gmtime(ts))
+
+
+def render_reddit(feed_id, item_count=25, seed=0, now=None, spacing_s=900, long_body_rate=0.0):
+    """Atom feed in the shape of reddit.com/r/<sub>/.rss"""
+    now = now or time.time()
+    sub = f'bench{feed_id}'
+    entries = []
+    for i, ts in enumerate(_timestamps(item_count, now, spacing_s)):
+        title, body, author = make_post(feed_id, i, seed, long_body_rate)
+        post_id = f't3_{feed_id}{i:05d}'
+        entries.append(
+            f'<entry><author><name>/u/{author}</name><uri>https://www.reddit.com/user/{author}</uri></author>'
+            f'<category term="{sub}" label="r/{sub}"/>'
+            f'<content type="html">{escape(body)}</content>'
+            f'<id>{post_id}</id>'
+            f'<link href="https://www.reddit.com/r/{sub}/comments/{post_id[3:]}/"/>'
+            f'<updated>{_iso(ts)}</updated><published>{_iso(ts)}</published>'
+            f'<title>{escape(title)}</title></entry>'
+        )
+    return (f'<?xml version="1.0" encoding="UTF-8"?>'
+            f'<feed xmlns="http://www.w3.org/2005/Atom" xmlns:media="http://search.yahoo.com/mrss/">'
+            f'<category term="{sub}" label="r/{sub}"/><updated>{_iso(now)}</updated>'
+            f'<id>/r/{sub}/.rss</id><link rel="self" href="https://www.reddit.com/r/{sub}/.rss" '
+            f'type="application/atom+xml"/><title>r/{sub}</title>{"".join(entries)}</feed>')
+
+
+def render_hackernews(feed_id, item_count=25, seed=0, now=None, spacing_s=900, long_body_rate=0.0):
+    """RSS 2.0 feed in the shape of hnrss.org (CDATA descriptions)"""
+    now = now or time.time()
+    items = []
+    for i, ts in enumerate(_timestamps(item_count, now, spacing_s)):
+        title, body, author = make_post(feed_id, i, seed, long_body_rate)
+        story = 40000000 + int(feed_id) * 1000 + i if str(feed_id).isdigit() else 40000000 + i
+        items.append(
+            f'<item><title><![CDATA[{title}]]></title>'
+            f'<description><![CDATA[{body}<hr><p>Comments URL: '
+            f'<a href="https://news.ycombinator.com/item?id={story}">link</a></p>]]></description>'
+            f'<pubDate>{formatdate(ts, usegmt=True)}</pubDate>'
+            f'<link>https://news.ycombinator.com/item?id={story}</link>'
+            f'<dc:creator>{author}</dc:creator>'
+            f'<comments>https://news.ycombinator.com/item?id={story}</comments>'
+            f'<guid isPermaLink="false">https://news.ycombinator.com/item?id={story}</guid></item>'
+        )
+    return (f'<?xml version="1.0" encoding="UTF-8"?>'
+            f'<rss version="2.0" xmlns:dc="http://purl.org/dc/elements/1.1/" '
+            f'xmlns:atom="http://www.w3.org/2005/Atom"><channel>'
+            f'<title>Hacker News: bench {feed_id}</title><link>https://news.ycombinator.com/</link>'
+            f'<description>Hacker News RSS</description>'
+            f'<lastBuildDate>{formatdate(now, usegmt=True)}</lastBuildDate>'
+            f'{"".join(items)}</channel></rss>')
+
+
+def render_stackexchange(feed_id, item_count=25, seed=0, now=None, spacing_s=900, long_body_rate=0.0):
+    """Atom feed in the shape of stackoverflow.com/feeds/tag/<tag>"""
+    now = now or time.time()
+    entries = []
+    for i, ts in enumerate(_timestamps(item_count, now, spacing_s)):
+        title, body, author = make_post(feed_id, i, seed, long_body_rate)
+        question = 78000000 + i * 7
+        entries.append(
+            f'<entry><id>https://stackoverflow.com/q/{question}</id>'
+            f'<re:rank scheme="https://stackoverflow.com">{i % 5}</re:rank>'
+            f'<title type="text">{escape(title)}</title>'
+            f'<category scheme="https://stackoverflow.com/tags" term="bench-{feed_id}"/>'
+            f'<author><name>{author}</name><uri>https://stackoverflow.com/users/{question % 99991}</uri></author>'
+            f'<link rel="alternate" href="https://stackoverflow.com/questions/{question}/bench-{i}"/>'
+            f'<published>{_iso(ts)}</published><updated>{_iso(ts)}</updated>'
+            f'<summary type="html">{escape(body)}</summary></entry>'
+        )
+    return (f'<?xml version="1.0" encoding="utf-8"?>'
+            f'<feed xmlns="http://www.w3.org/2005/Atom" xmlns:creativeCommons='
+            f'"http://backend.userland.com/creativeCommonsRssModule" xmlns:re="http://purl.org/atompub/rank/1.0">'
+            f'<title type="text">Newest questions tagged bench-{feed_id} - Stack Overflow</title>'
+            f'<link rel="self" href="https://stackoverflow.com/feeds/tag/bench-{feed_id}" type="application/atom+xml"/>'
+            f'<updated>{_iso(now)}</updated><id>https://stackoverflow.com/feeds/tag/bench-{feed_id}</id>'
+            f'{"".join(entries)}</feed>')
+
+
+RENDERERS = {
+    'reddit': render_reddit,
+    'hackernews': render_hackernews,
+    'stackexchange': render_stackexchange,
+}
+
+
+def flavor_for(feed_id):
+    """Flavor assigned to a feed ID (round-robin over numeric IDs)"""
+    digits = ''.join(ch for ch in str(feed_id) if ch.isdigit())
+    return FLAVORS[int(digits or 0) % len(FLAVORS)]
+
+
+def render_feed(feed_id, item_count=25, seed=0, flavor=None, now=None, long_body_rate=0.0):
+    """Feed document for feed_id in its assigned (or the given) flavor"""
+    return RENDERERS[flavor or flavor_for(feed_id)](feed_id, item_count, seed, now, long_body_rate=long_body_rate)
+
+
+def generate_corpus(feed_count, item_count, seed=0, long_body_rate=0.0):
+    """List of (feed_id, flavor, xml) tuples"""
+    now = time.time()
+    return [(str(i), flavor_for(i), render_feed(str(i), item_count, seed, now=now, long_body_rate=long_body_rate))
+            for i in range(feed_count)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate a synthetic RSS/Atom corpus')
+    parser.add_argument('--out', required=True, help='Output directory')
+    parser.add_argument('--feeds', type=int, default=30, help='Number of feeds (default: 30)')
+    parser.add_argument('--items', type=int, default=25, help='Items per feed (default: 25)')
+    parser.add_argument('--long-body-rate', type=float, default=0.0,
+                        help='Share of long posts that name the product late in the body')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    os.makedirs(args.out, exist_ok=True)
+    total = 0
+    for feed_id, flavor, xml in generate_corpus(args.feeds, args.items, args.seed, args.long_body_rate):
+        path = os.path.join(args.out, f'{flavor}-{feed_id}.xml')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(xml)
+        total += len(xml.encode('utf-8'))
+    print(f'Wrote {args.feeds} feeds ({total / 1024:.0f} KB) to {args.out}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,121 @@
+"""
+Synthetic project/source/insight datasets for the pipeline benchmark
+Documents follow the tables in convex/schema.ts; cross references use local
+keys ("p0", "s3", ...) that the Node harness resolves to database IDs.
+
+    python -m benchmarks.datasets --projects 5 --sources 40 --history-days 30 --out dataset.json
+"""
+import argparse
+import json
+import random
+import time
+
+from benchmarks.corpus import PRODUCTS, flavor_for, make_post
+from benchmarks.mock_gemini import THEMES
+
+DAY_S = 24 * 60 * 60
+
+# Corpus flavor -> sources.type
+SOURCE_TYPES = {'reddit': 'reddit', 'hackernews': 'hackernews', 'stackexchange': 'stackexchange'}
+
+
+def generate_dataset(project_count=5, source_count=40, history_days=30, insights_per_day=20, seed=0):
+    """Projects, sources and historic feed items/insights as a JSON-able dict"""
+    rng = random.Random(seed)
+    now_ms = int(time.time() * 1000)
+
+    projects = []
+    for p in range(project_count):
+        product, *competitors = rng.sample(PRODUCTS, 4)
+        projects.append({
+            'key': f'p{p}',
+            'doc': {
+                'name': f'{product} monitor {p}',
+                'description': f'Feedback about {product}',
+                'keywords': [product, f'{product} app', 'project management'],
+                'competitors': competitors,
+                'fetchInterval': 15,
+                'fetchStatus': 'idle',
+                'createdAt': now_ms - (history_days + 1) * DAY_S * 1000,
+            },
+        })
+
+    sources = []
+    for s in range(source_count):
+        project = projects[s % project_count]
+        feed_id = str(s)
+        flavor = flavor_for(feed_id)
+        sources.append({
+            'key': f's{s}',
+            'project': project['key'],
+            'feedId': feed_id,
+            'doc': {
+                'type': SOURCE_TYPES[flavor],
+                'name': f'{flavor} feed {feed_id}',
+                'active': True,
+            },
+        })
+
+    history = []
+    for project in projects:
+        project_sources = [s for s in sources if s['project'] == project['key']]
+        if not project_sources:
+            continue
+        tracked = project['doc']['keywords'][:1] + project['doc']['competitors']
+        for day in range(history_days):
+            for n in range(insights_per_day):
+                source = rng.choice(project_sources)
+                analyzed_at = now_ms - day * DAY_S * 1000 - rng.randint(0, DAY_S * 1000 - 1)
+                title, body, author = make_post(source['feedId'], f'h{day}-{n}', seed)
+                url = f'https://example.com/{source["feedId"]}/h{day}-{n}'
+                score = round(rng.uniform(-1, 1), 2)
+                history.append({
+                    'project': project['key'],
+                    'source': source['key'],
+                    'feedItem': {
+                        'externalId': f'hist-{project["key"]}-{day}-{n}',
+                        'title': title,
+                        'content': body,
+                        'url': url,
+                        'author': author,
+                        'publishedAt': analyzed_at - rng.randint(60, 3600) * 1000,
+                        'fetchedAt': analyzed_at - rng.randint(1, 600) * 1000,
+                        'analyzed': True,
+                    },
+                    'insight': {
+                        'sentimentScore': score,
+                        'sentimentLabel': 'positive' if score > 0.2 else 'negative' if score < -0.2 else 'neutral',
+                        'relevanceScore': round(rng.uniform(0.3, 1.0), 2),
+                        'entities': rng.sample(tracked, rng.randint(0, 2)),
+                        'themes': rng.sample(THEMES, rng.randint(1, 3)),
+                        'summary': 'Synthetic historic insight.',
+                        'actionability': rng.choice(['high', 'medium', 'low']),
+                        'analyzedAt': analyzed_at,
+                        'feedItemTitle': title,
+                        'feedItemUrl': url,
+                        'feedItemPublishedAt': analyzed_at - 60 * 1000,
+                    },
+                })
+
+    return {'projects': projects, 'sources': sources, 'history': history}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate a synthetic ProductPulse dataset')
+    parser.add_argument('--projects', type=int, default=5)
+    parser.add_argument('--sources', type=int, default=40)
+    parser.add_argument('--history-days', type=int, default=30)
+    parser.add_argument('--insights-per-day', type=int, default=20, help='Per project (default: 20)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--out', required=True)
+    args = parser.parse_args()
+
+    dataset = generate_dataset(args.projects, args.sources, args.history_days, args.insights_per_day, args.seed)
+    with open(args.out, 'w', encoding='utf-8') as f:
+        json.dump(dataset, f)
+    print(f'{len(dataset["projects"])} projects, {len(dataset["sources"])} sources, '
+          f'{len(dataset["history"])} historic insights -> {args.out}')
+
+
+if __name__ == '__main__':
+    main()
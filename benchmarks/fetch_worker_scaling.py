@@ -0,0 +1,201 @@
+"""
+Multi-process fetch worker scaling test against the stub feed server
+Replays the shard lease protocol from convex/feeds/leases.ts on a local SQLite
+store and measures sources fetched per second for increasing worker counts.
+
+    python -m benchmarks.fetch_worker_scaling --workers 1 2 4 8
+    python -m benchmarks.fetch_worker_scaling --workers 4 --kill-one
+"""
+import argparse
+import bisect
+import multiprocessing
+import os
+import sqlite3
+import tempfile
+import time
+import urllib.request
+
+from benchmarks.stub_feed_server import StubFeedServer
+
+# Partitioning (keep in sync with convex/feeds/sharding.ts)
+SHARD_COUNT = 64
+REDDIT_SHARD = 0
+VIRTUAL_NODES_PER_SHARD = 32
+
+
+def hash_string(value):
+    """32-bit FNV-1a hash"""
+    h = 0x811c9dc5
+    for ch in value:
+        h ^= ord(ch)
+        h = (h * 0x01000193) & 0xffffffff
+    return h
+
+
+def build_ring(shard_count=SHARD_COUNT):
+    ring = sorted(
+        (hash_string(f'shard-{shard}-{node}'), shard)
+        for shard in range(1, shard_count)
+        for node in range(VIRTUAL_NODES_PER_SHARD)
+    )
+    return [p for p, _ in ring], [s for _, s in ring]
+
+
+RING_POSITIONS, RING_SHARDS = build_ring()
+
+
+def shard_for_source(source_id, feed_url):
+    if 'reddit.com' in feed_url:
+        return REDDIT_SHARD
+    idx = bisect.bisect_left(RING_POSITIONS, hash_string(source_id))
+    return RING_SHARDS[idx % len(RING_SHARDS)]
+
+
+def shard_claim_order(worker_id):
+    start = hash_string(worker_id) % SHARD_COUNT
+    return [(start + i) % SHARD_COUNT for i in range(SHARD_COUNT)]
+
+
+class LeaseStore:
+    """SQLite version of the fetchLeases table and its mutations"""
+
+    def __init__(self, path, ttl_s):
+        self.db = sqlite3.connect(path, timeout=30, isolation_level=None)
+        self.ttl_s = ttl_s
+
+    def setup(self):
+        self.db.execute('CREATE TABLE IF NOT EXISTS leases (shard INTEGER PRIMARY KEY, worker TEXT, '
+                        'expires REAL, completed REAL, stop INTEGER)')
+        self.db.execute('CREATE TABLE IF NOT EXISTS fetched (source TEXT, worker TEXT, at REAL)')
+
+    def claim(self, worker_id, cycle_started):
+        """(shard, None), or (None, earliest expiry of a live lease on an unfinished shard or None)"""
+        now = time.time()
+        retry_at = None
+        self.db.execute('BEGIN IMMEDIATE')
+        try:
+            for shard in shard_claim_order(worker_id):
+                row = self.db.execute('SELECT worker, expires, completed FROM leases WHERE shard = ?',
+                                      (shard,)).fetchone()
+                if row is None:
+                    self.db.execute('INSERT INTO leases VALUES (?, ?, ?, 0, 0)',
+                                    (shard, worker_id, now + self.ttl_s))
+                    return shard, None
+                worker, expires, completed = row
+                if completed >= cycle_started:
+                    continue
+                if worker is not None and expires > now:
+                    retry_at = expires if retry_at is None else min(retry_at, expires)
+                    continue
+                self.db.execute('UPDATE leases SET worker = ?, expires = ?, stop = 0 WHERE shard = ?',
+                                (worker_id, now + self.ttl_s, shard))
+                return shard, None
+            return None, retry_at
+        finally:
+            self.db.execute('COMMIT')
+
+    def heartbeat(self, shard, worker_id):
+        cur = self.db.execute('UPDATE leases SET expires = ? WHERE shard = ? AND worker = ?',
+                              (time.time() + self.ttl_s, shard, worker_id))
+        if cur.rowcount == 0:
+            return False, True
+        (stop,) = self.db.execute('SELECT stop FROM leases WHERE shard = ?', (shard,)).fetchone()
+        return True, bool(stop)
+
+    def release(self, shard, worker_id, completed):
+        self.db.execute('UPDATE leases SET worker = NULL, expires = 0, '
+                        'completed = CASE WHEN ? THEN ? ELSE completed END '
+                        'WHERE shard = ? AND worker = ?',
+                        (completed, time.time(), shard, worker_id))
+
+    def was_fetched(self, source_id):
+        """Stands in for nextDueAt: sources fetched this cycle are no longer due"""
+        return self.db.execute('SELECT 1 FROM fetched WHERE source = ?', (source_id,)).fetchone() is not None
+
+    def record(self, source_id, worker_id):
+        self.db.execute('INSERT INTO fetched VALUES (?, ?, ?)', (source_id, worker_id, time.time()))
+
+
+def run_worker(worker_id, db_path, ttl_s, cycle_started, sources, base_url):
+    """Worker process: claim shards, fetch their sources, heartbeat between fetches"""
+    store = LeaseStore(db_path, ttl_s)
+    by_shard = {}
+    for source_id in sources:
+        by_shard.setdefault(shard_for_source(source_id, base_url), []).append(source_id)
+
+    while True:
+        shard, retry_at = store.claim(worker_id, cycle_started)
+        if shard is None:
+            if retry_at is None:
+                return
+            # Unfinished shards are leased: wait for a dead holder's lease to expire
+            time.sleep(min(max(retry_at - time.time(), 0) + 0.01, ttl_s))
+            continue
+        completed = True
+        for source_id in by_shard.get(shard, []):
+            held, stop = store.heartbeat(shard, worker_id)
+            if not held or stop:
+                completed = stop
+                break
+            if store.was_fetched(source_id):
+                continue
+            with urllib.request.urlopen(f'{base_url}/feed/{source_id}.xml') as response:
+                response.read()
+            store.record(source_id, worker_id)
+        store.release(shard, worker_id, completed)
+
+
+def run_cycle(worker_count, sources, base_url, ttl_s, kill_one=False):
+    """Run one fetch cycle with worker_count processes; returns (seconds, fetched, duplicates)"""
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'leases.db')
+        LeaseStore(db_path, ttl_s).setup()
+        cycle_started = time.time()
+
+        procs = [
+            multiprocessing.Process(
+                target=run_worker,
+                args=(f'worker-{cycle_started}-{i}', db_path, ttl_s, cycle_started, sources, base_url),
+            )
+            for i in range(worker_count)
+        ]
+        start = time.perf_counter()
+        for p in procs:
+            p.start()
+        if kill_one:
+            # Simulate a crashed worker; its lease expires and is reassigned
+            time.sleep(0.3)
+            procs[0].kill()
+        for p in procs:
+            p.join()
+        elapsed = time.perf_counter() - start
+
+        store = LeaseStore(db_path, ttl_s)
+        fetched = store.db.execute('SELECT COUNT(DISTINCT source) FROM fetched').fetchone()[0]
+        total = store.db.execute('SELECT COUNT(*) FROM fetched').fetchone()[0]
+        return elapsed, fetched, total - fetched
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Fetch worker scaling test with shard leases')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8])
+    parser.add_argument('--sources', type=int, default=240, help='Sources to fetch per cycle (default: 240)')
+    parser.add_argument('--latency-ms', type=int, default=25, help='Stub server latency (default: 25)')
+    parser.add_argument('--ttl', type=float, default=1.0, help='Lease TTL in seconds (default: 1.0)')
+    parser.add_argument('--kill-one', action='store_true', help='Kill one worker mid-cycle')
+    args = parser.parse_args()
+
+    sources = [f'src{i:05d}' for i in range(args.sources)]
+
+    with StubFeedServer(latency_ms=args.latency_ms) as server:
+        print(f'{"Workers":>7} {"Seconds":>8} {"Fetched":>8} {"Dupes":>6} {"Per sec":>8} {"Speedup":>8}')
+        baseline = None
+        for count in args.workers:
+            elapsed, fetched, dupes = run_cycle(count, sources, server.url, args.ttl, args.kill_one)
+            rate = fetched / elapsed
+            baseline = baseline or rate
+            print(f'{count:>7} {elapsed:>8.2f} {fetched:>8} {dupes:>6} {rate:>8.1f} {rate / baseline:>7.2f}x')
+
+
+if __name__ == '__main__':
+    main()
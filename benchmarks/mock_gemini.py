@@ -0,0 +1,239 @@
+"""
+Mock Gemini generateContent endpoint with configurable latency and 429 behaviour
+Answers with deterministic analysis JSON (shape expected by convex/analysis/gemini.ts)
+and usageMetadata token counts, so the analysis pipeline can be benchmarked offline.
+Supports context caches (POST /v1beta/cachedContents); latency grows with the
+uncached prompt size (--ms-per-1k-tokens), cached tokens cost a quarter of that.
+Cache storage is counted in token-hours (TTL, or until deleted) for billing.
+
+    python -m benchmarks.mock_gemini --port 8787 --latency-ms 400 --rate-limit-rate 0.05
+"""
+import argparse
+import hashlib
+import json
+import math
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+THEMES = ['pricing', 'ux', 'performance', 'features', 'support', 'bugs', 'comparison', 'question', 'announcement']
+
+
+def estimate_tokens(text):
+    """Rough Gemini token count (about 4 characters per token)"""
+    return max(1, math.ceil(len(text) / 4))
+
+
+# Relative latency cost of a cached prompt token
+CACHED_TOKEN_COST = 0.25
+
+
+def prompt_text(request_body):
+    """Concatenated text parts of a generateContent request (system instruction first)"""
+    system = request_body.get('systemInstruction') or {}
+    parts = [part.get('text', '') for part in system.get('parts', [])]
+    for content in request_body.get('contents', []):
+        parts.extend(part.get('text', '') for part in content.get('parts', []))
+    return '\n'.join(parts)
+
+
+def analyze(prompt, relevance_rate=0.6, fenced_rate=0.2):
+    """Deterministic analysis for a prompt, seeded by its hash"""
+    digest = hashlib.sha256(prompt.encode('utf-8')).digest()
+    rng = random.Random(int.from_bytes(digest[:8], 'big'))
+
+    tracked = re.search(r'TRACKED PRODUCT/KEYWORDS: (.*)', prompt)
+    terms = [t.strip() for t in tracked.group(1).split(',')] if tracked else []
+    body = prompt.split('CONTENT TO ANALYZE:', 1)[-1].lower()
+    entities = [t for t in terms if t and t.lower() in body]
+
+    relevant = rng.random() < relevance_rate
+    score = round(rng.uniform(-1, 1), 2)
+    analysis = {
+        'relevant': relevant,
+        'relevanceScore': round(rng.uniform(0.4, 1.0) if relevant else rng.uniform(0, 0.25), 2),
+        'sentiment': {
+            'score': score,
+            'label': 'positive' if score > 0.2 else 'negative' if score < -0.2 else 'neutral',
+        },
+        'entities': entities,
+        'themes': rng.sample(THEMES, rng.randint(1, 3)),
+        'summary': 'Synthetic summary of the discussion for benchmarking.',
+        'actionability': rng.choice(['high', 'medium', 'low']),
+    }
+    text = json.dumps(analysis)
+    if rng.random() < fenced_rate:
+        text = f'```json\n{text}\n```'  # Exercise the fence stripping in analyzeItem
+    return text
+
+
+class MockGeminiServer:
+    """Threaded HTTP server on localhost; use as a context manager"""
+
+    def __init__(self, latency_ms=0, jitter_ms=0, rate_limit_rate=0.0, relevance_rate=0.6, port=0, seed=0,
+                 ms_per_1k_tokens=0.0, cache_min_tokens=0):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.rate_limit_rate = rate_limit_rate
+        self.relevance_rate = relevance_rate
+        self.ms_per_1k_tokens = ms_per_1k_tokens
+        self.cache_min_tokens = cache_min_tokens
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.caches = {}  # name -> cached system text
+        self.cache_expiry = {}  # name -> (tokens, expires at)
+        self.stats = {'requests': 0, 'rate_limited': 0, 'prompt_tokens': 0, 'cached_tokens': 0,
+                      'output_tokens': 0, 'caches_created': 0, 'cache_token_hours': 0.0}
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                request_body = json.loads(self.rfile.read(length) or b'{}')
+                if self.path.split('?')[0].endswith('/cachedContents'):
+                    self.create_cache(request_body)
+                    return
+
+                cached = ''
+                if request_body.get('cachedContent'):
+                    with server.lock:
+                        cached = server.caches.get(request_body['cachedContent'])
+                    if cached is None:
+                        self.reply(404, {'error': {'code': 404, 'message': 'CachedContent not found',
+                                                   'status': 'NOT_FOUND'}})
+                        return
+
+                prompt = '\n'.join(filter(None, [cached, prompt_text(request_body)]))
+                prompt_tokens = estimate_tokens(prompt)
+                cached_tokens = estimate_tokens(cached) if cached else 0
+                billed = prompt_tokens - cached_tokens + cached_tokens * CACHED_TOKEN_COST
+
+                with server.lock:
+                    server.stats['requests'] += 1
+                    rate_limited = server.random.random() < server.rate_limit_rate
+                    delay = (server.latency_ms + server.random.uniform(0, server.jitter_ms)
+                             + server.ms_per_1k_tokens * billed / 1000)
+                if delay:
+                    time.sleep(delay / 1000)
+
+                if rate_limited:
+                    with server.lock:
+                        server.stats['rate_limited'] += 1
+                    self.reply(429, {'error': {
+                        'code': 429,
+                        'message': 'Resource has been exhausted (e.g. check quota).',
+                        'status': 'RESOURCE_EXHAUSTED',
+                    }})
+                    return
+
+                text = analyze(prompt, server.relevance_rate)
+                usage = {
+                    'promptTokenCount': prompt_tokens,
+                    'candidatesTokenCount': estimate_tokens(text),
+                }
+                if cached_tokens:
+                    usage['cachedContentTokenCount'] = cached_tokens
+                usage['totalTokenCount'] = usage['promptTokenCount'] + usage['candidatesTokenCount']
+                with server.lock:
+                    server.stats['prompt_tokens'] += prompt_tokens
+                    server.stats['cached_tokens'] += cached_tokens
+                    server.stats['output_tokens'] += usage['candidatesTokenCount']
+                self.reply(200, {
+                    'candidates': [{
+                        'content': {'parts': [{'text': text}], 'role': 'model'},
+                        'finishReason': 'STOP',
+                    }],
+                    'usageMetadata': usage,
+                })
+
+            def create_cache(self, request_body):
+                text = prompt_text(request_body)
+                tokens = estimate_tokens(text)
+                if tokens < server.cache_min_tokens:
+                    self.reply(400, {'error': {
+                        'code': 400,
+                        'message': f'Cached content is too small. total_token_count={tokens}, '
+                                   f'min_total_token_count={server.cache_min_tokens}',
+                        'status': 'INVALID_ARGUMENT',
+                    }})
+                    return
+                ttl = float(str(request_body.get('ttl', '3600s')).rstrip('s'))
+                with server.lock:
+                    server.stats['caches_created'] += 1
+                    name = f'cachedContents/bench{server.stats["caches_created"]}'
+                    server.caches[name] = text
+                    server.cache_expiry[name] = (tokens, time.time() + ttl)
+                    # Billed for the whole TTL unless deleted early (see do_DELETE)
+                    server.stats['cache_token_hours'] += tokens * ttl / 3600
+                expire = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(time.time() + ttl))
+                self.reply(200, {
+                    'name': name,
+                    'model': request_body.get('model'),
+                    'expireTime': expire,
+                    'usageMetadata': {'totalTokenCount': tokens},
+                })
+
+            def do_DELETE(self):
+                name = self.path.split('?')[0].removeprefix('/v1beta/')
+                with server.lock:
+                    server.caches.pop(name, None)
+                    tokens, expires = server.cache_expiry.pop(name, (0, 0))
+                    server.stats['cache_token_hours'] -= tokens * max(0, expires - time.time()) / 3600
+                self.reply(200, {})
+
+            def reply(self, status, payload):
+                body = json.dumps(payload).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                try:
+                    self.wfile.write(body)
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', port), Handler)
+        self.httpd.daemon_threads = True
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def url(self):
+        return f'http://127.0.0.1:{self.httpd.server_address[1]}'
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Mock Gemini generateContent endpoint')
+    parser.add_argument('--port', type=int, default=8787)
+    parser.add_argument('--latency-ms', type=int, default=400)
+    parser.add_argument('--jitter-ms', type=int, default=200)
+    parser.add_argument('--rate-limit-rate', type=float, default=0.0, help='Share of requests answered with 429')
+    parser.add_argument('--relevance-rate', type=float, default=0.6)
+    parser.add_argument('--ms-per-1k-tokens', type=float, default=0.0, help='Extra latency per 1k uncached prompt tokens')
+    parser.add_argument('--cache-min-tokens', type=int, default=0, help='Reject smaller context caches (API: 1024)')
+    args = parser.parse_args()
+
+    with MockGeminiServer(args.latency_ms, args.jitter_ms, args.rate_limit_rate, args.relevance_rate,
+                          args.port, ms_per_1k_tokens=args.ms_per_1k_tokens,
+                          cache_min_tokens=args.cache_min_tokens) as server:
+        print(f'Mock Gemini listening on {server.url} (Ctrl+C to stop)')
+        try:
+            server.thread.join()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == '__main__':
+    main()
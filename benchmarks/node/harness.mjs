@@ -0,0 +1,232 @@
+// End-to-end pipeline benchmark over the real Convex functions
+// Driven by benchmarks/pipeline.py; reads a JSON config, writes JSON results.
+//
+//   node --experimental-transform-types --no-warnings --import ./benchmarks/node/register.mjs \
+//     benchmarks/node/harness.mjs config.json
+
+import { existsSync, readFileSync, readdirSync, writeFileSync } from "node:fs";
+import path from "node:path";
+import { pathToFileURL } from "node:url";
+import { ConvexRuntime } from "./runtime.mjs";
+import { api, internal } from "./shims.mjs";
+
+const config = JSON.parse(readFileSync(process.argv[2], "utf-8"));
+const log = (...args) => process.stderr.write(args.join(" ") + "\n");
+
+// Convex functions under test (config.convexDir points at another checkout for before/after runs)
+const convexDir = config.convexDir ?? path.resolve(import.meta.dirname, "../../convex");
+
+// Pipeline logging is noise at benchmark volume
+console.log = console.warn = console.error = () => {};
+
+process.env.GEMINI_API_KEY ??= "bench";
+process.env.TRACE_SAMPLE_RATE = "1";
+
+// Send Gemini calls to the mock endpoint
+const realFetch = globalThis.fetch;
+globalThis.fetch = (url, init) => {
+  const target = String(url);
+  if (target.startsWith("https://generativelanguage.googleapis.com")) {
+    return realFetch(target.replace("https://generativelanguage.googleapis.com", config.geminiUrl), init);
+  }
+  return realFetch(url, init);
+};
+
+function percentile(sorted, p) {
+  if (sorted.length === 0) return 0;
+  return sorted[Math.max(1, Math.ceil((p / 100) * sorted.length)) - 1];
+}
+
+function summarize(durations, errors, seconds, extra = {}) {
+  const sorted = [...durations].sort((a, b) => a - b);
+  const round = (n) => Math.round(n * 1000) / 1000;
+  return {
+    count: sorted.length,
+    errors,
+    seconds: round(seconds),
+    throughputPerSec: seconds > 0 ? round(sorted.length / seconds) : 0,
+    meanMs: round(sorted.reduce((sum, d) => sum + d, 0) / (sorted.length || 1)),
+    p50Ms: round(percentile(sorted, 50)),
+    p95Ms: round(percentile(sorted, 95)),
+    p99Ms: round(percentile(sorted, 99)),
+    maxMs: round(sorted[sorted.length - 1] ?? 0),
+    ...extra,
+  };
+}
+
+// Run fn over inputs with bounded concurrency, timing each call
+async function timed(inputs, concurrency, fn) {
+  const durations = [];
+  const results = [];
+  let errors = 0;
+  let next = 0;
+  const started = performance.now();
+  const worker = async () => {
+    while (next < inputs.length) {
+      const input = inputs[next++];
+      const callStarted = performance.now();
+      try {
+        const result = await fn(input);
+        results.push(result);
+        if (result && result.success === false) errors++;
+      } catch (error) {
+        errors++;
+      }
+      durations.push(performance.now() - callStarted);
+    }
+  };
+  await Promise.all(Array.from({ length: Math.max(1, concurrency) }, worker));
+  return { durations, errors, results, seconds: (performance.now() - started) / 1000 };
+}
+
+const stages = {};
+
+// --- parseFeed (pure CPU) ---
+const { parseFeed } = await import(pathToFileURL(path.join(convexDir, "feeds/parser.ts")).href);
+const corpus = readdirSync(config.corpusDir)
+  .filter((name) => name.endsWith(".xml"))
+  .map((name) => ({ flavor: name.split("-")[0], xml: readFileSync(path.join(config.corpusDir, name), "utf-8") }));
+
+for (const flavor of [...new Set(corpus.map((doc) => doc.flavor))].sort()) {
+  const docs = corpus.filter((doc) => doc.flavor === flavor);
+  const durations = [];
+  let items = 0;
+  let bytes = 0;
+  const started = performance.now();
+  for (let round = 0; round < config.parseRounds; round++) {
+    for (const doc of docs) {
+      const callStarted = performance.now();
+      items += parseFeed(doc.xml).items.length;
+      durations.push(performance.now() - callStarted);
+      bytes += doc.xml.length;
+    }
+  }
+  const seconds = (performance.now() - started) / 1000;
+  stages[`parse_feed.${flavor}`] = summarize(durations, 0, seconds, {
+    itemsPerSec: Math.round(items / seconds),
+    mbPerSec: Math.round((bytes / 1e6 / seconds) * 100) / 100,
+  });
+}
+log(`parse_feed: ${corpus.length} documents x ${config.parseRounds} rounds`);
+
+// --- Seed the database ---
+const runtime = await ConvexRuntime.create(convexDir);
+const { db } = runtime;
+const dataset = JSON.parse(readFileSync(config.dataset, "utf-8"));
+const ids = new Map();
+
+for (const project of dataset.projects) {
+  ids.set(project.key, await db.insert("projects", project.doc));
+}
+for (const source of dataset.sources) {
+  ids.set(source.key, await db.insert("sources", {
+    ...source.doc,
+    projectId: ids.get(source.project),
+    feedUrl: `${config.feedBaseUrl}/feed/${source.feedId}.xml`,
+  }));
+}
+for (const entry of dataset.history) {
+  const sourceId = ids.get(entry.source);
+  const feedItemId = await db.insert("feedItems", { ...entry.feedItem, sourceId });
+  await db.insert("insights", { ...entry.insight, feedItemId, sourceId, projectId: ids.get(entry.project) });
+}
+log(`seeded ${dataset.projects.length} projects, ${dataset.sources.length} sources, ${dataset.history.length} insights`);
+
+// Seeded history uses the legacy string arrays; move it to term IDs like a deployment would
+if (existsSync(path.join(convexDir, "vocabulary/migrate.ts"))) {
+  const migrated = await runtime.run(internal.vocabulary.migrate.migrateInsights, {});
+  log(`vocabulary: migrated ${migrated.updated} insights to term IDs`);
+}
+
+// --- fetchSource: cold (new items) then warm (conditional requests / dedup) ---
+const sourceIds = dataset.sources.map((source) => ids.get(source.key));
+for (const pass of ["cold", "warm"]) {
+  const before = db.count("feedItems");
+  const run = await timed(sourceIds, config.concurrency, (sourceId) =>
+    runtime.run(internal.feeds.fetch.fetchSource, { sourceId })
+  );
+  stages[`fetch_source.${pass}`] = summarize(run.durations, run.errors, run.seconds, {
+    itemsAdded: db.count("feedItems") - before,
+  });
+  log(`fetch_source.${pass}: ${run.durations.length} sources, ${run.errors} errors`);
+}
+
+// Share of tracked terms present in an item's full body that came back as
+// entities (the mock reports the terms it saw, so lost terms = truncated context)
+async function termRecall(feedItemIds) {
+  let present = 0;
+  let found = 0;
+  for (const feedItemId of feedItemIds) {
+    const insight = await runtime.run(api.insights.getByFeedItem, { feedItemId });
+    if (!insight) continue;
+    const item = await db.get(feedItemId);
+    const project = await db.get(insight.projectId);
+    const content = item.content.toLowerCase();
+    const entities = new Set(insight.entities.map((entity) => entity.toLowerCase()));
+    for (const term of [...project.keywords, ...(project.competitors ?? [])]) {
+      if (!content.includes(term.toLowerCase())) continue;
+      present++;
+      if (entities.has(term.toLowerCase())) found++;
+    }
+  }
+  return present > 0 ? Math.round((found / present) * 1000) / 1000 : null;
+}
+
+// --- analyzeItem against the mock Gemini endpoint ---
+const pending = await runtime.run(internal.feeds.queries.getUnanalyzedItems, { limit: config.analyzeLimit });
+const insightsBefore = db.count("insights");
+const analysis = await timed(pending.map((item) => item._id), config.concurrency, (feedItemId) =>
+  runtime.run(internal.analysis.gemini.analyzeItem, { feedItemId })
+);
+stages["analyze_item"] = summarize(analysis.durations, analysis.errors, analysis.seconds, {
+  insightsCreated: db.count("insights") - insightsBefore,
+  skippedIrrelevant: analysis.results.filter((r) => r?.skipped).length,
+  termRecall: await termRecall(pending.map((item) => item._id)),
+});
+log(`analyze_item: ${pending.length} items, ${analysis.errors} errors`);
+
+// --- Pipeline stages as seen by the tracer (convex/tracing.ts) ---
+const spans = await db.query("traceSpans").collect();
+const byStage = new Map();
+for (const span of spans) {
+  const entry = byStage.get(span.stage) ?? { durations: [], errors: 0 };
+  entry.durations.push(span.durationMs);
+  if (!span.ok) entry.errors++;
+  byStage.set(span.stage, entry);
+}
+for (const [stage, { durations, errors }] of byStage) {
+  stages[`trace.${stage}`] = summarize(durations, errors, 0);
+}
+
+// --- insights.ts queries ---
+const projectIds = dataset.projects.map((project) => ids.get(project.key));
+const queries = {
+  listByProject: (projectId) => ({ projectId, limit: 50 }),
+  getStats: (projectId) => ({ projectId, daysBack: 30 }),
+  getSentimentTrend: (projectId) => ({ projectId, daysBack: 30 }),
+  getVolumeTrend: (projectId) => ({ projectId, daysBack: 30 }),
+  getHighActionability: (projectId) => ({ projectId, limit: 10 }),
+  getCompetitorMentions: (projectId) => ({ projectId, daysBack: 30 }),
+  getThemeTrends: (projectId) => ({ projectId, daysBack: 30 }),
+  getSourceStats: (projectId) => ({ projectId, daysBack: 30 }),
+};
+for (const [name, buildArgs] of Object.entries(queries)) {
+  const inputs = Array.from({ length: config.queryRounds }, () => projectIds).flat();
+  const run = await timed(inputs, 1, (projectId) => runtime.run(api.insights[name], buildArgs(projectId)));
+  stages[`insights.${name}`] = summarize(run.durations, run.errors, run.seconds);
+}
+const dashboard = await timed(Array.from({ length: config.queryRounds }), 1, () =>
+  runtime.run(api.insights.getDashboardStats, {})
+);
+stages["insights.getDashboardStats"] = summarize(dashboard.durations, dashboard.errors, dashboard.seconds);
+log(`insights: ${Object.keys(queries).length + 1} queries x ${config.queryRounds} rounds`);
+
+writeFileSync(config.output, JSON.stringify({
+  node: process.version,
+  rows: {
+    feedItems: db.count("feedItems"),
+    insights: db.count("insights"),
+    traceSpans: db.count("traceSpans"),
+  },
+  stages,
+}, null, 2));
@@ -0,0 +1,35 @@
+// Module hooks that let Node run the Convex functions in convex/ directly
+// - convex/*, @convex-dev/auth/* and convex/_generated/* resolve to shims.mjs
+// - extensionless relative imports resolve to .ts files
+// - .ts files load through Node's built-in type transform (--experimental-transform-types)
+
+import { existsSync } from "node:fs";
+import { fileURLToPath } from "node:url";
+
+const SHIM_URL = new URL("./shims.mjs", import.meta.url).href;
+
+const SHIMMED = [/^convex\//, /^@convex-dev\/auth\//, /\/_generated\/(server|api|dataModel)(\.js)?$/];
+
+export async function resolve(specifier, context, nextResolve) {
+  if (SHIMMED.some((pattern) => pattern.test(specifier))) {
+    return { url: SHIM_URL, shortCircuit: true };
+  }
+
+  if (specifier.startsWith(".") && context.parentURL?.endsWith(".ts") && !/\.[cm]?[jt]s$/.test(specifier)) {
+    for (const candidate of [`${specifier}.ts`, `${specifier}/index.ts`]) {
+      const url = new URL(candidate, context.parentURL);
+      if (existsSync(fileURLToPath(url))) {
+        return { url: url.href, shortCircuit: true };
+      }
+    }
+  }
+
+  return nextResolve(specifier, context);
+}
+
+export async function load(url, context, nextLoad) {
+  if (url.endsWith(".ts")) {
+    return nextLoad(url, { ...context, format: "module-typescript" });
+  }
+  return nextLoad(url, context);
+}
@@ -0,0 +1,4 @@
+// Preloaded with --import to install the Convex module hooks
+import { register } from "node:module";
+
+register("./hooks.mjs", import.meta.url);
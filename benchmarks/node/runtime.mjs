@@ -0,0 +1,272 @@
+// In-memory Convex runtime for benchmarking the functions in convex/
+// Implements the subset of ctx.db / ctx.run* used by the pipeline. Indexes are
+// hash-bucketed on their first field, so absolute timings are only comparable
+// between runs of this harness, not with a Convex deployment.
+
+import { pathToFileURL } from "node:url";
+import path from "node:path";
+
+const CONVEX_DIR = path.resolve(path.dirname(new URL(import.meta.url).pathname), "../../convex");
+
+function compare(a, b) {
+  if (a === b) return 0;
+  if (a === undefined) return -1;
+  if (b === undefined) return 1;
+  return a < b ? -1 : 1;
+}
+
+class IndexRange {
+  constructor() {
+    this.conditions = [];
+  }
+  eq(field, value) {
+    this.conditions.push([field, "eq", value]);
+    return this;
+  }
+  gt(field, value) {
+    this.conditions.push([field, "gt", value]);
+    return this;
+  }
+  gte(field, value) {
+    this.conditions.push([field, "gte", value]);
+    return this;
+  }
+  lt(field, value) {
+    this.conditions.push([field, "lt", value]);
+    return this;
+  }
+  lte(field, value) {
+    this.conditions.push([field, "lte", value]);
+    return this;
+  }
+  matches(doc) {
+    return this.conditions.every(([field, op, value]) => {
+      const c = compare(doc[field], value);
+      return op === "eq" ? c === 0 : op === "gt" ? c > 0 : op === "gte" ? c >= 0 : op === "lt" ? c < 0 : c <= 0;
+    });
+  }
+}
+
+class Query {
+  constructor(db, table) {
+    this.db = db;
+    this.table = table;
+    this.indexFields = [];
+    this.range = null;
+    this.direction = "asc";
+  }
+  withIndex(name, build) {
+    this.indexName = name;
+    this.indexFields = this.db.indexes[this.table]?.[name] ?? [];
+    if (build) this.range = build(new IndexRange());
+    return this;
+  }
+  order(direction) {
+    this.direction = direction;
+    return this;
+  }
+  results() {
+    const docs = this.db.candidates(this.table, this.indexName, this.range);
+    const matching = this.range ? docs.filter((doc) => this.range.matches(doc)) : docs;
+    const keys = [...this.indexFields, "_creationTime"];
+    matching.sort((a, b) => {
+      for (const key of keys) {
+        const c = compare(a[key], b[key]);
+        if (c !== 0) return c;
+      }
+      return 0;
+    });
+    if (this.direction === "desc") matching.reverse();
+    return matching.map((doc) => ({ ...doc }));
+  }
+  async collect() {
+    return this.results();
+  }
+  async take(n) {
+    return this.results().slice(0, n);
+  }
+  async first() {
+    return this.results()[0] ?? null;
+  }
+  // Cursor is an offset into the ordered results (enough for scans that don't reorder rows)
+  async paginate({ numItems, cursor }) {
+    const results = this.results();
+    const start = cursor ? Number(cursor) : 0;
+    const end = start + numItems;
+    return { page: results.slice(start, end), isDone: end >= results.length, continueCursor: String(end) };
+  }
+  async unique() {
+    const results = this.results();
+    if (results.length > 1) throw new Error(`unique() matched ${results.length} documents in ${this.table}`);
+    return results[0] ?? null;
+  }
+}
+
+export class MemoryDb {
+  constructor(schema) {
+    this.indexes = Object.fromEntries(
+      Object.entries(schema.tables).map(([table, def]) => [table, def.indexes])
+    );
+    this.tables = new Map();
+    this.buckets = new Map(); // "table:index" -> Map(first field value -> Set(id))
+    this.nextId = 0;
+    this.lastCreationTime = 0;
+  }
+
+  docs(table) {
+    let docs = this.tables.get(table);
+    if (!docs) {
+      docs = new Map();
+      this.tables.set(table, docs);
+    }
+    return docs;
+  }
+
+  bucketFor(table, index) {
+    const key = `${table}:${index}`;
+    let bucket = this.buckets.get(key);
+    if (!bucket) {
+      bucket = new Map();
+      this.buckets.set(key, bucket);
+    }
+    return bucket;
+  }
+
+  indexDoc(table, doc, add) {
+    for (const [index, fields] of Object.entries(this.indexes[table] ?? {})) {
+      const bucket = this.bucketFor(table, index);
+      const value = doc[fields[0]];
+      let ids = bucket.get(value);
+      if (add) {
+        if (!ids) bucket.set(value, (ids = new Set()));
+        ids.add(doc._id);
+      } else {
+        ids?.delete(doc._id);
+      }
+    }
+  }
+
+  // Documents that can match a range: one hash bucket when the first index field is pinned
+  candidates(table, index, range) {
+    const docs = this.docs(table);
+    const fields = index ? this.indexes[table]?.[index] : undefined;
+    const pinned = range?.conditions.find(([field, op]) => op === "eq" && field === fields?.[0]);
+    if (!pinned) return [...docs.values()];
+    const ids = this.bucketFor(table, index).get(pinned[2]) ?? new Set();
+    return [...ids].map((id) => docs.get(id));
+  }
+
+  async insert(table, fields) {
+    const _id = `${table}|${++this.nextId}`;
+    // Strictly increasing like Convex, so index order ties break by insertion
+    const _creationTime = Math.max(Date.now(), this.lastCreationTime + 0.001);
+    this.lastCreationTime = _creationTime;
+    const doc = { ...fields, _id, _creationTime };
+    this.docs(table).set(_id, doc);
+    this.indexDoc(table, doc, true);
+    return _id;
+  }
+
+  async get(id) {
+    const doc = this.docs(id.split("|")[0]).get(id);
+    return doc ? { ...doc } : null;
+  }
+
+  async patch(id, fields) {
+    const table = id.split("|")[0];
+    const doc = this.docs(table).get(id);
+    if (!doc) throw new Error(`patch on missing document ${id}`);
+    this.indexDoc(table, doc, false);
+    // Rebuilt rather than `delete`d from, which would leave V8 dictionary-mode objects
+    // and slow down every later read of the document
+    const patched = {};
+    for (const [key, value] of Object.entries({ ...doc, ...fields })) {
+      if (value !== undefined) patched[key] = value;
+    }
+    this.docs(table).set(id, patched);
+    this.indexDoc(table, patched, true);
+  }
+
+  async replace(id, fields) {
+    const table = id.split("|")[0];
+    const doc = this.docs(table).get(id);
+    if (!doc) throw new Error(`replace on missing document ${id}`);
+    this.indexDoc(table, doc, false);
+    const replaced = { ...fields, _id: doc._id, _creationTime: doc._creationTime };
+    this.docs(table).set(id, replaced);
+    this.indexDoc(table, replaced, true);
+  }
+
+  async delete(id) {
+    const table = id.split("|")[0];
+    const doc = this.docs(table).get(id);
+    if (doc) {
+      this.indexDoc(table, doc, false);
+      this.docs(table).delete(id);
+    }
+  }
+
+  query(table) {
+    return new Query(this, table);
+  }
+
+  count(table) {
+    return this.docs(table).size;
+  }
+}
+
+export class ConvexRuntime {
+  constructor(db, convexDir) {
+    this.db = db;
+    this.convexDir = convexDir;
+    this.modules = new Map();
+    this.scheduled = [];
+    // Mutations run one at a time, like Convex's serializable transactions
+    this.mutationTail = Promise.resolve();
+  }
+
+  // convexDir: functions to load (defaults to this checkout's convex/)
+  static async create(convexDir = CONVEX_DIR) {
+    const schema = await import(pathToFileURL(path.join(convexDir, "schema.ts")).href);
+    return new ConvexRuntime(new MemoryDb(schema.default), convexDir);
+  }
+
+  async resolve(reference) {
+    const segments = reference.path;
+    const modulePath = segments.slice(0, -1).join("/");
+    let module = this.modules.get(modulePath);
+    if (!module) {
+      module = await import(pathToFileURL(path.join(this.convexDir, `${modulePath}.ts`)).href);
+      this.modules.set(modulePath, module);
+    }
+    const fn = module[segments[segments.length - 1]];
+    if (!fn?.handler) throw new Error(`Unknown Convex function ${segments.join(".")}`);
+    return fn;
+  }
+
+  context(kind) {
+    const auth = { getUserIdentity: async () => null };
+    const scheduler = {
+      runAfter: async (delayMs, reference, args) => void this.scheduled.push({ delayMs, reference, args }),
+      runAt: async (at, reference, args) => void this.scheduled.push({ at, reference, args }),
+    };
+    if (kind === "query") return { db: this.db, auth };
+    if (kind === "mutation") return { db: this.db, auth, scheduler };
+    return {
+      auth,
+      scheduler,
+      runQuery: (reference, args) => this.run(reference, args),
+      runMutation: (reference, args) => this.run(reference, args),
+      runAction: (reference, args) => this.run(reference, args),
+    };
+  }
+
+  // Call a function by reference (internal.x.y or api.x.y) with a fresh ctx
+  async run(reference, args = {}) {
+    const fn = await this.resolve(reference);
+    if (fn.kind !== "mutation") return fn.handler(this.context(fn.kind), args);
+    const result = this.mutationTail.then(() => fn.handler(this.context(fn.kind), args));
+    this.mutationTail = result.catch(() => {});
+    return result;
+  }
+}
@@ -0,0 +1,64 @@
+// Minimal stand-ins for the convex, @convex-dev/auth and convex/_generated modules
+// Registered functions keep their handler so the runtime can call them directly;
+// validators are not enforced.
+
+// Validators (v.string(), v.union(...), ...) - accepted and ignored
+export const v = new Proxy({}, { get: (_, kind) => (...args) => ({ kind, args }) });
+
+// Function definitions
+const define = (kind) => (definition) => ({
+  kind,
+  handler: typeof definition === "function" ? definition : definition.handler,
+});
+export const query = define("query");
+export const internalQuery = define("query");
+export const mutation = define("mutation");
+export const internalMutation = define("mutation");
+export const action = define("action");
+export const internalAction = define("action");
+export const httpAction = define("httpAction");
+
+// Function references: internal.feeds.queries.getSource -> { path: ["feeds", "queries", "getSource"] }
+const reference = (path) =>
+  new Proxy({ path }, {
+    get: (target, key) => (key in target || typeof key === "symbol" ? target[key] : reference([...path, key])),
+  });
+export const internal = reference([]);
+export const api = reference([]);
+export const components = reference([]);
+
+// Schema: tables keep their index definitions for the in-memory database
+export function defineTable(fields) {
+  const table = {
+    fields,
+    indexes: {},
+    index(name, indexFields) {
+      table.indexes[name] = indexFields;
+      return table;
+    },
+    searchIndex() {
+      return table;
+    },
+    vectorIndex() {
+      return table;
+    },
+  };
+  return table;
+}
+export const defineSchema = (tables) => ({ tables });
+export const paginationOptsValidator = v.object({});
+
+// Modules the pipeline functions never use at runtime
+export const authTables = {};
+export const convexAuth = () => ({ auth: {}, signIn: {}, signOut: {}, store: {}, isAuthenticated: {} });
+export const Password = {};
+export const cronJobs = () => new Proxy({}, { get: () => () => undefined });
+export const httpRouter = () => ({ route() {} });
+
+// Type-only exports imported without `import type`
+export const Id = undefined;
+export const Doc = undefined;
+export const DataModel = undefined;
+export const ActionCtx = undefined;
+export const QueryCtx = undefined;
+export const MutationCtx = undefined;
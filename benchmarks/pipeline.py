@@ -0,0 +1,253 @@
+"""
+End-to-end ingest -> analyze benchmark
+Generates a corpus and dataset, starts the stub feed server and mock Gemini
+endpoint, runs the real Convex functions (parseFeed, fetchSource, analyzeItem,
+insights.ts queries) under Node on an in-memory database, and reports
+throughput and latency per stage.
+
+Needs Node 22.7+ (built-in TypeScript transform); set NODE to pick a binary.
+
+    python -m benchmarks.pipeline --out results.json
+    python -m benchmarks.pipeline --compare baseline.json --threshold 0.2
+    python -m benchmarks.pipeline --diff old.json new.json
+"""
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.corpus import generate_corpus, render_feed
+from benchmarks.datasets import generate_dataset
+from benchmarks.mock_gemini import MockGeminiServer
+from benchmarks.stub_feed_server import StubFeedServer
+
+HARNESS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'node')
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MIN_NODE = (22, 7)
+
+# Gemini 3 Flash (preview) list prices in USD per 1M tokens; cache storage per 1M tokens per hour
+PRICE_INPUT = 0.50
+PRICE_CACHED_INPUT = 0.05
+PRICE_OUTPUT = 3.00
+PRICE_CACHE_STORAGE = 1.00
+
+
+def billed_usd(stats):
+    """Gemini bill for a run: uncached, cached and output tokens plus cache storage"""
+    uncached = stats['prompt_tokens'] - stats['cached_tokens']
+    return (uncached * PRICE_INPUT + stats['cached_tokens'] * PRICE_CACHED_INPUT
+            + stats['output_tokens'] * PRICE_OUTPUT + stats['cache_token_hours'] * PRICE_CACHE_STORAGE) / 1e6
+
+
+def find_node():
+    """Path of a Node binary with --experimental-transform-types"""
+    node = os.environ.get('NODE', 'node')
+    try:
+        version = subprocess.run([node, '--version'], capture_output=True, text=True, check=True).stdout
+    except (OSError, subprocess.CalledProcessError):
+        sys.exit(f'Node not found ({node}); set NODE to a Node {MIN_NODE[0]}.{MIN_NODE[1]}+ binary')
+    major, minor = (int(n) for n in re.match(r'v(\d+)\.(\d+)', version).groups())
+    if (major, minor) < MIN_NODE:
+        sys.exit(f'Node {version.strip()} is too old; the harness needs {MIN_NODE[0]}.{MIN_NODE[1]}+ '
+                 f'(set NODE to a newer binary)')
+    return node
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmark(args):
+    node = find_node()
+    with tempfile.TemporaryDirectory() as tmp:
+        corpus_dir = os.path.join(tmp, 'corpus')
+        os.makedirs(corpus_dir)
+        for feed_id, flavor, xml in generate_corpus(args.parse_feeds, args.items, args.seed, args.long_body_rate):
+            with open(os.path.join(corpus_dir, f'{flavor}-{feed_id}.xml'), 'w', encoding='utf-8') as f:
+                f.write(xml)
+
+        dataset = generate_dataset(args.projects, args.sources, args.history_days, args.insights_per_day, args.seed)
+        dataset_path = os.path.join(tmp, 'dataset.json')
+        with open(dataset_path, 'w', encoding='utf-8') as f:
+            json.dump(dataset, f)
+
+        # Render each feed once so ETags stay stable between the cold and warm passes
+        now = time.time()
+        feeds = {}
+
+        def render(feed_id):
+            if feed_id not in feeds:
+                feeds[feed_id] = render_feed(feed_id, args.items, args.seed, now=now,
+                                             long_body_rate=args.long_body_rate)
+            return feeds[feed_id]
+
+        with StubFeedServer(args.feed_latency_ms, render=render, rate_limit_rate=args.feed_429_rate,
+                            etags=not args.no_etags, seed=args.seed) as feed_server, \
+                MockGeminiServer(args.gemini_latency_ms, args.gemini_jitter_ms, args.gemini_429_rate,
+                                 seed=args.seed, ms_per_1k_tokens=args.gemini_ms_per_1k_tokens,
+                                 cache_min_tokens=args.gemini_cache_min_tokens) as gemini:
+            config_path = os.path.join(tmp, 'config.json')
+            output_path = os.path.join(tmp, 'output.json')
+            with open(config_path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'corpusDir': corpus_dir,
+                    'dataset': dataset_path,
+                    'feedBaseUrl': feed_server.url,
+                    'geminiUrl': gemini.url,
+                    'concurrency': args.concurrency,
+                    'analyzeLimit': args.analyze_limit,
+                    'parseRounds': args.parse_rounds,
+                    'queryRounds': args.query_rounds,
+                    'output': output_path,
+                    **({'convexDir': os.path.abspath(args.convex_dir)} if args.convex_dir else {}),
+                }, f)
+
+            subprocess.run(
+                [node, '--experimental-transform-types', '--no-warnings',
+                 '--import', os.path.join(HARNESS_DIR, 'register.mjs'),
+                 os.path.join(HARNESS_DIR, 'harness.mjs'), config_path],
+                cwd=REPO_ROOT, check=True,
+            )
+            with open(output_path, 'r', encoding='utf-8') as f:
+                output = json.load(f)
+
+            stats = gemini.stats
+            analyzed = max(1, stats['requests'] - stats['rate_limited'])
+
+            return {
+                'meta': {
+                    'createdAt': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+                    'commit': git_commit(),
+                    'node': output['node'],
+                    'config': {k: v for k, v in vars(args).items() if k not in ('out', 'compare', 'diff')},
+                    'rows': output['rows'],
+                    'feedServer': feed_server.counts,
+                    'gemini': stats,
+                    'tokensPerItem': {
+                        'prompt': round(stats['prompt_tokens'] / analyzed, 1),
+                        'uncached': round((stats['prompt_tokens'] - stats['cached_tokens']) / analyzed, 1),
+                        'output': round(stats['output_tokens'] / analyzed, 1),
+                    },
+                    'billedUsdPer1kItems': round(billed_usd(stats) / analyzed * 1000, 4),
+                },
+                'stages': output['stages'],
+            }
+
+
+def print_stages(results):
+    print(f'{"Stage":<34} {"Count":>6} {"Err":>4} {"Per sec":>9} {"p50 ms":>9} {"p95 ms":>9} {"p99 ms":>9}')
+    for name, s in results['stages'].items():
+        rate = f'{s["throughputPerSec"]:.1f}' if s['throughputPerSec'] else '-'
+        print(f'{name:<34} {s["count"]:>6} {s["errors"]:>4} {rate:>9} '
+              f'{s["p50Ms"]:>9.2f} {s["p95Ms"]:>9.2f} {s["p99Ms"]:>9.2f}')
+
+
+def compare_results(baseline, current, threshold):
+    """Print per-stage changes; returns stages whose p95 or throughput regressed past threshold"""
+    regressions = []
+    old_config = baseline['meta'].get('config', {})
+    new_config = current['meta'].get('config', {})
+    differing = sorted(k for k in old_config.keys() | new_config.keys()
+                       if k not in ('threshold', 'seed') and old_config.get(k) != new_config.get(k))
+    if differing:
+        print(f'Note: runs used different settings ({", ".join(differing)}); changes may not be regressions\n')
+    print(f'{"Stage":<34} {"p50":>16} {"p95":>16} {"Per sec":>16}')
+
+    def change(old, new):
+        return (new - old) / old if old else 0.0
+
+    for name, new in current['stages'].items():
+        old = baseline['stages'].get(name)
+        if old is None:
+            print(f'{name:<34} (new stage)')
+            continue
+        p50 = change(old['p50Ms'], new['p50Ms'])
+        p95 = change(old['p95Ms'], new['p95Ms'])
+        rate = change(old['throughputPerSec'], new['throughputPerSec'])
+        regressed = p95 > threshold or (old['throughputPerSec'] and rate < -threshold)
+        if regressed:
+            regressions.append(name)
+        print(f'{name:<34} {new["p50Ms"]:>8.2f} {p50:>+7.0%} {new["p95Ms"]:>8.2f} {p95:>+7.0%} '
+              f'{new["throughputPerSec"]:>8.1f} {rate:>+7.0%}{"  REGRESSION" if regressed else ""}')
+    for name in baseline['stages'].keys() - current['stages'].keys():
+        print(f'{name:<34} (missing from current run)')
+    return regressions
+
+
+def load_results(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description='End-to-end ingest -> analyze pipeline benchmark')
+    parser.add_argument('--projects', type=int, default=5)
+    parser.add_argument('--sources', type=int, default=40)
+    parser.add_argument('--history-days', type=int, default=30)
+    parser.add_argument('--insights-per-day', type=int, default=20, help='Historic insights per project per day')
+    parser.add_argument('--items', type=int, default=25, help='Items per feed (default: 25)')
+    parser.add_argument('--parse-feeds', type=int, default=30, help='Corpus documents for parse_feed (default: 30)')
+    parser.add_argument('--parse-rounds', type=int, default=20)
+    parser.add_argument('--query-rounds', type=int, default=10)
+    parser.add_argument('--analyze-limit', type=int, default=200, help='Feed items to analyze (default: 200)')
+    parser.add_argument('--concurrency', type=int, default=8, help='Concurrent actions (default: 8)')
+    parser.add_argument('--long-body-rate', type=float, default=0.0,
+                        help='Share of long posts that name the product late in the body')
+    parser.add_argument('--feed-latency-ms', type=int, default=20)
+    parser.add_argument('--feed-429-rate', type=float, default=0.0,
+                        help='Share of feed requests answered with 429 (each costs a 5-8s retry wait)')
+    parser.add_argument('--no-etags', action='store_true', help='Stub server omits ETag (warm pass re-downloads)')
+    parser.add_argument('--gemini-latency-ms', type=int, default=150)
+    parser.add_argument('--gemini-jitter-ms', type=int, default=100)
+    parser.add_argument('--gemini-429-rate', type=float, default=0.0)
+    parser.add_argument('--gemini-ms-per-1k-tokens', type=float, default=0.0,
+                        help='Mock latency per 1k uncached prompt tokens')
+    parser.add_argument('--gemini-cache-min-tokens', type=int, default=1024,
+                        help='Mock rejects smaller context caches (default: the API minimum)')
+    parser.add_argument('--convex-dir', help='Benchmark the functions in another checkout\'s convex/ directory')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--out', help='Write results JSON (e.g. a new baseline)')
+    parser.add_argument('--compare', metavar='BASELINE', help='Diff this run against a saved results file')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='Relative p95/throughput change counted as a regression (default: 0.2)')
+    parser.add_argument('--diff', nargs=2, metavar=('OLD', 'NEW'), help='Only diff two saved results files')
+    return parser
+
+
+def main():
+    args = build_parser().parse_args()
+
+    if args.diff:
+        regressions = compare_results(load_results(args.diff[0]), load_results(args.diff[1]), args.threshold)
+        sys.exit(1 if regressions else 0)
+
+    results = run_benchmark(args)
+    print_stages(results)
+    meta = results['meta']
+    print(f'\nfeed server {meta["feedServer"]}  gemini {meta["gemini"]}')
+    print(f'tokens per analyzed item {meta["tokensPerItem"]}')
+    print(f'billed USD per 1k items {meta["billedUsdPer1kItems"]}')
+
+    if args.out:
+        with open(args.out, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f'Results written to {args.out}')
+
+    if args.compare:
+        print()
+        regressions = compare_results(load_results(args.compare), results, args.threshold)
+        if regressions:
+            print(f'\n{len(regressions)} stage(s) regressed more than {args.threshold:.0%}: {", ".join(regressions)}')
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
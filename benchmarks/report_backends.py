@@ -0,0 +1,100 @@
+"""
+Report backend benchmark: one document tree rendered to DOCX and HTML vs the htmldocx path
+The tree path builds the report once and renders both outputs from memory; the
+htmldocx path (convert_html_to_docx.py) renders HTML and re-parses it into a
+DOCX. Also counts the colored runs and shaded cells/paragraphs in each DOCX,
+as a measure of styling that survives.
+
+    python -m benchmarks.report_backends --repeat 5 --scale 4
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import time
+import zipfile
+
+from create_docx import render_docx
+from report_content import assignment_report
+from report_html import render_html
+
+try:
+    from htmldocx import HtmlToDocx
+except ImportError:  # Optional: only the tree path is timed without it
+    HtmlToDocx = None
+
+
+def scaled_report(scale):
+    """The assignment report with its body repeated `scale` times"""
+    report = assignment_report()
+    report.blocks = report.blocks * scale
+    return report
+
+
+def tree_path(scale, out_dir):
+    """Build the tree once, render DOCX and HTML from it"""
+    report = scaled_report(scale)
+    docx_path = os.path.join(out_dir, 'tree.docx')
+    render_docx(report).save(docx_path)
+    with open(os.path.join(out_dir, 'tree.html'), 'w', encoding='utf-8') as f:
+        f.write(render_html(report))
+    return docx_path
+
+
+def htmldocx_path(scale, out_dir):
+    """Render HTML, then convert it to DOCX with htmldocx"""
+    from docx import Document
+
+    html_text = render_html(scaled_report(scale))
+    with open(os.path.join(out_dir, 'htmldocx.html'), 'w', encoding='utf-8') as f:
+        f.write(html_text)
+    doc = Document()
+    HtmlToDocx().add_html_to_document(html_text, doc)
+    docx_path = os.path.join(out_dir, 'htmldocx.docx')
+    doc.save(docx_path)
+    return docx_path
+
+
+def styling(docx_path):
+    """(colored runs, shaded cells/paragraphs) in a DOCX"""
+    with zipfile.ZipFile(docx_path) as z:
+        xml = z.read('word/document.xml').decode('utf-8')
+    return xml.count('<w:color '), xml.count('<w:shd ')
+
+
+def timed(fn, scale, out_dir, repeat):
+    """(median seconds, last output path)"""
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        path = fn(scale, out_dir)
+        times.append(time.perf_counter() - started)
+    return statistics.median(times), path
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the document tree backends against htmldocx')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--scale', type=int, default=1, help='Repeat the report body this many times')
+    args = parser.parse_args()
+
+    paths = [('tree -> docx + html', tree_path)]
+    if HtmlToDocx is not None:
+        paths.append(('html -> htmldocx', htmldocx_path))
+    else:
+        print('htmldocx not installed: timing the tree path only (pip install htmldocx)')
+
+    with tempfile.TemporaryDirectory() as tmp:
+        results = []
+        for name, fn in paths:
+            seconds, docx_path = timed(fn, args.scale, tmp, args.repeat)
+            results.append((name, seconds, os.path.getsize(docx_path) / 1024, *styling(docx_path)))
+
+    print(f'\nReport x{args.scale}, median of {args.repeat}')
+    print(f'  {"path":<22} {"time":>8} {"docx":>8} {"colors":>7} {"shading":>8}')
+    for name, seconds, size_kb, colors, shading in results:
+        print(f'  {name:<22} {seconds:>7.3f}s {size_kb:>6.0f}KB {colors:>7} {shading:>8}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,212 @@
+"""
+Report builder benchmark over synthetic reports of increasing size
+Builds reports with more participant cards, tables and lists per size, then
+times render_docx + save and render_html (median of --repeat runs) and
+measures the tracemalloc peak of one render_docx into an already loaded
+Document (Python allocations only; lxml's C trees are not traced). Compares
+against the stored baseline and exits 1 when a size regresses past
+--threshold and by more than MIN_CHANGE_MS / MIN_CHANGE_KB.
+
+Timings are machine-specific: refresh the baseline on the machine that checks it.
+
+    python -m benchmarks.report_builders
+    python -m benchmarks.report_builders --out benchmarks/baselines/report_builders.json
+    python -m benchmarks.report_builders --profile profiles/large --sizes large
+"""
+import argparse
+import gc
+import io
+import json
+import os
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+from docx import Document
+
+import create_docx
+from report_content import FEATURES, PARTICIPANTS
+from report_html import render_html
+from report_model import (
+    Heading, HighlightBox, ItemList, PageBreak, Paragraph, ParticipantCard, Quote, Report, Run, Table, runs,
+)
+from report_profile import Profiler
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baselines', 'report_builders.json')
+
+# Smaller changes are noise whatever their relative size (htmlMs is well under 1 ms)
+MIN_CHANGE_MS = 5.0
+MIN_CHANGE_KB = 64.0
+
+# Participant cards and table rows per size
+SIZES = {
+    'small': (4, 20),
+    'medium': (16, 80),
+    'large': (64, 320),
+}
+
+
+def synthetic_report(participants, rows, seed=0):
+    """Report shaped like the assignment: sections of cards, styled tables, lists and quotes"""
+    rng = random.Random(seed)
+    report = Report(f'Synthetic report ({participants} participants)')
+    report.add(Heading(report.title, 0))
+
+    report.add(PageBreak(), Heading('Participants', 1))
+    for i in range(participants):
+        card = PARTICIPANTS[i % len(PARTICIPANTS)]
+        report.add(ParticipantCard(**{**vars(card), 'name': f'{card.name} #{i + 1}'}))
+
+    report.add(PageBreak(), Heading('Results', 1))
+    report.add(Table(
+        ['Task', 'Success Rate', 'Avg. Time', 'Notes'],
+        [[f'{n + 1}. Task', Run(f'{rng.randint(40, 100)}%', bold=True, color=rng.choice(['green', 'orange_rate'])),
+          f'{rng.randint(0, 3)}:{rng.randint(0, 59):02d}', rng.choice(PARTICIPANTS).tasks[n % 7][3]]
+         for n in range(rows)],
+    ))
+    report.add(HighlightBox([runs(Run('Participants: ', bold=True), str(participants))]))
+    report.add(*(Quote(card.quote, card.name) for card in PARTICIPANTS))
+
+    report.add(PageBreak(), Heading('Features', 1))
+    for n in range(max(1, rows // 20)):
+        title, items = FEATURES[n % len(FEATURES)]
+        report.add(Heading(title, 3), ItemList([runs(item) for item in items]))
+        report.add(Paragraph(runs(Run('Summary: ', bold=True), ' '.join(items[:2]))))
+    return report
+
+
+def build_docx(report):
+    """render_docx + save to memory; returns DOCX size in bytes"""
+    out = io.BytesIO()
+    create_docx.render_docx(report).save(out)
+    return out.tell()
+
+
+def run_size(participants, rows, repeat):
+    report = synthetic_report(participants, rows)
+    docx_times, html_times = [], []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        size = build_docx(report)
+        docx_times.append(time.perf_counter() - started)
+        started = time.perf_counter()
+        render_html(report)
+        html_times.append(time.perf_counter() - started)
+
+    # Peak of the render alone: loading the Document template is the same at every size.
+    # Collect the timing runs' garbage first so a collection mid-render doesn't skew it.
+    gc.collect()
+    tracemalloc.start()
+    try:
+        doc = Document()
+        base = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        create_docx.render_docx(report, doc=doc)
+        peak = tracemalloc.get_traced_memory()[1] - base
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'blocks': len(report.blocks),
+        'docxMs': round(statistics.median(docx_times) * 1000, 2),
+        'htmlMs': round(statistics.median(html_times) * 1000, 2),
+        'peakKb': round(peak / 1024, 1),
+        'docxKb': round(size / 1024, 1),
+    }
+
+
+def profile_size(participants, rows, prefix):
+    """Write a helper/section profile of one DOCX build (see report_profile.py)"""
+    report = synthetic_report(participants, rows)
+    profiler = Profiler().start()
+    try:
+        with profiler.instrument(vars(create_docx), create_docx.PROFILED_HELPERS):
+            with profiler.section('render docx'):
+                doc = create_docx.render_docx(report, profiler)
+            with profiler.section('save docx'):
+                doc.save(io.BytesIO())
+    finally:
+        profiler.stop()
+    print(profiler.summary())
+    print('Profile saved: {} and {}'.format(*profiler.write(prefix)))
+
+
+def compare_results(baseline, current, threshold):
+    """Print per-size changes; returns sizes whose time or memory peak regressed past threshold and the floor"""
+    regressions = []
+    print(f'{"Size":<8} {"docx ms":>16} {"html ms":>16} {"peak KB":>18}')
+
+    def change(old, new):
+        return (new - old) / old if old else 0.0
+
+    for name, new in current['sizes'].items():
+        old = baseline['sizes'].get(name)
+        if old is None:
+            print(f'{name:<8} (new size)')
+            continue
+        if old['blocks'] != new['blocks']:
+            print(f'{name:<8} (report shape changed: {old["blocks"]} -> {new["blocks"]} blocks)')
+        docx, html_ms, peak = (change(old[k], new[k]) for k in ('docxMs', 'htmlMs', 'peakKb'))
+        regressed = any(
+            rel > threshold and new[k] - old[k] > floor
+            for rel, k, floor in ((docx, 'docxMs', MIN_CHANGE_MS), (html_ms, 'htmlMs', MIN_CHANGE_MS),
+                                  (peak, 'peakKb', MIN_CHANGE_KB))
+        )
+        if regressed:
+            regressions.append(name)
+        print(f'{name:<8} {new["docxMs"]:>8.1f} {docx:>+7.0%} {new["htmlMs"]:>8.1f} {html_ms:>+7.0%} '
+              f'{new["peakKb"]:>10.0f} {peak:>+7.0%}{"  REGRESSION" if regressed else ""}')
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the report builders on synthetic reports')
+    parser.add_argument('--sizes', nargs='*', choices=list(SIZES), default=list(SIZES))
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--compare', metavar='BASELINE', default=BASELINE,
+                        help='Results file to check against (default: the stored baseline)')
+    parser.add_argument('--no-compare', action='store_true', help='Only print this run')
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='Relative time/memory increase counted as a regression (default: 0.25)')
+    parser.add_argument('--out', help='Write results JSON (e.g. a new baseline)')
+    parser.add_argument('--profile', metavar='PREFIX', help='Also profile the largest size to PREFIX.json/.folded')
+    args = parser.parse_args()
+
+    results = {
+        'meta': {
+            'createdAt': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+            'python': sys.version.split()[0],
+            'repeat': args.repeat,
+        },
+        'sizes': {},
+    }
+    print(f'{"Size":<8} {"blocks":>7} {"docx ms":>9} {"html ms":>9} {"peak KB":>9} {"docx KB":>9}')
+    for name in args.sizes:
+        r = results['sizes'][name] = run_size(*SIZES[name], args.repeat)
+        print(f'{name:<8} {r["blocks"]:>7} {r["docxMs"]:>9.1f} {r["htmlMs"]:>9.1f} {r["peakKb"]:>9.0f} {r["docxKb"]:>9.0f}')
+
+    if args.profile:
+        print()
+        profile_size(*SIZES[args.sizes[-1]], args.profile)
+
+    if args.out:
+        os.makedirs(os.path.dirname(os.path.abspath(args.out)), exist_ok=True)
+        with open(args.out, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f'Results written to {args.out}')
+    elif not args.no_compare:
+        if not os.path.exists(args.compare):
+            sys.exit(f'No baseline at {args.compare}; create one with --out {args.compare}')
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        print()
+        regressions = compare_results(baseline, results, args.threshold)
+        if regressions:
+            print(f'\n{len(regressions)} size(s) regressed more than {args.threshold:.0%}: {", ".join(regressions)}')
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+"""
+Report build benchmark for the Appendix B analytics charts
+Writes synthetic insight CSV exports (same columns as the dashboard export),
+then times create_docx builds with an empty chart cache, with every chart
+cached, and after one project's data changed.
+
+    python -m benchmarks.report_charts --projects 10 --days 60
+"""
+import argparse
+import csv
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+import create_docx
+from benchmarks.corpus import PRODUCTS, TOPICS
+from benchmarks.mock_gemini import THEMES
+from report_charts import project_name
+
+CSV_HEADERS = [
+    'Title', 'URL', 'Published At', 'Analyzed At', 'Sentiment Score', 'Sentiment Label',
+    'Actionability', 'Summary', 'Themes', 'Entities',
+]
+
+
+def write_insight_csv(path, days, per_day, seed=0):
+    """Synthetic insight export covering the last `days` days; returns the competitors used"""
+    rng = random.Random(seed)
+    product, *competitors = rng.sample(PRODUCTS, 4)
+    now = datetime.now(timezone.utc).replace(hour=12, minute=0, second=0, microsecond=0)
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f, lineterminator='\n')
+        writer.writerow(CSV_HEADERS)
+        for day in range(days):
+            stamp = (now - timedelta(days=days - day)).strftime('%Y-%m-%dT%H:%M:%S.000Z')
+            for i in range(max(0, int(rng.gauss(per_day, per_day / 3)))):
+                score = max(-1.0, min(1.0, rng.gauss(0.1, 0.5)))
+                label = 'positive' if score > 0.2 else 'negative' if score < -0.2 else 'neutral'
+                entities = [product] + rng.sample(competitors, rng.randint(0, 2))
+                topic = rng.choice(TOPICS)
+                writer.writerow([
+                    f'{product} {topic}', f'https://example.com/{seed}/{day}/{i}', stamp, stamp,
+                    round(score, 4), label, rng.choice(['high', 'medium', 'low']),
+                    f'Discussion of {topic} in {product}', '; '.join(rng.sample(THEMES, 2)), '; '.join(entities),
+                ])
+    return competitors
+
+
+def timed_build(csv_paths, competitors, cache_dir, out_path, workers):
+    """Seconds for charts + document"""
+    started = time.perf_counter()
+    charts = create_docx.build_charts(csv_paths, competitors, cache_dir, workers)
+    create_docx.create_assignment_doc(out_path, charts)
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark chart rendering and caching in the DOCX report')
+    parser.add_argument('--projects', type=int, default=10, help='Projects (3 charts each)')
+    parser.add_argument('--days', type=int, default=60)
+    parser.add_argument('--per-day', type=int, default=40, help='Mean insights per project per day')
+    parser.add_argument('--workers', type=int, default=None, help='Render processes (default: CPU count)')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_paths = []
+        competitors = set()
+        for p in range(args.projects):
+            path = os.path.join(tmp, f'project-{p}.csv')
+            competitors.update(write_insight_csv(path, args.days, args.per_day, seed=args.seed + p))
+            csv_paths.append(path)
+        competitors = sorted(competitors)
+
+        cache_dir = os.path.join(tmp, 'charts')
+        out_path = os.path.join(tmp, 'report.docx')
+        results = [('cold cache', timed_build(csv_paths, competitors, cache_dir, out_path, args.workers))]
+        results.append(('warm cache', timed_build(csv_paths, competitors, cache_dir, out_path, args.workers)))
+
+        # New data for one project: only its charts are re-rendered
+        write_insight_csv(csv_paths[0], args.days, args.per_day, seed=args.seed + 1000)
+        results.append((f'{project_name(csv_paths[0])} changed',
+                        timed_build(csv_paths, competitors, cache_dir, out_path, args.workers)))
+        size_kb = os.path.getsize(out_path) / 1024
+
+    print(f'\n{args.projects * 3} charts, {args.workers or os.cpu_count()} worker(s), report {size_kb:.0f} KB')
+    for name, seconds in results:
+        print(f'  {name:<22} {seconds:>7.2f}s')
+
+
+if __name__ == '__main__':
+    main()
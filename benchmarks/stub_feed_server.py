@@ -0,0 +1,99 @@
+"""
+Local stub RSS server with configurable latency
+Serves /feed/<n>.xml so fetch code can be exercised without hitting real sites.
+Optionally answers a share of requests with 429 and honours If-None-Match.
+"""
+import hashlib
+import random
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def render_rss(feed_id, item_count=10):
+    """Small RSS 2.0 document with item_count items"""
+    now = time.time()
+    items = ''.join(
+        f'<item><title>Post {i} in feed {feed_id}</title>'
+        f'<link>https://example.com/{feed_id}/{i}</link>'
+        f'<guid>{feed_id}-{i}</guid>'
+        f'<pubDate>{formatdate(now - i * 600, usegmt=True)}</pubDate>'
+        f'<description>Body of post {i}</description></item>'
+        for i in range(item_count)
+    )
+    return (f'<?xml version="1.0"?><rss version="2.0"><channel>'
+            f'<title>Feed {feed_id}</title>{items}</channel></rss>')
+
+
+class StubFeedServer:
+    """Threaded HTTP server on localhost; use as a context manager"""
+
+    def __init__(self, latency_ms=0, port=0, render=render_rss, rate_limit_rate=0.0, etags=False, seed=0):
+        self.latency_ms = latency_ms
+        self.render = render
+        self.rate_limit_rate = rate_limit_rate
+        self.etags = etags
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.counts = {'200': 0, '304': 0, '429': 0}
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if server.latency_ms:
+                    time.sleep(server.latency_ms / 1000)
+                with server.lock:
+                    rate_limited = server.random.random() < server.rate_limit_rate
+                if rate_limited:
+                    server.count('429')
+                    self.send_response(429)
+                    self.send_header('Retry-After', '5')
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+
+                feed_id = self.path.rsplit('/', 1)[-1].split('.')[0]
+                body = server.render(feed_id).encode('utf-8')
+                etag = f'"{hashlib.sha1(body).hexdigest()[:16]}"' if server.etags else None
+                if etag and self.headers.get('If-None-Match') == etag:
+                    server.count('304')
+                    self.send_response(304)
+                    self.send_header('ETag', etag)
+                    self.end_headers()
+                    return
+
+                server.count('200')
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/rss+xml')
+                self.send_header('Content-Length', str(len(body)))
+                if etag:
+                    self.send_header('ETag', etag)
+                self.end_headers()
+                try:
+                    self.wfile.write(body)
+                except (BrokenPipeError, ConnectionResetError):
+                    pass  # Client went away (e.g. a killed worker)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', port), Handler)
+        self.httpd.daemon_threads = True
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def count(self, status):
+        with self.lock:
+            self.counts[status] += 1
+
+    @property
+    def url(self):
+        return f'http://127.0.0.1:{self.httpd.server_address[1]}'
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
@@ -1,8 +1,7 @@
 "use client";
 
 import { useState } from "react";
-import { useQuery } from "convex/react";
-import { api } from "@/convex/_generated/api";
+import { useAuthToken } from "@convex-dev/auth/react";
 import { Id } from "@/convex/_generated/dataModel";
 import { Button } from "@/components/ui/button";
 import {
@@ -13,12 +12,7 @@ import {
 } from "@/components/ui/dropdown-menu";
 import { Download, FileSpreadsheet, Loader2 } from "lucide-react";
 import { useToast } from "@/hooks/use-toast";
-import {
-  insightsToCSV,
-  downloadCSV,
-  formatDateForExport,
-  InsightExport,
-} from "@/lib/export";
+import { downloadInsightsCSV } from "@/lib/export";
 
 interface ExportButtonProps {
   projectId: Id<"projects">;
@@ -29,48 +23,31 @@ export function ExportButton({ projectId, projectName }: ExportButtonProps) {
   const { toast } = useToast();
   const [isExporting, setIsExporting] = useState(false);
 
-  // Get all insights for export (no limit)
-  const insights = useQuery(api.insights.listByProject, {
-    projectId,
-  });
+  const token = useAuthToken();
 
   const handleExport = async () => {
-    if (!insights || insights.length === 0) {
-      toast({
-        title: "No data to export",
-        description: "There are no insights to export for this project.",
-        variant: "destructive",
-      });
-      return;
-    }
-
     setIsExporting(true);
 
     try {
-      // Transform insights for export
-      const exportData: InsightExport[] = insights.map((insight) => ({
-        title: insight.feedItemTitle,
-        url: insight.feedItemUrl,
-        publishedAt: formatDateForExport(insight.feedItemPublishedAt),
-        analyzedAt: formatDateForExport(insight.analyzedAt),
-        sentimentScore: insight.sentimentScore,
-        sentimentLabel: insight.sentimentLabel,
-        actionability: insight.actionability,
-        summary: insight.summary,
-        themes: insight.themes.join("; "),
-        entities: insight.entities.join("; "),
-      }));
-
-      const csv = insightsToCSV(exportData);
+      // Streamed from the server page by page (no client-side CSV building)
       const filename = `${projectName.toLowerCase().replace(/\s+/g, "-")}-insights-${
         new Date().toISOString().split("T")[0]
       }.csv`;
+      const result = await downloadInsightsCSV(projectId, token, filename);
+      if (result === "cancelled") return;
 
-      downloadCSV(csv, filename);
+      if (result === "empty") {
+        toast({
+          title: "No data to export",
+          description: "There are no insights to export for this project.",
+          variant: "destructive",
+        });
+        return;
+      }
 
       toast({
         title: "Export successful",
-        description: `Exported ${insights.length} insights to ${filename}`,
+        description: "Insights downloaded as CSV",
       });
     } catch (error) {
       toast({
@@ -1,6 +1,6 @@
 "use client";
 
-import { Doc } from "@/convex/_generated/dataModel";
+import type { LabeledInsight } from "@/convex/vocabulary/terms";
 import { Card, CardContent, CardHeader, CardTitle } from "@/components/ui/card";
 import { Badge } from "@/components/ui/badge";
 import { Button } from "@/components/ui/button";
@@ -9,7 +9,7 @@ import { ExternalLink, TrendingUp, TrendingDown, Minus } from "lucide-react";
 import { formatDistanceToNow } from "date-fns";
 
 interface InsightsFeedProps {
-  insights: Doc<"insights">[];
+  insights: LabeledInsight[];
   showProjectName?: boolean;
 }
 
@@ -149,7 +149,7 @@ export function InsightsFeedCard({
   title = "Recent Insights",
   maxHeight = "400px",
 }: {
-  insights: Doc<"insights">[];
+  insights: LabeledInsight[];
   title?: string;
   maxHeight?: string;
 }) {
@@ -1,6 +1,6 @@
 "use client";
 
-import { useState } from "react";
+import { useRef, useState } from "react";
 import { useRouter } from "next/navigation";
 import { useMutation, useAction } from "convex/react";
 import { api } from "@/convex/_generated/api";
@@ -42,6 +42,12 @@ import {
   buildSourcesFromSelections,
   SourceConfig,
 } from "./source-recommendations";
+import {
+  redditUrls,
+  hackerNewsUrls,
+  stackExchangeUrls,
+  discourseUrls,
+} from "@/lib/source-templates";
 
 // Types for AI suggestions
 interface SubredditSuggestion {
@@ -77,6 +83,62 @@ interface CompetitorSuggestion {
   category: string;
 }
 
+// Validation result for a suggested feed (see ai/suggest:validateSuggestedFeeds)
+interface FeedCheck {
+  feedUrl: string;
+  ok: boolean | null; // null: temporary failure (rate limit, timeout), treated like an unchecked feed
+  status?: number;
+  error?: string;
+  itemCount: number;
+  itemsPerDay: number;
+  newestAgeHours?: number;
+  yieldScore: number;
+}
+
+// Feed URL each suggestion turns into
+const subredditFeed = (sub: SubredditSuggestion) => redditUrls.subreddit(sub.name);
+const stackExchangeFeed = (key: string) => {
+  const [site, tag] = key.split(":");
+  return stackExchangeUrls.tag(site, tag);
+};
+const discourseFeed = (forum: DiscourseForumSuggestion) => discourseUrls.latest(forum.domain);
+
+function suggestionFeedUrls(suggestions: ProjectSuggestions): string[] {
+  return [
+    ...suggestions.subreddits.map(subredditFeed),
+    ...suggestions.hackerNewsQueries.map(hackerNewsUrls.search),
+    ...suggestions.stackExchangeTags.map(t => stackExchangeFeed(`${t.site}:${t.tag}`)),
+    ...suggestions.discourseForums.map(discourseFeed),
+  ];
+}
+
+// Order by measured yield, dead feeds last (stable for unchecked and unknown feeds)
+function rankByYield<T>(items: T[], feedUrl: (item: T) => string, checks: Record<string, FeedCheck>): T[] {
+  const rank = (item: T) => {
+    const check = checks[feedUrl(item)];
+    if (!check || check.ok === null) return 0;
+    return check.ok ? check.yieldScore : -1;
+  };
+  return [...items].sort((a, b) => rank(b) - rank(a));
+}
+
+function FeedYield({ check }: { check?: FeedCheck }) {
+  if (!check) return null;
+  if (check.ok === null) {
+    return <span className="ml-1 opacity-70" title={check.error}>not checked</span>;
+  }
+  if (!check.ok) {
+    return <span className="ml-1 text-destructive" title={check.error}>unavailable</span>;
+  }
+  const perDay = check.itemsPerDay >= 10 ? Math.round(check.itemsPerDay) : check.itemsPerDay.toFixed(1);
+  const stale = check.newestAgeHours !== undefined && check.newestAgeHours > 7 * 24;
+  return (
+    <span className="ml-1 opacity-70" title={`${check.itemCount} items on first page`}>
+      ~{perDay}/day{stale ? ", quiet" : ""}
+    </span>
+  );
+}
+
 const FETCH_INTERVALS = [
   { value: "0", label: "Manual only" },
   { value: "360", label: "Every 6 hours" },
@@ -109,6 +171,7 @@ export function ProjectForm({ mode, initialData }: ProjectFormProps) {
   const setCompetitors = useMutation(api.projects.setCompetitors);
   const suggestProjectSetup = useAction(api.ai.suggest.suggestProjectSetup);
   const suggestCompetitorsAction = useAction(api.ai.suggest.suggestCompetitors);
+  const validateSuggestedFeeds = useAction(api.ai.suggest.validateSuggestedFeeds);
 
   // Form state
   const [name, setName] = useState(initialData?.name || "");
@@ -136,6 +199,9 @@ export function ProjectForm({ mode, initialData }: ProjectFormProps) {
   const [selectedHackerNews, setSelectedHackerNews] = useState<string[]>([]);
   const [selectedDiscourse, setSelectedDiscourse] = useState<string[]>([]);
   const [isGeneratingSources, setIsGeneratingSources] = useState(false);
+  const [feedChecks, setFeedChecks] = useState<Record<string, FeedCheck>>({});
+  const [isValidatingFeeds, setIsValidatingFeeds] = useState(false);
+  const feedValidation = useRef<Promise<Record<string, FeedCheck>> | null>(null);
 
   // Fetch interval state
   const [fetchInterval, setFetchInterval] = useState<string>(
@@ -217,8 +283,9 @@ export function ProjectForm({ mode, initialData }: ProjectFormProps) {
         setSuggestedKeywords(suggested);
         setSelectedSuggestedKeywords(suggested.slice(0, 8));
         
-        // Also store full suggestions for sources later
+        // Also store full suggestions for sources later, checking their feeds meanwhile
         setSuggestions(result.suggestions as ProjectSuggestions);
+        void validateFeeds(result.suggestions as ProjectSuggestions);
         
         toast({ title: "Keywords generated!", description: `Found ${suggested.length} keyword suggestions.` });
       } else {
@@ -269,18 +336,55 @@ export function ProjectForm({ mode, initialData }: ProjectFormProps) {
     }
   };
 
+  // Validate every suggested feed; checks are keyed by feed URL. The promise is
+  // kept so later steps await the same run instead of probing again.
+  const validateFeeds = (s: ProjectSuggestions): Promise<Record<string, FeedCheck>> => {
+    setFeedChecks({});
+    setIsValidatingFeeds(true);
+    const validation: Promise<Record<string, FeedCheck>> = validateSuggestedFeeds({
+      feedUrls: suggestionFeedUrls(s),
+    })
+      .then(probes => Object.fromEntries(probes.map(p => [p.feedUrl, p as FeedCheck])))
+      // Validation is advisory; fall back to unranked suggestions
+      .catch((): Record<string, FeedCheck> => ({}))
+      .then(checks => {
+        // A newer run (regenerated suggestions) owns the state
+        if (feedValidation.current === validation) {
+          setFeedChecks(checks);
+          setIsValidatingFeeds(false);
+        }
+        return checks;
+      });
+    feedValidation.current = validation;
+    return validation;
+  };
+
+  // Preselect relevant feeds not known to be dead, highest measured yield first
+  const preselectSources = (s: ProjectSuggestions, checks: Record<string, FeedCheck>) => {
+    const live = (url: string) => checks[url]?.ok !== false;
+    setSelectedSubreddits(
+      s.subreddits
+        .filter(sub => sub.relevanceScore >= 7 && live(subredditFeed(sub)))
+        .map(sub => sub.name)
+    );
+    setSelectedHackerNews(
+      rankByYield(s.hackerNewsQueries, hackerNewsUrls.search, checks)
+        .filter(q => live(hackerNewsUrls.search(q)))
+        .slice(0, 2)
+    );
+    setSelectedStackExchange(
+      rankByYield(s.stackExchangeTags.map(t => `${t.site}:${t.tag}`), stackExchangeFeed, checks)
+        .filter(key => live(stackExchangeFeed(key)))
+        .slice(0, 2)
+    );
+  };
+
   // Generate source suggestions
   const handleGenerateSources = async () => {
     if (suggestions) {
-      // Already have suggestions from keyword generation
-      const highRelevance = suggestions.subreddits
-        .filter(s => s.relevanceScore >= 7)
-        .map(s => s.name);
-      setSelectedSubreddits(highRelevance);
-      setSelectedHackerNews(suggestions.hackerNewsQueries.slice(0, 2));
-      setSelectedStackExchange(
-        suggestions.stackExchangeTags.slice(0, 2).map(t => `${t.site}:${t.tag}`)
-      );
+      // Already have suggestions (and their feed checks, possibly still running) from keyword generation
+      const checks = await (feedValidation.current ?? validateFeeds(suggestions));
+      preselectSources(suggestions, checks);
       toast({ title: "Sources ready!", description: "Select the sources you want to add." });
       return;
     }
@@ -302,17 +406,9 @@ export function ProjectForm({ mode, initialData }: ProjectFormProps) {
       });
 
       if (result.success && result.suggestions) {
-        setSuggestions(result.suggestions as ProjectSuggestions);
-        const highRelevance = result.suggestions.subreddits
-          .filter((s: SubredditSuggestion) => s.relevanceScore >= 7)
-          .map((s: SubredditSuggestion) => s.name);
-        setSelectedSubreddits(highRelevance);
-        setSelectedHackerNews(result.suggestions.hackerNewsQueries.slice(0, 2));
-        setSelectedStackExchange(
-          result.suggestions.stackExchangeTags.slice(0, 2).map(
-            (t: StackExchangeTag) => `${t.site}:${t.tag}`
-          )
-        );
+        const generated = result.suggestions as ProjectSuggestions;
+        setSuggestions(generated);
+        preselectSources(generated, await validateFeeds(generated));
         
         toast({ title: "Sources generated!", description: "Select the sources you want to add." });
       } else {
@@ -721,7 +817,11 @@ export function ProjectForm({ mode, initialData }: ProjectFormProps) {
                     <Label className="text-sm">Reddit ({selectedSubreddits.length}/{suggestions.subreddits.length})</Label>
                   </div>
                   <div className="flex flex-wrap gap-2">
-                    {suggestions.subreddits.sort((a, b) => b.relevanceScore - a.relevanceScore).map((sub) => (
+                    {rankByYield(
+                      [...suggestions.subreddits].sort((a, b) => b.relevanceScore - a.relevanceScore),
+                      subredditFeed,
+                      feedChecks
+                    ).map((sub) => (
                       <label key={sub.name} className="flex items-center gap-1.5 cursor-pointer">
                         <Checkbox
                           checked={selectedSubreddits.includes(sub.name)}
@@ -736,6 +836,7 @@ export function ProjectForm({ mode, initialData }: ProjectFormProps) {
                         <Badge variant={selectedSubreddits.includes(sub.name) ? "default" : "outline"} className="text-xs">
                           r/{sub.name}
                           <span className="ml-1 opacity-70">{sub.relevanceScore}/10</span>
+                          <FeedYield check={feedChecks[subredditFeed(sub)]} />
                         </Badge>
                       </label>
                     ))}
@@ -751,7 +852,7 @@ export function ProjectForm({ mode, initialData }: ProjectFormProps) {
                     <Label className="text-sm">Hacker News ({selectedHackerNews.length}/{suggestions.hackerNewsQueries.length})</Label>
                   </div>
                   <div className="flex flex-wrap gap-2">
-                    {suggestions.hackerNewsQueries.map((query) => (
+                    {rankByYield(suggestions.hackerNewsQueries, hackerNewsUrls.search, feedChecks).map((query) => (
                       <label key={query} className="flex items-center gap-1.5 cursor-pointer">
                         <Checkbox
                           checked={selectedHackerNews.includes(query)}
@@ -765,6 +866,7 @@ export function ProjectForm({ mode, initialData }: ProjectFormProps) {
                         />
                         <Badge variant={selectedHackerNews.includes(query) ? "default" : "outline"} className="text-xs">
                           &quot;{query}&quot;
+                          <FeedYield check={feedChecks[hackerNewsUrls.search(query)]} />
                         </Badge>
                       </label>
                     ))}
@@ -780,7 +882,7 @@ export function ProjectForm({ mode, initialData }: ProjectFormProps) {
                     <Label className="text-sm">Stack Exchange ({selectedStackExchange.length}/{suggestions.stackExchangeTags.length})</Label>
                   </div>
                   <div className="flex flex-wrap gap-2">
-                    {suggestions.stackExchangeTags.map((tag) => {
+                    {rankByYield(suggestions.stackExchangeTags, t => stackExchangeFeed(`${t.site}:${t.tag}`), feedChecks).map((tag) => {
                       const key = `${tag.site}:${tag.tag}`;
                       return (
                         <label key={key} className="flex items-center gap-1.5 cursor-pointer">
@@ -796,6 +898,7 @@ export function ProjectForm({ mode, initialData }: ProjectFormProps) {
                           />
                           <Badge variant={selectedStackExchange.includes(key) ? "default" : "outline"} className="text-xs">
                             [{tag.tag}] {tag.site}
+                            <FeedYield check={feedChecks[stackExchangeFeed(key)]} />
                           </Badge>
                         </label>
                       );
@@ -812,7 +915,7 @@ export function ProjectForm({ mode, initialData }: ProjectFormProps) {
                     <Label className="text-sm">Discourse ({selectedDiscourse.length}/{suggestions.discourseForums.length})</Label>
                   </div>
                   <div className="flex flex-wrap gap-2">
-                    {suggestions.discourseForums.map((forum) => (
+                    {rankByYield(suggestions.discourseForums, discourseFeed, feedChecks).map((forum) => (
                       <label key={forum.domain} className="flex items-center gap-1.5 cursor-pointer">
                         <Checkbox
                           checked={selectedDiscourse.includes(forum.domain)}
@@ -826,6 +929,7 @@ export function ProjectForm({ mode, initialData }: ProjectFormProps) {
                         />
                         <Badge variant={selectedDiscourse.includes(forum.domain) ? "default" : "outline"} className="text-xs">
                           {forum.name}
+                          <FeedYield check={feedChecks[discourseFeed(forum)]} />
                         </Badge>
                       </label>
                     ))}
@@ -833,6 +937,13 @@ export function ProjectForm({ mode, initialData }: ProjectFormProps) {
                 </div>
               )}
 
+              {isValidatingFeeds && (
+                <p className="flex items-center gap-2 text-xs text-muted-foreground">
+                  <Loader2 className="h-3 w-3 animate-spin" />
+                  Checking suggested feeds...
+                </p>
+              )}
+
               {totalSelectedSources > 0 && (
                 <div className="pt-2 border-t text-sm text-muted-foreground">
                   {totalSelectedSources} source{totalSelectedSources !== 1 ? "s" : ""} selected
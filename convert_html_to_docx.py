@@ -1,5 +1,7 @@
 """
-Convert HTML to DOCX using htmldocx for better style preservation
+Legacy: convert ProductPulse_Assignment.html to DOCX with htmldocx
+Kept only as the baseline for benchmarks/report_backends.py. Generate the report
+with `python create_docx.py --html ProductPulse_Assignment.html` instead.
 """
 from htmldocx import HtmlToDocx
 from docx import Document
@@ -8,22 +8,40 @@
  * @module
  */
 
+import type * as ai_cache from "../ai/cache.js";
 import type * as ai_suggest from "../ai/suggest.js";
 import type * as alerts from "../alerts.js";
 import type * as alerts_queries from "../alerts/queries.js";
 import type * as alerts_slack from "../alerts/slack.js";
 import type * as analysis_gemini from "../analysis/gemini.js";
+import type * as analysis_prompt from "../analysis/prompt.js";
+import type * as analysis_promptCache from "../analysis/promptCache.js";
 import type * as auth from "../auth.js";
 import type * as crons from "../crons.js";
+import type * as exports_columnar from "../exports/columnar.js";
+import type * as exports_csv from "../exports/csv.js";
+import type * as exports_mutations from "../exports/mutations.js";
+import type * as exports_queries from "../exports/queries.js";
+import type * as exports_snapshot from "../exports/snapshot.js";
 import type * as feedItems from "../feedItems.js";
 import type * as feeds_fetch from "../feeds/fetch.js";
+import type * as feeds_leases from "../feeds/leases.js";
 import type * as feeds_mutations from "../feeds/mutations.js";
 import type * as feeds_parser from "../feeds/parser.js";
 import type * as feeds_queries from "../feeds/queries.js";
+import type * as feeds_scheduler from "../feeds/scheduler.js";
+import type * as feeds_sharding from "../feeds/sharding.js";
+import type * as feeds_workers from "../feeds/workers.js";
 import type * as http from "../http.js";
 import type * as insights from "../insights.js";
+import type * as metrics from "../metrics.js";
 import type * as projects from "../projects.js";
 import type * as sources from "../sources.js";
+import type * as tracing from "../tracing.js";
+import type * as vocabulary_migrate from "../vocabulary/migrate.js";
+import type * as vocabulary_mutations from "../vocabulary/mutations.js";
+import type * as vocabulary_queries from "../vocabulary/queries.js";
+import type * as vocabulary_terms from "../vocabulary/terms.js";
 
 import type {
   ApiFromModules,
@@ -32,22 +50,40 @@ import type {
 } from "convex/server";
 
 declare const fullApi: ApiFromModules<{
+  "ai/cache": typeof ai_cache;
   "ai/suggest": typeof ai_suggest;
   alerts: typeof alerts;
   "alerts/queries": typeof alerts_queries;
   "alerts/slack": typeof alerts_slack;
   "analysis/gemini": typeof analysis_gemini;
+  "analysis/prompt": typeof analysis_prompt;
+  "analysis/promptCache": typeof analysis_promptCache;
   auth: typeof auth;
   crons: typeof crons;
+  "exports/columnar": typeof exports_columnar;
+  "exports/csv": typeof exports_csv;
+  "exports/mutations": typeof exports_mutations;
+  "exports/queries": typeof exports_queries;
+  "exports/snapshot": typeof exports_snapshot;
   feedItems: typeof feedItems;
   "feeds/fetch": typeof feeds_fetch;
+  "feeds/leases": typeof feeds_leases;
   "feeds/mutations": typeof feeds_mutations;
   "feeds/parser": typeof feeds_parser;
   "feeds/queries": typeof feeds_queries;
+  "feeds/scheduler": typeof feeds_scheduler;
+  "feeds/sharding": typeof feeds_sharding;
+  "feeds/workers": typeof feeds_workers;
   http: typeof http;
   insights: typeof insights;
+  metrics: typeof metrics;
   projects: typeof projects;
   sources: typeof sources;
+  tracing: typeof tracing;
+  "vocabulary/migrate": typeof vocabulary_migrate;
+  "vocabulary/mutations": typeof vocabulary_mutations;
+  "vocabulary/queries": typeof vocabulary_queries;
+  "vocabulary/terms": typeof vocabulary_terms;
 }>;
 
 /**
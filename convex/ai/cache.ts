@@ -0,0 +1,105 @@
+import { v } from "convex/values";
+import { internalMutation, internalQuery } from "../_generated/server";
+import { feedProbeValidator } from "../schema";
+
+// Cached suggestions for a description hash, if not expired (internal)
+export const getSuggestionCache = internalQuery({
+  args: { descriptionHash: v.string() },
+  handler: async (ctx, args) => {
+    const entry = await ctx.db
+      .query("suggestionCaches")
+      .withIndex("by_hash", (q) => q.eq("descriptionHash", args.descriptionHash))
+      .first();
+    return entry && entry.expiresAt > Date.now() ? entry.suggestions : null;
+  },
+});
+
+// Store suggestions for a description hash, replacing an older entry (internal)
+export const saveSuggestionCache = internalMutation({
+  args: {
+    descriptionHash: v.string(),
+    suggestions: v.any(),
+    ttlMs: v.number(),
+  },
+  handler: async (ctx, args) => {
+    const now = Date.now();
+    const entry = {
+      descriptionHash: args.descriptionHash,
+      suggestions: args.suggestions,
+      createdAt: now,
+      expiresAt: now + args.ttlMs,
+    };
+    const existing = await ctx.db
+      .query("suggestionCaches")
+      .withIndex("by_hash", (q) => q.eq("descriptionHash", args.descriptionHash))
+      .first();
+
+    if (existing) {
+      await ctx.db.replace(existing._id, entry);
+    } else {
+      await ctx.db.insert("suggestionCaches", entry);
+    }
+  },
+});
+
+// Probes of the given feed URLs checked after `since` (internal)
+export const getFeedProbes = internalQuery({
+  args: { feedUrls: v.array(v.string()), since: v.number() },
+  handler: async (ctx, args) => {
+    const probes = [];
+    for (const feedUrl of args.feedUrls) {
+      const probe = await ctx.db
+        .query("feedProbes")
+        .withIndex("by_url", (q) => q.eq("feedUrl", feedUrl))
+        .first();
+      if (probe && probe.checkedAt >= args.since) {
+        const { _id, _creationTime, ...fields } = probe;
+        probes.push(fields);
+      }
+    }
+    return probes;
+  },
+});
+
+// Record feed probe results, one row per URL (internal)
+export const saveFeedProbes = internalMutation({
+  args: { probes: v.array(feedProbeValidator) },
+  handler: async (ctx, args) => {
+    for (const probe of args.probes) {
+      const existing = await ctx.db
+        .query("feedProbes")
+        .withIndex("by_url", (q) => q.eq("feedUrl", probe.feedUrl))
+        .first();
+
+      if (existing) {
+        await ctx.db.replace(existing._id, probe);
+      } else {
+        await ctx.db.insert("feedProbes", probe);
+      }
+    }
+  },
+});
+
+// Drop expired suggestions and stale feed probes (cron)
+export const pruneSuggestionCaches = internalMutation({
+  args: { probeMaxAgeMs: v.optional(v.number()) },
+  handler: async (ctx, args) => {
+    const now = Date.now();
+    const expired = await ctx.db
+      .query("suggestionCaches")
+      .withIndex("by_expiresAt", (q) => q.lt("expiresAt", now))
+      .take(1000);
+    for (const entry of expired) {
+      await ctx.db.delete(entry._id);
+    }
+
+    const stale = await ctx.db
+      .query("feedProbes")
+      .withIndex("by_checkedAt", (q) => q.lt("checkedAt", now - (args.probeMaxAgeMs ?? 7 * 24 * 60 * 60 * 1000)))
+      .take(1000);
+    for (const probe of stale) {
+      await ctx.db.delete(probe._id);
+    }
+    return { suggestions: expired.length, probes: stale.length };
+  },
+});
@@ -1,7 +1,120 @@
 "use node";
 
+import { createHash } from "node:crypto";
+import { lookup } from "node:dns/promises";
+import { isIP } from "node:net";
 import { v } from "convex/values";
+import { getAuthUserId } from "@convex-dev/auth/server";
 import { action } from "../_generated/server";
+import { internal } from "../_generated/api";
+import { feedProbeValidator } from "../schema";
+import { probeFeed, type FeedProbe } from "../feeds/parser";
+
+const SUGGEST_MODEL = "gemini-3-flash-preview";
+
+// Suggestions for the same product are reused for this long (override with SUGGESTION_CACHE_HOURS)
+const DEFAULT_SUGGESTION_CACHE_HOURS = 7 * 24;
+
+// Feed validation: probes younger than this are reused; at most this many feeds
+// per call, this many hosts at a time (override with FEED_PROBE_CONCURRENCY) and
+// one request at a time per host, this far apart (suggestions are mostly reddit.com)
+const PROBE_MAX_AGE_MS = 6 * 60 * 60 * 1000;
+const MAX_PROBED_FEEDS = 40;
+const DEFAULT_PROBE_CONCURRENCY = 6;
+const PROBE_HOST_INTERVAL_MS = 1000;
+
+// Cache key for a product: case, whitespace and punctuation runs don't change the suggestions
+function descriptionHash(productName: string, productDescription: string): string {
+  const normalize = (text: string) =>
+    text.normalize("NFKC").toLowerCase().replace(/[^\p{L}\p{N}]+/gu, " ").trim();
+  return createHash("sha256")
+    .update(`${SUGGEST_MODEL}\n${normalize(productName)}\n${normalize(productDescription)}`)
+    .digest("hex")
+    .slice(0, 32);
+}
+
+// Run fn over items with at most `limit` calls in flight, keeping input order
+async function mapWithConcurrency<T, R>(items: T[], limit: number, fn: (item: T) => Promise<R>): Promise<R[]> {
+  const results = new Array<R>(items.length);
+  let next = 0;
+  const worker = async () => {
+    while (next < items.length) {
+      const index = next++;
+      results[index] = await fn(items[index]);
+    }
+  };
+  await Promise.all(Array.from({ length: Math.min(limit, items.length) }, worker));
+  return results;
+}
+
+// Whether a feed URL parses as an http(s) URL (the validator fetches nothing else)
+function isHttpUrl(feedUrl: string): boolean {
+  try {
+    const { protocol } = new URL(feedUrl);
+    return protocol === "http:" || protocol === "https:";
+  } catch {
+    return false;
+  }
+}
+
+// Whether an IP address is unspecified, loopback, private, shared or link-local
+function isPrivateAddress(address: string): boolean {
+  if (isIP(address) === 6) {
+    const lower = address.toLowerCase();
+    const dotted = lower.match(/^::ffff:(\d+\.\d+\.\d+\.\d+)$/);
+    if (dotted) return isPrivateAddress(dotted[1]);
+    const hex = lower.match(/^::ffff:([0-9a-f]{1,4}):([0-9a-f]{1,4})$/);
+    if (hex) {
+      const [high, low] = [parseInt(hex[1], 16), parseInt(hex[2], 16)];
+      return isPrivateAddress(`${high >> 8}.${high & 255}.${low >> 8}.${low & 255}`);
+    }
+    return lower === "::" || lower === "::1" || /^f[cd]/.test(lower) || /^fe[89ab]/.test(lower);
+  }
+  const [a, b] = address.split(".").map(Number);
+  return (
+    a === 0 || a === 10 || a === 127 ||
+    (a === 100 && b >= 64 && b <= 127) ||
+    (a === 169 && b === 254) ||
+    (a === 172 && b >= 16 && b <= 31) ||
+    (a === 192 && b === 168)
+  );
+}
+
+// Whether a host is public: names are resolved, so one pointing at a private
+// address is rejected too (as is one that doesn't resolve)
+async function isPublicHost(hostname: string): Promise<boolean> {
+  const host = hostname.replace(/^\[|\]$/g, "");
+  if (host === "localhost" || host.endsWith(".localhost")) return false;
+  if (isIP(host)) return !isPrivateAddress(host);
+  try {
+    const addresses = await lookup(host, { all: true });
+    return addresses.every(({ address }) => !isPrivateAddress(address));
+  } catch {
+    return false;
+  }
+}
+
+// Probe feeds with at most `concurrency` hosts in flight and the feeds of one
+// host in sequence, PROBE_HOST_INTERVAL_MS apart
+async function probeFeedsByHost(feedUrls: string[], concurrency: number): Promise<FeedProbe[]> {
+  const byHost = new Map<string, string[]>();
+  for (const feedUrl of feedUrls) {
+    const host = new URL(feedUrl).hostname;
+    byHost.set(host, [...(byHost.get(host) ?? []), feedUrl]);
+  }
+
+  const perHost = await mapWithConcurrency([...byHost.values()], concurrency, async (urls) => {
+    const probes: FeedProbe[] = [];
+    for (const feedUrl of urls) {
+      if (probes.length > 0) {
+        await new Promise((resolve) => setTimeout(resolve, PROBE_HOST_INTERVAL_MS));
+      }
+      probes.push(await probeFeed(feedUrl));
+    }
+    return probes;
+  });
+  return perHost.flat();
+}
 
 // Types for AI suggestions
 export interface SubredditSuggestion {
@@ -31,17 +144,20 @@ export interface ProjectSuggestions {
 }
 
 // Generate project setup suggestions using Gemini
+// Results are cached per normalized name/description; pass refresh to regenerate
 export const suggestProjectSetup = action({
   args: {
     productName: v.string(),
     productDescription: v.string(),
+    refresh: v.optional(v.boolean()),
   },
   returns: v.object({
     success: v.boolean(),
     suggestions: v.optional(v.any()),
+    cached: v.optional(v.boolean()),
     error: v.optional(v.string()),
   }),
-  handler: async (_, args): Promise<{ success: boolean; suggestions?: ProjectSuggestions; error?: string }> => {
+  handler: async (ctx, args): Promise<{ success: boolean; suggestions?: ProjectSuggestions; cached?: boolean; error?: string }> => {
     const apiKey = process.env.GEMINI_API_KEY;
     if (!apiKey) {
       return { success: false, error: "GEMINI_API_KEY not configured" };
@@ -51,6 +167,14 @@ export const suggestProjectSetup = action({
       return { success: false, error: "Please provide a more detailed product description (at least 20 characters)" };
     }
 
+    const hash = descriptionHash(args.productName, args.productDescription);
+    if (!args.refresh) {
+      const cached = await ctx.runQuery(internal.ai.cache.getSuggestionCache, { descriptionHash: hash });
+      if (cached) {
+        return { success: true, suggestions: cached as ProjectSuggestions, cached: true };
+      }
+    }
+
     const prompt = `You are a product intelligence assistant helping set up monitoring for a product feedback tool.
 
 Product Name: ${args.productName}
@@ -86,7 +210,7 @@ Respond ONLY with valid JSON, no other text or markdown.`;
 
     try {
       const response = await fetch(
-        `https://generativelanguage.googleapis.com/v1beta/models/gemini-3-flash-preview:generateContent?key=${apiKey}`,
+        `https://generativelanguage.googleapis.com/v1beta/models/${SUGGEST_MODEL}:generateContent?key=${apiKey}`,
         {
           method: "POST",
           headers: {
@@ -171,7 +295,16 @@ Respond ONLY with valid JSON, no other text or markdown.`;
         productCategory: suggestions.productCategory || "other",
       };
 
-      return { success: true, suggestions: normalized };
+      const cacheHours = Number(process.env.SUGGESTION_CACHE_HOURS ?? DEFAULT_SUGGESTION_CACHE_HOURS);
+      if (cacheHours > 0) {
+        await ctx.runMutation(internal.ai.cache.saveSuggestionCache, {
+          descriptionHash: hash,
+          suggestions: normalized,
+          ttlMs: cacheHours * 60 * 60 * 1000,
+        });
+      }
+
+      return { success: true, suggestions: normalized, cached: false };
     } catch (error) {
       const errorMessage = error instanceof Error ? error.message : "Unknown error";
       console.error("Error generating suggestions:", errorMessage);
@@ -180,6 +313,55 @@ Respond ONLY with valid JSON, no other text or markdown.`;
   },
 });
 
+// Validate suggested feed URLs (built with lib/source-templates) before they are added:
+// fetch and parse each first page, returning the probes ranked by measured yield
+// (unknown next, dead feeds last). Recent probes are reused instead of refetched.
+export const validateSuggestedFeeds = action({
+  args: {
+    feedUrls: v.array(v.string()),
+  },
+  returns: v.array(feedProbeValidator),
+  handler: async (ctx, args): Promise<FeedProbe[]> => {
+    const userId = await getAuthUserId(ctx);
+    if (!userId) {
+      throw new Error("Not authenticated");
+    }
+    if (args.feedUrls.length > MAX_PROBED_FEEDS) {
+      throw new Error(`At most ${MAX_PROBED_FEEDS} feed URLs can be validated at once`);
+    }
+
+    // Never probe loopback or private hosts
+    const httpUrls = [...new Set(args.feedUrls)].filter(isHttpUrl);
+    const hosts = [...new Set(httpUrls.map((url) => new URL(url).hostname))];
+    const publicHosts = new Set(
+      (await Promise.all(hosts.map(async (host) => ((await isPublicHost(host)) ? host : null)))).filter(
+        (host): host is string => host !== null
+      )
+    );
+    const feedUrls = httpUrls.filter((url) => publicHosts.has(new URL(url).hostname));
+
+    const known = await ctx.runQuery(internal.ai.cache.getFeedProbes, {
+      feedUrls,
+      since: Date.now() - PROBE_MAX_AGE_MS,
+    });
+    const knownUrls = new Set(known.map((probe) => probe.feedUrl));
+
+    const concurrency = Number(process.env.FEED_PROBE_CONCURRENCY) || DEFAULT_PROBE_CONCURRENCY;
+    const fresh = await probeFeedsByHost(feedUrls.filter((url) => !knownUrls.has(url)), concurrency);
+
+    // Only remember definite answers; rate limits, timeouts and 5xx say nothing about the feed
+    const definite = fresh.filter((probe) => probe.ok !== null);
+    if (definite.length > 0) {
+      await ctx.runMutation(internal.ai.cache.saveFeedProbes, { probes: definite });
+    }
+
+    const rank = (probe: FeedProbe) => (probe.ok === null ? 1 : probe.ok ? 2 : 0);
+    return [...known, ...fresh].sort(
+      (a, b) => rank(b) - rank(a) || b.yieldScore - a.yieldScore || a.latencyMs - b.latencyMs
+    );
+  },
+});
+
 // Types for competitor suggestions
 export interface CompetitorSuggestion {
   name: string;
@@ -244,7 +426,7 @@ Respond ONLY with valid JSON array, no other text or markdown.`;
 
     try {
       const response = await fetch(
-        `https://generativelanguage.googleapis.com/v1beta/models/gemini-3-flash-preview:generateContent?key=${apiKey}`,
+        `https://generativelanguage.googleapis.com/v1beta/models/${SUGGEST_MODEL}:generateContent?key=${apiKey}`,
         {
           method: "POST",
           headers: {
@@ -1,5 +1,6 @@
 import { v } from "convex/values";
 import { internalQuery } from "../_generated/server";
+import { Vocabulary } from "../vocabulary/terms";
 
 // Get alert by ID (internal)
 export const getAlert = internalQuery({
@@ -9,11 +10,15 @@ export const getAlert = internalQuery({
   },
 });
 
-// Get insight by ID (internal)
+// Get insight by ID, with theme/entity labels (internal)
 export const getInsight = internalQuery({
   args: { id: v.id("insights") },
   handler: async (ctx, args) => {
-    return await ctx.db.get(args.id);
+    const insight = await ctx.db.get(args.id);
+    if (!insight) return null;
+
+    const vocabulary = await Vocabulary.load(ctx, insight.projectId);
+    return vocabulary.withLabels(insight);
   },
 });
 
@@ -3,6 +3,7 @@
 import { v } from "convex/values";
 import { internalAction, action } from "../_generated/server";
 import { internal } from "../_generated/api";
+import { Tracer } from "../tracing";
 
 // Slack block types - using any for flexibility with Slack's complex API
 interface SlackMessage {
@@ -159,10 +160,20 @@ export const sendInsightAlert = internalAction({
       ],
     };
 
-    return await ctx.runAction(internal.alerts.slack.sendSlackMessage, {
+    const trace = new Tracer({
+      projectId: insight.projectId,
+      sourceId: insight.sourceId,
+      feedItemId: insight.feedItemId,
+    });
+    const startedAt = Date.now();
+    const result = await ctx.runAction(internal.alerts.slack.sendSlackMessage, {
       webhookUrl: alert.slackWebhook,
       message,
     });
+    trace.record("alert_dispatch", startedAt, Date.now() - startedAt, { ok: result.success });
+    await trace.flush(ctx);
+
+    return result;
   },
 });
 
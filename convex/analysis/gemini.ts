@@ -1,8 +1,179 @@
 "use node";
 
+import { createHash, randomUUID } from "node:crypto";
 import { v } from "convex/values";
-import { action, internalAction } from "../_generated/server";
+import { action, internalAction, ActionCtx } from "../_generated/server";
 import { internal } from "../_generated/api";
+import { Id } from "../_generated/dataModel";
+import { Tracer } from "../tracing";
+import {
+  DEFAULT_BODY_TOKEN_BUDGET,
+  buildItemPrompt,
+  buildPromptPrefix,
+  compactContent,
+  estimateTokens,
+} from "./prompt";
+
+const GEMINI_MODEL = "gemini-3-flash-preview";
+const GEMINI_API = "https://generativelanguage.googleapis.com/v1beta";
+
+// Context cache lifetime; a cache is recreated when this close to expiring
+const CACHE_TTL_SECONDS = 60 * 60;
+const CACHE_REFRESH_MS = 5 * 60 * 1000;
+
+// After a failed cache creation, use the inline prompt for this long before retrying
+const CACHE_RETRY_MS = 30 * 60 * 1000;
+
+// How long a caller may take to create the cache before another may try
+const CACHE_CLAIM_MS = 60 * 1000;
+
+// Gemini rejects explicit caches below a minimum size (override with GEMINI_CACHE_MIN_TOKENS)
+const DEFAULT_CACHE_MIN_TOKENS = 1024;
+
+// Body token budget per item (override with ANALYSIS_BODY_TOKENS)
+function bodyTokenBudget(): number {
+  const budget = Number(process.env.ANALYSIS_BODY_TOKENS);
+  return budget > 0 ? budget : DEFAULT_BODY_TOKEN_BUDGET;
+}
+
+// Delete a context cache; failures are logged, the cache then expires at its TTL
+async function deletePromptCache(apiKey: string, cacheName: string): Promise<void> {
+  try {
+    const response = await fetch(`${GEMINI_API}/${cacheName}?key=${apiKey}`, { method: "DELETE" });
+    if (!response.ok && response.status !== 404) {
+      console.warn(`Could not delete prompt cache ${cacheName}: ${response.status} - ${await response.text()}`);
+    }
+  } catch (error) {
+    console.warn(`Could not delete prompt cache ${cacheName}:`, error);
+  }
+}
+
+// Name of a Gemini context cache holding the project's prompt prefix, or null
+// to send the prefix inline (caching disabled, prefix below the API minimum,
+// creation failed, or another call is creating the cache right now).
+// Both paths send the model the same system instruction and item prompt.
+async function resolvePromptCache(
+  ctx: ActionCtx,
+  apiKey: string,
+  projectId: Id<"projects">,
+  prefix: string
+): Promise<string | null> {
+  if (process.env.GEMINI_CONTEXT_CACHE === "off") return null;
+
+  const minTokens = Number(process.env.GEMINI_CACHE_MIN_TOKENS ?? DEFAULT_CACHE_MIN_TOKENS);
+  if (estimateTokens(prefix) < minTokens) return null;
+
+  const prefixHash = createHash("sha256").update(`${GEMINI_MODEL}\n${prefix}`).digest("hex").slice(0, 32);
+  const now = Date.now();
+
+  // One caller per project creates the cache; the others use it or go inline meanwhile
+  const claimId = randomUUID();
+  const claim = await ctx.runMutation(internal.analysis.promptCache.claimPromptCache, {
+    projectId,
+    prefixHash,
+    claimId,
+    refreshBefore: now + CACHE_REFRESH_MS,
+    claimExpiresAt: now + CACHE_CLAIM_MS,
+  });
+  if (!claim.claimed) return claim.cacheName;
+
+  // Replaced cache (prefix changed or about to expire): free it now rather than at its TTL
+  if (claim.staleCacheName) {
+    await deletePromptCache(apiKey, claim.staleCacheName);
+  }
+
+  let cacheName: string | null = null;
+  try {
+    const response = await fetch(`${GEMINI_API}/cachedContents?key=${apiKey}`, {
+      method: "POST",
+      headers: { "Content-Type": "application/json" },
+      body: JSON.stringify({
+        model: `models/${GEMINI_MODEL}`,
+        displayName: `productpulse-${projectId}`,
+        systemInstruction: { parts: [{ text: prefix }] },
+        ttl: `${CACHE_TTL_SECONDS}s`,
+      }),
+    });
+    if (!response.ok) {
+      throw new Error(`${response.status} - ${await response.text()}`);
+    }
+
+    const cache = await response.json();
+    cacheName = cache.name as string;
+    const saved = await ctx.runMutation(internal.analysis.promptCache.savePromptCache, {
+      projectId,
+      prefixHash,
+      claimId,
+      cacheName,
+      expiresAt: Date.parse(cache.expireTime) || now + CACHE_TTL_SECONDS * 1000,
+      tokenCount: cache.usageMetadata?.totalTokenCount,
+    });
+    if (!saved) {
+      // Claim expired and another caller replaced the row: don't leave this cache billing
+      await deletePromptCache(apiKey, cacheName);
+      return null;
+    }
+    return cacheName;
+  } catch (error) {
+    console.warn(`Prompt cache unavailable for project ${projectId}, sending prefix inline:`, error);
+    if (cacheName) await deletePromptCache(apiKey, cacheName);
+    await ctx.runMutation(internal.analysis.promptCache.savePromptCache, {
+      projectId,
+      prefixHash,
+      claimId,
+      expiresAt: now + CACHE_RETRY_MS,
+    });
+    return null;
+  }
+}
+
+// generateContent with the prefix from the cache or inline; a cache the API
+// no longer knows is dropped and the call retried inline
+async function generateAnalysis(
+  ctx: ActionCtx,
+  apiKey: string,
+  projectId: Id<"projects">,
+  prefix: string,
+  itemPrompt: string,
+  cacheName: string | null
+): Promise<{ data: any; promptMode: "cached" | "inline" }> {
+  const response = await fetch(`${GEMINI_API}/models/${GEMINI_MODEL}:generateContent?key=${apiKey}`, {
+    method: "POST",
+    headers: {
+      "Content-Type": "application/json",
+    },
+    body: JSON.stringify({
+      ...(cacheName
+        ? { cachedContent: cacheName }
+        : { systemInstruction: { parts: [{ text: prefix }] } }),
+      contents: [
+        {
+          role: "user",
+          parts: [{ text: itemPrompt }],
+        },
+      ],
+      generationConfig: {
+        // Gemini 3 recommends keeping temperature at 1.0 (default)
+        maxOutputTokens: 1024,
+        thinkingConfig: {
+          thinkingLevel: "low", // Low thinking for structured JSON generation
+        },
+      },
+    }),
+  });
+
+  if (!response.ok) {
+    const errorText = await response.text();
+    if (cacheName && [400, 403, 404].includes(response.status)) {
+      console.warn(`Prompt cache ${cacheName} rejected (${response.status}), retrying inline`);
+      await ctx.runMutation(internal.analysis.promptCache.dropPromptCache, { projectId, cacheName });
+      return generateAnalysis(ctx, apiKey, projectId, prefix, itemPrompt, null);
+    }
+    throw new Error(`Gemini API error: ${response.status} - ${errorText}`);
+  }
+
+  return { data: await response.json(), promptMode: cacheName ? "cached" : "inline" };
+}
 
 // Types for Gemini response
 interface AnalysisResult {
@@ -28,6 +199,7 @@ export const analyzeItem = internalAction({
     feedItemId: v.id("feedItems"),
   },
   handler: async (ctx, args): Promise<AnalyzeResult> => {
+    const startedAt = Date.now();
     const apiKey = process.env.GEMINI_API_KEY;
     if (!apiKey) {
       return { success: false, error: "GEMINI_API_KEY not configured" };
@@ -64,75 +236,53 @@ export const analyzeItem = internalAction({
       return { success: false, error: "Project not found" };
     }
 
-    // Build keywords list for relevance checking
+    const trace = new Tracer({
+      projectId: source.projectId,
+      sourceId: source._id,
+      feedItemId: args.feedItemId,
+    });
+    trace.record("queue_wait", feedItem.fetchedAt, startedAt - feedItem.fetchedAt);
+
+    // Tracked terms drive relevance and body compaction
     const trackingTerms = [
       ...(project.keywords || []),
       ...(project.competitors || []),
     ];
 
     try {
-      // Build the prompt with keyword context
-      const prompt = `Analyze this content from an RSS feed for relevance to a product monitoring project.
-
-TRACKED PRODUCT/KEYWORDS: ${trackingTerms.join(", ")}
-PROJECT NAME: ${project.name}
-
-CONTENT TO ANALYZE:
-Title: ${feedItem.title}
-Body: ${feedItem.content.substring(0, 2000)}
-
-First, determine if this content is RELEVANT to the tracked product/keywords. Content is relevant if it:
-- Mentions the product, its competitors, or related keywords
-- Discusses topics directly related to the product's domain
-- Contains feedback, questions, or discussions about similar tools
-
-Provide a JSON response:
-{
-  "relevant": <true if content is relevant to tracked keywords, false if unrelated>,
-  "relevanceScore": <0.0 to 1.0 - how relevant is this to the tracked product>,
-  "sentiment": {
-    "score": <number from -1 (very negative) to 1 (very positive)>,
-    "label": "<positive|negative|neutral>"
-  },
-  "entities": [<product names, features, or competitors mentioned>],
-  "themes": [<themes like: pricing, ux, performance, features, support, bugs, comparison, question, announcement>],
-  "summary": "<1-2 sentence insight summary for a product manager>",
-  "actionability": "<high|medium|low based on how actionable this feedback is>"
-}
-
-Respond ONLY with valid JSON, no other text.`;
+      // Per-project prefix (cached by Gemini when possible) + compacted per-item part
+      const promptStartedAt = Date.now();
+      const prefix = buildPromptPrefix(project);
+      const body = compactContent(feedItem.content, trackingTerms, bodyTokenBudget());
+      const itemPrompt = buildItemPrompt(feedItem.title, body.text);
+      trace.record("prompt_build", promptStartedAt, Date.now() - promptStartedAt);
+      const cacheName = await trace.span("prompt_cache", () =>
+        resolvePromptCache(ctx, apiKey, source.projectId, prefix)
+      );
 
       // Call Gemini API
-      const response = await fetch(
-        `https://generativelanguage.googleapis.com/v1beta/models/gemini-3-flash-preview:generateContent?key=${apiKey}`,
-        {
-          method: "POST",
-          headers: {
-            "Content-Type": "application/json",
-          },
-          body: JSON.stringify({
-            contents: [
-              {
-                parts: [{ text: prompt }],
-              },
-            ],
-            generationConfig: {
-              // Gemini 3 recommends keeping temperature at 1.0 (default)
-              maxOutputTokens: 1024,
-              thinkingConfig: {
-                thinkingLevel: "low", // Low thinking for structured JSON generation
-              },
-            },
-          }),
-        }
+      const modelStartedAt = Date.now();
+      const { data, promptMode } = await trace.span("model_latency", () =>
+        generateAnalysis(ctx, apiKey, source.projectId, prefix, itemPrompt, cacheName)
       );
 
-      if (!response.ok) {
-        const errorText = await response.text();
-        throw new Error(`Gemini API error: ${response.status} - ${errorText}`);
-      }
+      // Record token usage before parsing: a malformed response was still billed
+      await ctx.runMutation(internal.feeds.mutations.recordAnalysisUsage, {
+        feedItemId: args.feedItemId,
+        usage: {
+          projectId: source.projectId,
+          model: GEMINI_MODEL,
+          promptMode,
+          promptTokens: data.usageMetadata?.promptTokenCount ?? 0,
+          cachedTokens: data.usageMetadata?.cachedContentTokenCount ?? 0,
+          outputTokens: data.usageMetadata?.candidatesTokenCount ?? 0,
+          thoughtsTokens: data.usageMetadata?.thoughtsTokenCount ?? 0,
+          bodyChars: feedItem.content.length,
+          sentChars: body.text.length,
+          latencyMs: Date.now() - modelStartedAt,
+        },
+      });
 
-      const data = await response.json();
       const textContent = data.candidates?.[0]?.content?.parts?.[0]?.text;
 
       if (!textContent) {
@@ -141,12 +291,14 @@ Respond ONLY with valid JSON, no other text.`;
 
       // Parse the JSON response
       // Remove any markdown code blocks if present
-      const cleanJson = textContent
-        .replace(/```json\n?/g, "")
-        .replace(/```\n?/g, "")
-        .trim();
+      const analysis: AnalysisResult = await trace.span("json_parse", async () => {
+        const cleanJson = textContent
+          .replace(/```json\n?/g, "")
+          .replace(/```\n?/g, "")
+          .trim();
 
-      const analysis: AnalysisResult = JSON.parse(cleanJson);
+        return JSON.parse(cleanJson);
+      });
 
       // Mark the item as analyzed regardless of relevance
       await ctx.runMutation(internal.feeds.mutations.markItemAnalyzed, {
@@ -166,7 +318,7 @@ Respond ONLY with valid JSON, no other text.`;
         (sentimentScore > 0.2 ? "positive" : sentimentScore < -0.2 ? "negative" : "neutral");
 
       // Create the insight (only for relevant content)
-      await ctx.runMutation(internal.feeds.mutations.createInsight, {
+      await trace.span("insight_write", () => ctx.runMutation(internal.feeds.mutations.createInsight, {
         feedItemId: args.feedItemId,
         projectId: source.projectId,
         sourceId: source._id,
@@ -180,7 +332,7 @@ Respond ONLY with valid JSON, no other text.`;
         feedItemTitle: feedItem.title,
         feedItemUrl: feedItem.url,
         feedItemPublishedAt: feedItem.publishedAt,
-      });
+      }));
 
       console.log(`Created insight for: "${feedItem.title.substring(0, 50)}..." (relevance: ${relevanceScore})`);
       return { success: true };
@@ -188,6 +340,8 @@ Respond ONLY with valid JSON, no other text.`;
       const errorMessage = error instanceof Error ? error.message : "Unknown error";
       console.error(`Error analyzing item ${args.feedItemId}:`, errorMessage);
       return { success: false, error: errorMessage };
+    } finally {
+      await trace.flush(ctx);
     }
   },
 });
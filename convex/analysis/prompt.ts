@@ -0,0 +1,142 @@
+// Analysis prompt construction
+// The prompt is split into a per-project prefix (instructions, JSON schema,
+// tracked terms) that can be cached by Gemini, and a small per-item part.
+
+// Body budget per item (about the size of the previous 2000-character cut)
+export const DEFAULT_BODY_TOKEN_BUDGET = 500;
+
+// Opening of the body always kept (titles are often followed by the key context)
+const LEAD_TOKENS = 120;
+
+// Sentences longer than this are split so one run-on sentence can't eat the budget
+const MAX_PASSAGE_CHARS = 600;
+
+// Rough Gemini token estimate (about 4 characters per token)
+export function estimateTokens(text: string): number {
+  return Math.ceil(text.length / 4);
+}
+
+// Instruction block shared by every item of a project
+export function buildPromptPrefix(project: { name: string; keywords?: string[]; competitors?: string[] }): string {
+  const trackingTerms = [...(project.keywords || []), ...(project.competitors || [])];
+
+  return `Analyze content from an RSS feed for relevance to a product monitoring project.
+
+TRACKED PRODUCT/KEYWORDS: ${trackingTerms.join(", ")}
+PROJECT NAME: ${project.name}
+
+First, determine if the content is RELEVANT to the tracked product/keywords. Content is relevant if it:
+- Mentions the product, its competitors, or related keywords
+- Discusses topics directly related to the product's domain
+- Contains feedback, questions, or discussions about similar tools
+
+The body may be compacted to the passages around tracked terms; "…" marks omitted text.
+
+Provide a JSON response:
+{
+  "relevant": <true if content is relevant to tracked keywords, false if unrelated>,
+  "relevanceScore": <0.0 to 1.0 - how relevant is this to the tracked product>,
+  "sentiment": {
+    "score": <number from -1 (very negative) to 1 (very positive)>,
+    "label": "<positive|negative|neutral>"
+  },
+  "entities": [<product names, features, or competitors mentioned>],
+  "themes": [<themes like: pricing, ux, performance, features, support, bugs, comparison, question, announcement>],
+  "summary": "<1-2 sentence insight summary for a product manager>",
+  "actionability": "<high|medium|low based on how actionable this feedback is>"
+}
+
+Respond ONLY with valid JSON, no other text.`;
+}
+
+// Per-item part of the prompt
+export function buildItemPrompt(title: string, body: string): string {
+  return `CONTENT TO ANALYZE:
+Title: ${title}
+Body: ${body}`;
+}
+
+// Split text into sentence-sized passages
+function splitPassages(text: string): string[] {
+  const passages: string[] = [];
+  for (const sentence of text.split(/(?<=[.!?])\s+/)) {
+    let rest = sentence.trim();
+    while (rest.length > MAX_PASSAGE_CHARS) {
+      const cut = rest.lastIndexOf(" ", MAX_PASSAGE_CHARS);
+      const at = cut > MAX_PASSAGE_CHARS / 2 ? cut : MAX_PASSAGE_CHARS;
+      passages.push(rest.slice(0, at));
+      rest = rest.slice(at).trim();
+    }
+    if (rest) passages.push(rest);
+  }
+  return passages;
+}
+
+export interface CompactedBody {
+  text: string;
+  compacted: boolean; // False when the body already fit the budget
+  termsKept: number; // Distinct tracked terms present in the kept text
+  termsTotal: number; // Distinct tracked terms present in the full body
+}
+
+// Fit a body into a token budget: the lead, then the passages mentioning
+// tracked terms (one per term first, for coverage) with their neighbours,
+// then the text following the lead. Gaps are marked with "…".
+export function compactContent(content: string, terms: string[], budgetTokens = DEFAULT_BODY_TOKEN_BUDGET): CompactedBody {
+  const needles = [...new Set(terms.map((term) => term.trim().toLowerCase()).filter(Boolean))];
+  const lower = content.toLowerCase();
+  const termsTotal = needles.filter((needle) => lower.includes(needle)).length;
+
+  if (estimateTokens(content) <= budgetTokens) {
+    return { text: content, compacted: false, termsKept: termsTotal, termsTotal };
+  }
+
+  const passages = splitPassages(content);
+  const lowered = passages.map((passage) => passage.toLowerCase());
+  const selected = new Set<number>();
+  let used = 0;
+
+  const take = (index: number, limit = budgetTokens) => {
+    if (index < 0 || index >= passages.length || selected.has(index)) return;
+    const cost = estimateTokens(passages[index]) + 1;
+    if (used + cost > limit) return;
+    selected.add(index);
+    used += cost;
+  };
+
+  // Lead
+  for (let i = 0; i < passages.length && used < Math.min(LEAD_TOKENS, budgetTokens); i++) {
+    take(i, Math.min(LEAD_TOKENS, budgetTokens));
+    if (!selected.has(i)) break;
+  }
+
+  // First mention of each term, then the remaining mentions, then their neighbours
+  const hits = passages
+    .map((_, i) => i)
+    .filter((i) => needles.some((needle) => lowered[i].includes(needle)));
+  for (const needle of needles) {
+    const first = hits.find((i) => lowered[i].includes(needle));
+    if (first !== undefined) take(first);
+  }
+  hits.forEach((i) => take(i));
+  hits.forEach((i) => {
+    take(i - 1);
+    take(i + 1);
+  });
+
+  // Remaining budget continues from the lead
+  for (let i = 0; i < passages.length; i++) take(i);
+
+  const ordered = [...selected].sort((a, b) => a - b);
+  let text = "";
+  ordered.forEach((index, n) => {
+    if (n === 0) text = index > 0 ? "… " : "";
+    else text += index === ordered[n - 1] + 1 ? " " : " … ";
+    text += passages[index];
+  });
+  if (ordered[ordered.length - 1] !== passages.length - 1) text += " …";
+
+  const keptLower = text.toLowerCase();
+  const termsKept = needles.filter((needle) => keptLower.includes(needle)).length;
+  return { text, compacted: true, termsKept, termsTotal };
+}
@@ -0,0 +1,84 @@
+import { v } from "convex/values";
+import { internalMutation } from "../_generated/server";
+
+// Look up a project's prompt cache, or claim the right to create it (internal).
+// A live cache for this prefix is returned as is. A claim or a recent failed
+// creation for this prefix means inline for now. Otherwise the caller's claim
+// replaces the row and the cache it held (if any) is returned for deletion.
+export const claimPromptCache = internalMutation({
+  args: {
+    projectId: v.id("projects"),
+    prefixHash: v.string(),
+    claimId: v.string(),
+    refreshBefore: v.number(), // A cache expiring before this is replaced
+    claimExpiresAt: v.number(), // Others may claim again after this
+  },
+  handler: async (ctx, args): Promise<{ claimed: boolean; cacheName: string | null; staleCacheName: string | null }> => {
+    const existing = await ctx.db
+      .query("promptCaches")
+      .withIndex("by_project", (q) => q.eq("projectId", args.projectId))
+      .first();
+
+    if (existing?.prefixHash === args.prefixHash) {
+      if (existing.cacheName && existing.expiresAt > args.refreshBefore) {
+        return { claimed: false, cacheName: existing.cacheName, staleCacheName: null };
+      }
+      if (!existing.cacheName && existing.expiresAt > Date.now()) {
+        return { claimed: false, cacheName: null, staleCacheName: null };
+      }
+    }
+
+    const claim = {
+      projectId: args.projectId,
+      prefixHash: args.prefixHash,
+      claimId: args.claimId,
+      expiresAt: args.claimExpiresAt,
+    };
+    if (existing) {
+      await ctx.db.replace(existing._id, claim);
+    } else {
+      await ctx.db.insert("promptCaches", claim);
+    }
+    return { claimed: true, cacheName: null, staleCacheName: existing?.cacheName ?? null };
+  },
+});
+
+// Store the outcome of a claimed cache creation (internal): the new cache, or
+// without cacheName a failure that keeps the project inline until expiresAt.
+// Returns false when the claim was lost, so the caller deletes its cache.
+export const savePromptCache = internalMutation({
+  args: {
+    projectId: v.id("projects"),
+    prefixHash: v.string(),
+    claimId: v.string(),
+    cacheName: v.optional(v.string()),
+    expiresAt: v.number(),
+    tokenCount: v.optional(v.number()),
+  },
+  handler: async (ctx, args): Promise<boolean> => {
+    const existing = await ctx.db
+      .query("promptCaches")
+      .withIndex("by_project", (q) => q.eq("projectId", args.projectId))
+      .first();
+    if (!existing || existing.claimId !== args.claimId) return false;
+
+    const { claimId, ...entry } = args;
+    await ctx.db.replace(existing._id, entry);
+    return true;
+  },
+});
+
+// Forget a cache the API no longer knows (expired or evicted early) (internal)
+export const dropPromptCache = internalMutation({
+  args: { projectId: v.id("projects"), cacheName: v.string() },
+  handler: async (ctx, args) => {
+    const existing = await ctx.db
+      .query("promptCaches")
+      .withIndex("by_project", (q) => q.eq("projectId", args.projectId))
+      .first();
+
+    if (existing?.cacheName === args.cacheName) {
+      await ctx.db.delete(existing._id);
+    }
+  },
+});
@@ -5,10 +5,11 @@ const crons = cronJobs();
 
 // Fetch RSS feeds - runs every 30 minutes but respects per-project intervals
 // Projects can be set to: manual (0), 6 hours (360), 12 hours (720), or 24 hours (1440)
+// Starts FETCH_WORKERS workers that split sources by shard lease
 crons.interval(
   "fetch-feeds",
   { minutes: 30 },
-  internal.feeds.fetch.fetchSourcesWithInterval,
+  internal.feeds.leases.dispatchFetchWorkers,
   {}
 );
 
@@ -20,4 +21,52 @@ crons.interval(
   {}
 );
 
+// Drop fetch history past the retention window once a day
+crons.interval(
+  "prune-fetch-history",
+  { hours: 24 },
+  internal.feeds.mutations.pruneFetchHistory,
+  {}
+);
+
+// Fold new trace spans into the hourly stage histograms (single writer)
+crons.interval(
+  "rollup-stage-metrics",
+  { minutes: 5 },
+  internal.metrics.rollupStageMetrics,
+  {}
+);
+
+// Drop raw trace spans past the retention window (histograms are kept)
+crons.interval(
+  "prune-trace-spans",
+  { hours: 6 },
+  internal.metrics.pruneTraceSpans,
+  {}
+);
+
+// Drop per-call Gemini token usage past the retention window
+crons.interval(
+  "prune-analysis-usage",
+  { hours: 24 },
+  internal.metrics.pruneAnalysisUsage,
+  {}
+);
+
+// Append newly analyzed insights to existing export snapshots
+crons.interval(
+  "refresh-insight-snapshots",
+  { hours: 1 },
+  internal.exports.snapshot.refreshSnapshots,
+  {}
+);
+
+// Drop expired project-setup suggestions and week-old feed probes
+crons.interval(
+  "prune-suggestion-caches",
+  { hours: 24 },
+  internal.ai.cache.pruneSuggestionCaches,
+  {}
+);
+
 export default crons;
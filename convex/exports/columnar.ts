@@ -0,0 +1,209 @@
+// Columnar insight snapshot encoding
+// A snapshot is a JSON manifest plus append-only binary segments. Each segment
+// holds one column after another (8-byte aligned, little-endian) so readers can
+// memory-map it and view columns in place (see scripts/insight_snapshot.py).
+
+export const SNAPSHOT_FORMAT_VERSION = 1;
+
+// Rows per segment (bounds action memory when a project is snapshotted from scratch)
+export const SEGMENT_MAX_ROWS = 50000;
+
+// Fixed dictionaries (codes are part of the format)
+export const SENTIMENT_LABELS = ["positive", "negative", "neutral"] as const;
+export const ACTIONABILITY_LEVELS = ["high", "medium", "low"] as const;
+
+export type ColumnType = "f64" | "f32" | "u8" | "u32";
+
+// Location of one buffer inside a segment
+export interface BufferRef {
+  offset: number;
+  length: number; // Bytes
+}
+
+export type ColumnMeta =
+  | { name: string; kind: "fixed"; type: ColumnType; data: BufferRef } // One value per row
+  | { name: string; kind: "list"; type: "u32"; offsets: BufferRef; values: BufferRef } // Dictionary codes per row
+  | { name: string; kind: "utf8"; offsets: BufferRef; data: BufferRef }; // Variable-width strings
+
+export interface SegmentMeta {
+  storageId: string;
+  rowCount: number;
+  minAnalyzedAt: number;
+  maxAnalyzedAt: number;
+  byteLength: number;
+  columns: ColumnMeta[];
+}
+
+// Dictionaries grow append-only so codes in earlier segments stay valid
+export interface SnapshotDictionaries {
+  sentimentLabel: string[];
+  actionability: string[];
+  sources: string[];
+  themes: string[];
+  entities: string[];
+}
+
+export interface SnapshotManifest {
+  formatVersion: number;
+  byteOrder: "little";
+  projectId: string;
+  createdAt: number;
+  watermark: number; // Highest analyzedAt covered; the next append starts after it
+  rowCount: number;
+  dictionaries: SnapshotDictionaries;
+  segments: SegmentMeta[];
+}
+
+// Insight fields carried into the snapshot
+export interface SnapshotRow {
+  _id: string;
+  feedItemId: string;
+  sourceId: string;
+  analyzedAt: number;
+  feedItemPublishedAt: number;
+  sentimentScore: number;
+  sentimentLabel: string;
+  relevanceScore?: number;
+  actionability: string;
+  themes: string[];
+  entities: string[];
+  feedItemTitle: string;
+  feedItemUrl: string;
+  summary: string;
+}
+
+export function emptyManifest(projectId: string): SnapshotManifest {
+  return {
+    formatVersion: SNAPSHOT_FORMAT_VERSION,
+    byteOrder: "little",
+    projectId,
+    createdAt: Date.now(),
+    watermark: 0,
+    rowCount: 0,
+    dictionaries: {
+      sentimentLabel: [...SENTIMENT_LABELS],
+      actionability: [...ACTIONABILITY_LEVELS],
+      sources: [],
+      themes: [],
+      entities: [],
+    },
+    segments: [],
+  };
+}
+
+// Append-only dictionary with O(1) lookups
+class Dictionary {
+  private readonly codes: Map<string, number>;
+
+  constructor(readonly values: string[]) {
+    this.codes = new Map(values.map((value, code) => [value, code]));
+  }
+
+  encode(value: string): number {
+    let code = this.codes.get(value);
+    if (code === undefined) {
+      code = this.values.length;
+      this.values.push(value);
+      this.codes.set(value, code);
+    }
+    return code;
+  }
+}
+
+const align8 = (n: number) => Math.ceil(n / 8) * 8;
+
+// Collects column buffers and lays them out back to back
+class SegmentWriter {
+  private readonly parts: { offset: number; bytes: Uint8Array }[] = [];
+  private size = 0;
+
+  add(view: ArrayBufferView): BufferRef {
+    const offset = align8(this.size);
+    const bytes = new Uint8Array(view.buffer, view.byteOffset, view.byteLength);
+    this.parts.push({ offset, bytes });
+    this.size = offset + bytes.byteLength;
+    return { offset, length: bytes.byteLength };
+  }
+
+  finish(): Uint8Array {
+    const out = new Uint8Array(align8(this.size));
+    for (const { offset, bytes } of this.parts) out.set(bytes, offset);
+    return out;
+  }
+}
+
+function utf8Column(writer: SegmentWriter, name: string, values: string[]): ColumnMeta {
+  const encoder = new TextEncoder();
+  const encoded = values.map((value) => encoder.encode(value));
+  const offsets = new Uint32Array(values.length + 1);
+  for (let i = 0; i < encoded.length; i++) offsets[i + 1] = offsets[i] + encoded[i].byteLength;
+  const data = new Uint8Array(offsets[values.length]);
+  encoded.forEach((bytes, i) => data.set(bytes, offsets[i]));
+  return { name, kind: "utf8", offsets: writer.add(offsets), data: writer.add(data) };
+}
+
+function listColumn(writer: SegmentWriter, name: string, lists: string[][], dictionary: Dictionary): ColumnMeta {
+  const offsets = new Uint32Array(lists.length + 1);
+  for (let i = 0; i < lists.length; i++) offsets[i + 1] = offsets[i] + lists[i].length;
+  const values = new Uint32Array(offsets[lists.length]);
+  lists.forEach((list, i) => list.forEach((value, j) => (values[offsets[i] + j] = dictionary.encode(value))));
+  return { name, kind: "list", type: "u32", offsets: writer.add(offsets), values: writer.add(values) };
+}
+
+// Encode rows (sorted by analyzedAt) into one segment, extending the manifest's dictionaries in place
+export function encodeSegment(
+  rows: SnapshotRow[],
+  dictionaries: SnapshotDictionaries
+): { bytes: Uint8Array; columns: ColumnMeta[] } {
+  const n = rows.length;
+  const writer = new SegmentWriter();
+  const sources = new Dictionary(dictionaries.sources);
+  const themes = new Dictionary(dictionaries.themes);
+  const entities = new Dictionary(dictionaries.entities);
+  const labels = new Dictionary(dictionaries.sentimentLabel);
+  const actionability = new Dictionary(dictionaries.actionability);
+
+  const analyzedAt = new Float64Array(n);
+  const publishedAt = new Float64Array(n);
+  const sentimentScore = new Float32Array(n);
+  const relevanceScore = new Float32Array(n);
+  const sentimentLabel = new Uint8Array(n);
+  const actionabilityCodes = new Uint8Array(n);
+  const sourceCodes = new Uint32Array(n);
+
+  rows.forEach((row, i) => {
+    analyzedAt[i] = row.analyzedAt;
+    publishedAt[i] = row.feedItemPublishedAt;
+    sentimentScore[i] = row.sentimentScore;
+    relevanceScore[i] = row.relevanceScore ?? NaN; // NaN marks "not scored" (legacy insights)
+    sentimentLabel[i] = labels.encode(row.sentimentLabel);
+    actionabilityCodes[i] = actionability.encode(row.actionability);
+    sourceCodes[i] = sources.encode(row.sourceId);
+  });
+
+  const fixed = (name: string, type: ColumnType, view: ArrayBufferView): ColumnMeta => ({
+    name,
+    kind: "fixed",
+    type,
+    data: writer.add(view),
+  });
+
+  const columns: ColumnMeta[] = [
+    fixed("analyzedAt", "f64", analyzedAt),
+    fixed("publishedAt", "f64", publishedAt),
+    fixed("sentimentScore", "f32", sentimentScore),
+    fixed("relevanceScore", "f32", relevanceScore),
+    fixed("sentimentLabel", "u8", sentimentLabel),
+    fixed("actionability", "u8", actionabilityCodes),
+    fixed("source", "u32", sourceCodes),
+    listColumn(writer, "themes", rows.map((row) => row.themes), themes),
+    listColumn(writer, "entities", rows.map((row) => row.entities), entities),
+    utf8Column(writer, "insightId", rows.map((row) => row._id)),
+    utf8Column(writer, "feedItemId", rows.map((row) => row.feedItemId)),
+    utf8Column(writer, "title", rows.map((row) => row.feedItemTitle)),
+    utf8Column(writer, "url", rows.map((row) => row.feedItemUrl)),
+    utf8Column(writer, "summary", rows.map((row) => row.summary)),
+  ];
+
+  return { bytes: writer.finish(), columns };
+}
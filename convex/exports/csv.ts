@@ -0,0 +1,129 @@
+import { httpAction } from "../_generated/server";
+import { internal } from "../_generated/api";
+import { Doc, Id } from "../_generated/dataModel";
+import { auth } from "../auth";
+import type { LabeledInsight } from "../vocabulary/terms";
+
+// Insights per page (one CSV chunk per page)
+const PAGE_SIZE = 500;
+
+export const INSIGHT_CSV_HEADERS = [
+  "Title",
+  "URL",
+  "Published At",
+  "Analyzed At",
+  "Sentiment Score",
+  "Sentiment Label",
+  "Actionability",
+  "Summary",
+  "Themes",
+  "Entities",
+];
+
+// Quote values containing a comma, newline or quote (quotes doubled)
+function escapeCSV(value: string | number): string {
+  const stringValue = String(value);
+  if (stringValue.includes(",") || stringValue.includes("\n") || stringValue.includes('"')) {
+    return `"${stringValue.replace(/"/g, '""')}"`;
+  }
+  return stringValue;
+}
+
+export function insightCsvRow(insight: LabeledInsight): string {
+  return [
+    insight.feedItemTitle,
+    insight.feedItemUrl,
+    new Date(insight.feedItemPublishedAt).toISOString(),
+    new Date(insight.analyzedAt).toISOString(),
+    insight.sentimentScore,
+    insight.sentimentLabel,
+    insight.actionability,
+    insight.summary,
+    insight.themes.join("; "),
+    insight.entities.join("; "),
+  ]
+    .map(escapeCSV)
+    .join(",");
+}
+
+// The dashboard calls the export from its own origin
+function corsHeaders(): Record<string, string> {
+  return {
+    "Access-Control-Allow-Origin": process.env.SITE_URL ?? "*",
+    "Access-Control-Allow-Methods": "GET, OPTIONS",
+    "Access-Control-Allow-Headers": "Authorization",
+    "Access-Control-Expose-Headers": "Content-Disposition",
+    Vary: "Origin",
+  };
+}
+
+export const exportPreflight = httpAction(async () => {
+  return new Response(null, { status: 204, headers: corsHeaders() });
+});
+
+// GET /export/insights.csv?projectId=... - streams a project's insights as CSV,
+// one page per chunk, so neither the server nor the browser holds a giant string
+export const streamInsightsCsv = httpAction(async (ctx, request) => {
+  const projectId = new URL(request.url).searchParams.get("projectId") as Id<"projects"> | null;
+  if (!projectId) {
+    return new Response("Missing projectId", { status: 400, headers: corsHeaders() });
+  }
+
+  const userId = await auth.getUserId(ctx);
+  let project: Doc<"projects"> | null;
+  try {
+    project = await ctx.runQuery(internal.exports.queries.getExportableProject, { projectId, userId });
+  } catch {
+    return new Response("Invalid projectId", { status: 400, headers: corsHeaders() });
+  }
+  if (!project) {
+    return new Response("Project not found", { status: 404, headers: corsHeaders() });
+  }
+
+  type Page = { page: LabeledInsight[]; isDone: boolean; continueCursor: string };
+  const nextPage = (cursor: string | null): Promise<Page> =>
+    ctx.runQuery(internal.exports.queries.exportInsightsPage, {
+      projectId,
+      after: 0,
+      upTo: Number.MAX_SAFE_INTEGER,
+      paginationOpts: { numItems: PAGE_SIZE, cursor },
+    });
+
+  // First page up front, so an empty export is a 204 the client can check without reading a body
+  let result = await nextPage(null);
+  if (result.page.length === 0 && result.isDone) {
+    return new Response(null, { status: 204, headers: corsHeaders() });
+  }
+
+  const encoder = new TextEncoder();
+  let headerSent = false;
+
+  const body = new ReadableStream<Uint8Array>({
+    async pull(controller) {
+      if (!headerSent) {
+        headerSent = true;
+        controller.enqueue(encoder.encode(INSIGHT_CSV_HEADERS.join(",") + "\n"));
+      } else {
+        result = await nextPage(result.continueCursor);
+      }
+
+      if (result.page.length > 0) {
+        controller.enqueue(encoder.encode(result.page.map(insightCsvRow).join("\n") + "\n"));
+      }
+      if (result.isDone) controller.close();
+    },
+  });
+
+  const slug = project.name.toLowerCase().replace(/[^a-z0-9]+/g, "-").replace(/^-|-$/g, "") || "project";
+  const filename = `${slug}-insights-${new Date().toISOString().split("T")[0]}.csv`;
+
+  return new Response(body, {
+    status: 200,
+    headers: {
+      ...corsHeaders(),
+      "Content-Type": "text/csv; charset=utf-8",
+      "Content-Disposition": `attachment; filename="${filename}"`,
+      "Cache-Control": "no-store",
+    },
+  });
+});
@@ -0,0 +1,59 @@
+import { v } from "convex/values";
+import { internalMutation, MutationCtx } from "../_generated/server";
+import { Id } from "../_generated/dataModel";
+
+// Point a project at a new snapshot version and drop storage it no longer references (internal)
+// Returns false if another build saved first (the caller discards its new files)
+export const saveSnapshot = internalMutation({
+  args: {
+    projectId: v.id("projects"),
+    previousManifestId: v.optional(v.id("_storage")), // Manifest the build started from
+    manifestId: v.id("_storage"),
+    segmentIds: v.array(v.id("_storage")),
+    watermark: v.number(),
+    rowCount: v.number(),
+  },
+  handler: async (ctx, args): Promise<boolean> => {
+    const existing = await ctx.db
+      .query("insightSnapshots")
+      .withIndex("by_project", (q) => q.eq("projectId", args.projectId))
+      .first();
+
+    const { previousManifestId, ...snapshot } = args;
+    const fields = { ...snapshot, updatedAt: Date.now() };
+
+    if (existing?.manifestId !== previousManifestId) {
+      return false;
+    }
+
+    if (!existing) {
+      await ctx.db.insert("insightSnapshots", fields);
+      return true;
+    }
+
+    // Appends keep earlier segments; rebuilds replace them all
+    const kept = new Set<string>(args.segmentIds);
+    await ctx.storage.delete(existing.manifestId);
+    for (const segmentId of existing.segmentIds) {
+      if (!kept.has(segmentId)) await ctx.storage.delete(segmentId);
+    }
+    await ctx.db.patch(existing._id, fields);
+    return true;
+  },
+});
+
+// Delete a project's snapshot and its stored files (used when a project is removed)
+export async function deleteProjectSnapshot(ctx: MutationCtx, projectId: Id<"projects">) {
+  const snapshot = await ctx.db
+    .query("insightSnapshots")
+    .withIndex("by_project", (q) => q.eq("projectId", projectId))
+    .first();
+
+  if (!snapshot) return;
+
+  await ctx.storage.delete(snapshot.manifestId);
+  for (const segmentId of snapshot.segmentIds) {
+    await ctx.storage.delete(segmentId);
+  }
+  await ctx.db.delete(snapshot._id);
+}
@@ -0,0 +1,90 @@
+import { v } from "convex/values";
+import { paginationOptsValidator } from "convex/server";
+import { internalQuery } from "../_generated/server";
+import { Vocabulary } from "../vocabulary/terms";
+
+// One page of a project's insights in analyzedAt order, within (after, upTo],
+// with theme/entity labels (internal)
+export const exportInsightsPage = internalQuery({
+  args: {
+    projectId: v.id("projects"),
+    after: v.number(), // Exclusive lower bound (snapshot watermark)
+    upTo: v.number(), // Inclusive upper bound
+    paginationOpts: paginationOptsValidator,
+  },
+  handler: async (ctx, args) => {
+    const vocabulary = await Vocabulary.load(ctx, args.projectId);
+    const result = await ctx.db
+      .query("insights")
+      .withIndex("by_project_date", (q) =>
+        q.eq("projectId", args.projectId).gt("analyzedAt", args.after).lte("analyzedAt", args.upTo)
+      )
+      .paginate(args.paginationOpts);
+
+    return { ...result, page: result.page.map((insight) => vocabulary.withLabels(insight)) };
+  },
+});
+
+// Current snapshot record for a project (internal)
+export const getSnapshot = internalQuery({
+  args: { projectId: v.id("projects") },
+  handler: async (ctx, args) => {
+    return await ctx.db
+      .query("insightSnapshots")
+      .withIndex("by_project", (q) => q.eq("projectId", args.projectId))
+      .first();
+  },
+});
+
+// Projects that have a snapshot (internal - refreshed by cron)
+export const listSnapshotProjects = internalQuery({
+  args: {},
+  handler: async (ctx) => {
+    const snapshots = await ctx.db.query("insightSnapshots").collect();
+    return snapshots.map((snapshot) => snapshot.projectId);
+  },
+});
+
+// Download URLs for a project's snapshot (internal - input for scripts/insight_snapshot.py)
+// Usage: npx convex run exports/queries:getSnapshotDownload '{"projectId": "..."}' > snapshot.json
+export const getSnapshotDownload = internalQuery({
+  args: { projectId: v.id("projects") },
+  handler: async (ctx, args) => {
+    const snapshot = await ctx.db
+      .query("insightSnapshots")
+      .withIndex("by_project", (q) => q.eq("projectId", args.projectId))
+      .first();
+
+    if (!snapshot) return null;
+
+    const segmentUrls: Record<string, string | null> = {};
+    for (const segmentId of snapshot.segmentIds) {
+      segmentUrls[segmentId] = await ctx.storage.getUrl(segmentId);
+    }
+
+    return {
+      projectId: snapshot.projectId,
+      watermark: snapshot.watermark,
+      rowCount: snapshot.rowCount,
+      manifestUrl: await ctx.storage.getUrl(snapshot.manifestId),
+      segmentUrls,
+    };
+  },
+});
+
+// Project if the given user may export it (same rules as projects.get) (internal)
+export const getExportableProject = internalQuery({
+  args: {
+    projectId: v.id("projects"),
+    userId: v.union(v.id("users"), v.null()),
+  },
+  handler: async (ctx, args) => {
+    const project = await ctx.db.get(args.projectId);
+    if (!project) return null;
+
+    // Legacy projects (no userId) stay accessible; owned projects only to their owner
+    if (project.userId && project.userId !== args.userId) return null;
+
+    return project;
+  },
+});
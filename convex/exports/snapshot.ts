@@ -0,0 +1,145 @@
+"use node";
+
+import { v } from "convex/values";
+import { internalAction } from "../_generated/server";
+import { internal } from "../_generated/api";
+import { Id } from "../_generated/dataModel";
+import {
+  SEGMENT_MAX_ROWS,
+  SnapshotManifest,
+  SnapshotRow,
+  emptyManifest,
+  encodeSegment,
+} from "./columnar";
+
+// Insights read per query while building a snapshot
+const PAGE_SIZE = 1000;
+
+// Insights newer than this are left for the next append, so rows still being
+// committed with a slightly older analyzedAt are not skipped by the watermark
+const WATERMARK_LAG_MS = 60 * 1000;
+
+type SnapshotResult = { rowsAdded: number; rowCount: number; segments: number; watermark: number; saved: boolean };
+
+// Build or extend a project's columnar insight snapshot (internal)
+// Appends the insights analyzed since the last watermark as a new segment;
+// rebuild: true starts over (e.g. after insights were deleted)
+// Usage: npx convex run exports/snapshot:buildInsightSnapshot '{"projectId": "..."}'
+export const buildInsightSnapshot = internalAction({
+  args: {
+    projectId: v.id("projects"),
+    rebuild: v.optional(v.boolean()),
+  },
+  handler: async (ctx, args): Promise<SnapshotResult> => {
+    const existing = await ctx.runQuery(internal.exports.queries.getSnapshot, {
+      projectId: args.projectId,
+    });
+
+    let manifest: SnapshotManifest = emptyManifest(args.projectId);
+    if (existing && !args.rebuild) {
+      const blob = await ctx.storage.get(existing.manifestId);
+      if (blob) manifest = JSON.parse(await blob.text());
+    }
+
+    const upTo = Date.now() - WATERMARK_LAG_MS;
+    const created: Id<"_storage">[] = [];
+    let rowsAdded = 0;
+    let pending: SnapshotRow[] = [];
+
+    const flush = async () => {
+      if (pending.length === 0) return;
+      const { bytes, columns } = encodeSegment(pending, manifest.dictionaries);
+      const storageId = await ctx.storage.store(new Blob([bytes], { type: "application/octet-stream" }));
+      created.push(storageId);
+      manifest.segments.push({
+        storageId,
+        rowCount: pending.length,
+        minAnalyzedAt: pending[0].analyzedAt,
+        maxAnalyzedAt: pending[pending.length - 1].analyzedAt,
+        byteLength: bytes.byteLength,
+        columns,
+      });
+      manifest.rowCount += pending.length;
+      manifest.watermark = pending[pending.length - 1].analyzedAt;
+      rowsAdded += pending.length;
+      pending = [];
+    };
+
+    // Stream pages into segments so memory stays bounded by SEGMENT_MAX_ROWS
+    let cursor: string | null = null;
+    let isDone = false;
+    const after = manifest.watermark;
+    while (!isDone) {
+      const result: { page: SnapshotRow[]; isDone: boolean; continueCursor: string } = await ctx.runQuery(
+        internal.exports.queries.exportInsightsPage,
+        { projectId: args.projectId, after, upTo, paginationOpts: { numItems: PAGE_SIZE, cursor } }
+      );
+      pending.push(...result.page);
+      if (pending.length >= SEGMENT_MAX_ROWS) await flush();
+      cursor = result.continueCursor;
+      isDone = result.isDone;
+    }
+    await flush();
+
+    // Nothing new and the snapshot already exists
+    if (rowsAdded === 0 && existing && !args.rebuild) {
+      return {
+        rowsAdded: 0,
+        rowCount: existing.rowCount,
+        segments: existing.segmentIds.length,
+        watermark: existing.watermark,
+        saved: false,
+      };
+    }
+
+    manifest.createdAt = Date.now();
+    const manifestId = await ctx.storage.store(
+      new Blob([JSON.stringify(manifest)], { type: "application/json" })
+    );
+    created.push(manifestId);
+
+    const saved = await ctx.runMutation(internal.exports.mutations.saveSnapshot, {
+      projectId: args.projectId,
+      previousManifestId: existing?.manifestId,
+      manifestId,
+      segmentIds: manifest.segments.map((segment) => segment.storageId as Id<"_storage">),
+      watermark: manifest.watermark,
+      rowCount: manifest.rowCount,
+    });
+
+    if (!saved) {
+      // A concurrent build won; drop the files this one wrote
+      for (const storageId of created) {
+        await ctx.storage.delete(storageId);
+      }
+    }
+
+    return {
+      rowsAdded,
+      rowCount: manifest.rowCount,
+      segments: manifest.segments.length,
+      watermark: manifest.watermark,
+      saved,
+    };
+  },
+});
+
+// Append new insights to every existing snapshot (called by cron)
+export const refreshSnapshots = internalAction({
+  args: {},
+  handler: async (ctx): Promise<{ projects: number; rowsAdded: number }> => {
+    const projectIds = await ctx.runQuery(internal.exports.queries.listSnapshotProjects, {});
+
+    let rowsAdded = 0;
+    for (const projectId of projectIds) {
+      try {
+        const result = await ctx.runAction(internal.exports.snapshot.buildInsightSnapshot, { projectId });
+        rowsAdded += result.rowsAdded;
+      } catch (error) {
+        console.error(`Snapshot refresh failed for project ${projectId}:`, error);
+      }
+    }
+
+    return { projects: projectIds.length, rowsAdded };
+  },
+});
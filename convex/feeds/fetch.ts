@@ -4,6 +4,7 @@ import { v } from "convex/values";
 import { action, internalAction } from "../_generated/server";
 import { internal } from "../_generated/api";
 import { fetchFeed } from "./parser";
+import { Tracer } from "../tracing";
 
 // Result types
 type FetchResult = { success: boolean; itemsAdded: number; skippedOld: number; skippedLimit: number; error?: string };
@@ -19,6 +20,7 @@ const MAX_ITEMS_PER_FEED = 100;
 export const fetchSource = internalAction({
   args: {
     sourceId: v.id("sources"),
+    dueAt: v.optional(v.number()), // Scheduled time, for the schedule-lag span
   },
   handler: async (ctx, args): Promise<FetchResult> => {
     // Get the source
@@ -34,10 +36,23 @@ export const fetchSource = internalAction({
       return { success: false, itemsAdded: 0, skippedOld: 0, skippedLimit: 0, error: "Source is not active" };
     }
 
+    const startedAt = Date.now();
+    const trace = new Tracer({ projectId: source.projectId, sourceId: source._id });
+    if (args.dueAt !== undefined) {
+      trace.record("schedule", args.dueAt, startedAt - args.dueAt);
+    }
+
     try {
       // Fetch and parse the feed (more retries for Reddit due to rate limiting)
+      // Conditional request when the source has validators from a previous fetch
       const isReddit = source.feedUrl.includes("reddit.com");
-      const feed = await fetchFeed(source.feedUrl, isReddit ? 2 : 1);
+      const feed = await fetchFeed(source.feedUrl, isReddit ? 2 : 1, {
+        etag: source.fetchStats?.etag,
+        lastModified: source.fetchStats?.lastModified,
+      });
+      const latencyMs = Date.now() - startedAt;
+      trace.record("http_fetch", startedAt, feed.timing?.httpMs ?? latencyMs);
+      trace.record("parse", startedAt + latencyMs, feed.timing?.parseMs ?? 0, { count: feed.items.length });
 
       // Calculate cutoff date (items older than MAX_ITEM_AGE_DAYS are skipped)
       const cutoffDate = Date.now() - (MAX_ITEM_AGE_DAYS * 24 * 60 * 60 * 1000);
@@ -47,6 +62,9 @@ export const fetchSource = internalAction({
       let skippedOld = 0;
       let skippedLimit = 0;
       let processedCount = 0;
+      const insertStartedAt = Date.now();
+      let dedupMs = 0;
+      let insertMs = 0;
       
       for (const item of feed.items) {
         // Safety limit: stop processing if we've hit the max items per feed
@@ -63,6 +81,7 @@ export const fetchSource = internalAction({
           continue;
         }
 
+        const callStartedAt = Date.now();
         const wasInserted = await ctx.runMutation(internal.feeds.mutations.insertFeedItem, {
           sourceId: args.sourceId,
           externalId: item.id,
@@ -75,19 +94,49 @@ export const fetchSource = internalAction({
 
         if (wasInserted) {
           itemsAdded++;
+          insertMs += Date.now() - callStartedAt;
+        } else {
+          dedupMs += Date.now() - callStartedAt;
         }
         processedCount++;
       }
 
-      // Update last fetched timestamp
-      await ctx.runMutation(internal.feeds.mutations.updateSourceLastFetched, {
+      const checked = processedCount - skippedOld;
+      if (checked > itemsAdded) {
+        trace.record("dedup", insertStartedAt, dedupMs, { count: checked - itemsAdded });
+      }
+      if (itemsAdded > 0) {
+        trace.record("insert", insertStartedAt, insertMs, { count: itemsAdded });
+      }
+
+      // Record the outcome (also updates last fetched timestamp and next-due stats)
+      await ctx.runMutation(internal.feeds.mutations.recordFetchOutcome, {
         sourceId: args.sourceId,
+        outcome: itemsAdded > 0 ? "new_items" : "unchanged",
+        itemsAdded,
+        latencyMs,
+        etag: feed.etag,
+        lastModified: feed.lastModified,
       });
+      await trace.flush(ctx);
 
       return { success: true, itemsAdded, skippedOld, skippedLimit };
     } catch (error) {
       const errorMessage = error instanceof Error ? error.message : "Unknown error";
       console.error(`Error fetching source ${args.sourceId}:`, errorMessage);
+      if (!trace.spans.some((span) => span.stage === "http_fetch")) {
+        trace.record("http_fetch", startedAt, Date.now() - startedAt, { ok: false });
+      }
+      await trace.flush(ctx);
+
+      // Failures feed the scheduler's backoff
+      await ctx.runMutation(internal.feeds.mutations.recordFetchOutcome, {
+        sourceId: args.sourceId,
+        outcome: errorMessage.startsWith("Rate limited") ? "rate_limited" : "error",
+        itemsAdded: 0,
+        latencyMs: Date.now() - startedAt,
+      });
+
       return { success: false, itemsAdded: 0, skippedOld: 0, skippedLimit: 0, error: errorMessage };
     }
   },
@@ -107,7 +156,7 @@ function shuffleArray<T>(array: T[]): T[] {
 }
 
 // Max Reddit sources to fetch per cycle (to avoid rate limiting)
-const MAX_REDDIT_SOURCES_PER_FETCH = 3;
+export const MAX_REDDIT_SOURCES_PER_FETCH = 3;
 
 // Fetch all active sources (ignores per-project intervals)
 export const fetchAllSources = internalAction({
@@ -171,109 +220,6 @@ export const fetchAllSources = internalAction({
   },
 });
 
-// Fetch sources respecting per-project fetch intervals
-export const fetchSourcesWithInterval = internalAction({
-  args: {},
-  handler: async (ctx): Promise<FetchAllResult> => {
-    // Get all active sources with their project's fetch interval
-    const sources = await ctx.runQuery(
-      internal.feeds.queries.listActiveSourcesWithInterval,
-      {}
-    );
-
-    const now = Date.now();
-    let successful = 0;
-    let totalItemsAdded = 0;
-    let fetchedCount = 0;
-
-    // Filter sources that are due for fetching
-    const dueSources = sources.filter(source => {
-      if (source.projectFetchInterval === 0) return false;
-      const intervalMs = source.projectFetchInterval * 60 * 1000;
-      const lastFetched = source.lastFetched || 0;
-      return (now - lastFetched) >= intervalMs;
-    });
-
-    // Separate Reddit from others and shuffle for rotation
-    const redditSources = shuffleArray(dueSources.filter(s => s.feedUrl.includes("reddit.com")));
-    const otherSources = shuffleArray(dueSources.filter(s => !s.feedUrl.includes("reddit.com")));
-    
-    // Limit Reddit sources per fetch cycle
-    const redditToFetch = redditSources.slice(0, MAX_REDDIT_SOURCES_PER_FETCH);
-    
-    console.log(`Interval fetch: ${otherSources.length} non-Reddit + ${redditToFetch.length}/${redditSources.length} Reddit sources (randomized)`);
-
-    // Track projects to check stop status (avoid repeated queries for same project)
-    const projectStopStatus = new Map<string, boolean>();
-    
-    // Helper to check if a project has requested stop
-    const isProjectStopping = async (projectId: string): Promise<boolean> => {
-      if (projectStopStatus.has(projectId)) {
-        return projectStopStatus.get(projectId)!;
-      }
-      const project = await ctx.runQuery(internal.feeds.queries.getProject, {
-        id: projectId as any, // Cast needed for Id type
-      });
-      const isStopping = project?.fetchStatus === "stopping";
-      projectStopStatus.set(projectId, isStopping);
-      return isStopping;
-    };
-
-    // Fetch non-Reddit sources first (shuffled order)
-    for (let i = 0; i < otherSources.length; i++) {
-      const source = otherSources[i];
-      
-      // Check if this project has requested stop
-      if (await isProjectStopping(source.projectId)) {
-        console.log(`Skipping source ${source.name} - project requested stop`);
-        continue;
-      }
-      
-      if (i > 0) await delayInternal(200);
-
-      fetchedCount++;
-      const result = await ctx.runAction(internal.feeds.fetch.fetchSource, {
-        sourceId: source._id,
-      });
-
-      if (result.success) {
-        successful++;
-        totalItemsAdded += result.itemsAdded;
-      }
-    }
-
-    // Fetch limited Reddit sources with longer delays
-    for (let i = 0; i < redditToFetch.length; i++) {
-      const source = redditToFetch[i];
-      
-      // Check if this project has requested stop
-      if (await isProjectStopping(source.projectId)) {
-        console.log(`Skipping Reddit source ${source.name} - project requested stop`);
-        continue;
-      }
-      
-      // 8-12 seconds between Reddit requests to avoid rate limiting
-      await delayInternal(8000 + Math.random() * 4000);
-
-      fetchedCount++;
-      const result = await ctx.runAction(internal.feeds.fetch.fetchSource, {
-        sourceId: source._id,
-      });
-
-      if (result.success) {
-        successful++;
-        totalItemsAdded += result.itemsAdded;
-      }
-    }
-
-    return {
-      total: fetchedCount,
-      successful,
-      itemsAdded: totalItemsAdded,
-    };
-  },
-});
-
 // Public action to manually trigger a source fetch
 export const triggerFetch = action({
   args: {
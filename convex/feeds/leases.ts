@@ -0,0 +1,198 @@
+import { v } from "convex/values";
+import { internalMutation, MutationCtx } from "../_generated/server";
+import { internal } from "../_generated/api";
+import { Id } from "../_generated/dataModel";
+import { SHARD_COUNT, assignSourceShard, shardClaimOrder } from "./sharding";
+
+// A lease not heartbeated within this window is considered abandoned
+// (must exceed the slowest single fetchSource call, including Reddit retries)
+export const LEASE_TTL_MS = 3 * 60 * 1000;
+
+// Default number of workers started per fetch cycle (override with FETCH_WORKERS)
+const DEFAULT_FETCH_WORKERS = 4;
+
+// Sources created before shards were stored, assigned per cycle
+const SHARD_BACKFILL_BATCH = 200;
+
+// Start a fetch cycle: schedule workers that claim shard leases (called by cron)
+export const dispatchFetchWorkers = internalMutation({
+  args: {},
+  handler: async (ctx) => {
+    const workerCount = Math.max(1, Number(process.env.FETCH_WORKERS) || DEFAULT_FETCH_WORKERS);
+    const cycleStartedAt = Date.now();
+
+    // Shard queries only see sources with a stored shard
+    const unsharded = await ctx.db
+      .query("sources")
+      .withIndex("by_active_shard", (q) => q.eq("active", true).eq("shard", undefined))
+      .take(SHARD_BACKFILL_BATCH);
+    for (const source of unsharded) {
+      await assignSourceShard(ctx, source._id, source.feedUrl);
+    }
+
+    for (let i = 0; i < workerCount; i++) {
+      await ctx.scheduler.runAfter(0, internal.feeds.workers.runFetchWorker, {
+        workerId: `worker-${cycleStartedAt}-${i}`,
+        cycleStartedAt,
+      });
+    }
+    return workerCount;
+  },
+});
+
+// Claim the first free shard not yet completed this cycle. When none is free,
+// shard is null and retryAt is the earliest expiry of a lease still held on an
+// unfinished shard (null when every shard is done), so a dead holder's shard is
+// picked up once its lease lapses.
+export const claimShardLease = internalMutation({
+  args: {
+    workerId: v.string(),
+    cycleStartedAt: v.number(),
+  },
+  handler: async (ctx, args): Promise<{ shard: number | null; retryAt: number | null }> => {
+    const now = Date.now();
+    let retryAt: number | null = null;
+
+    for (const shard of shardClaimOrder(args.workerId, SHARD_COUNT)) {
+      const lease = await ctx.db
+        .query("fetchLeases")
+        .withIndex("by_shard", (q) => q.eq("shard", shard))
+        .first();
+
+      if (!lease) {
+        await ctx.db.insert("fetchLeases", {
+          shard,
+          workerId: args.workerId,
+          expiresAt: now + LEASE_TTL_MS,
+          cycleStartedAt: args.cycleStartedAt,
+          lastCompletedAt: 0,
+          stopRequested: false,
+          stoppedProjects: [],
+        });
+        return { shard, retryAt: null };
+      }
+
+      // Already done for this cycle, or held by a live worker
+      if (lease.lastCompletedAt >= args.cycleStartedAt) continue;
+      if (lease.workerId !== undefined && lease.expiresAt > now) {
+        retryAt = retryAt === null ? lease.expiresAt : Math.min(retryAt, lease.expiresAt);
+        continue;
+      }
+
+      // Free or expired (dead worker) - take it over
+      await ctx.db.patch(lease._id, {
+        workerId: args.workerId,
+        expiresAt: now + LEASE_TTL_MS,
+        cycleStartedAt: args.cycleStartedAt,
+        stopRequested: false,
+        stoppedProjects: [],
+      });
+      return { shard, retryAt: null };
+    }
+
+    return { shard: null, retryAt };
+  },
+});
+
+// Extend a held lease and report stop requests to the holder
+export const heartbeatShardLease = internalMutation({
+  args: {
+    shard: v.number(),
+    workerId: v.string(),
+  },
+  handler: async (ctx, args) => {
+    const lease = await ctx.db
+      .query("fetchLeases")
+      .withIndex("by_shard", (q) => q.eq("shard", args.shard))
+      .first();
+
+    // Lease expired and was reassigned to another worker
+    if (!lease || lease.workerId !== args.workerId) {
+      return { held: false, stopRequested: true, stoppedProjects: [] };
+    }
+
+    await ctx.db.patch(lease._id, { expiresAt: Date.now() + LEASE_TTL_MS });
+    return {
+      held: true,
+      stopRequested: lease.stopRequested,
+      stoppedProjects: lease.stoppedProjects,
+    };
+  },
+});
+
+// Release a lease, marking the shard done for this cycle if it was fully processed
+export const releaseShardLease = internalMutation({
+  args: {
+    shard: v.number(),
+    workerId: v.string(),
+    completed: v.boolean(),
+  },
+  handler: async (ctx, args) => {
+    const lease = await ctx.db
+      .query("fetchLeases")
+      .withIndex("by_shard", (q) => q.eq("shard", args.shard))
+      .first();
+
+    if (!lease || lease.workerId !== args.workerId) return;
+
+    await ctx.db.patch(lease._id, {
+      workerId: undefined,
+      expiresAt: 0,
+      lastCompletedAt: args.completed ? Date.now() : lease.lastCompletedAt,
+      stopRequested: false,
+      stoppedProjects: [],
+    });
+  },
+});
+
+// Ask every running worker to release its lease and exit (operator kill switch,
+// e.g. before a deploy or while a feed host is failing)
+// Usage: npx convex run feeds/leases:stopFetchWorkers
+export const stopFetchWorkers = internalMutation({
+  args: {},
+  handler: async (ctx) => {
+    const leases = await ctx.db.query("fetchLeases").collect();
+    const now = Date.now();
+    let stopped = 0;
+
+    for (const lease of leases) {
+      if (lease.workerId !== undefined && lease.expiresAt > now) {
+        await ctx.db.patch(lease._id, { stopRequested: true });
+        stopped++;
+      }
+    }
+    return stopped;
+  },
+});
+
+// Tell workers holding live leases on the project's shards to skip its remaining
+// sources; returns the number of workers notified
+export async function propagateProjectStop(
+  ctx: MutationCtx,
+  projectId: Id<"projects">
+): Promise<number> {
+  const sources = await ctx.db
+    .query("sources")
+    .withIndex("by_project", (q) => q.eq("projectId", projectId))
+    .collect();
+  const shards = new Set(
+    sources.filter((source) => source.active && source.shard !== undefined).map((source) => source.shard)
+  );
+  if (shards.size === 0) return 0;
+
+  const leases = await ctx.db.query("fetchLeases").collect();
+  const now = Date.now();
+  let notified = 0;
+
+  for (const lease of leases) {
+    if (!shards.has(lease.shard)) continue;
+    if (lease.workerId === undefined || lease.expiresAt <= now) continue;
+    if (!lease.stoppedProjects.includes(projectId)) {
+      await ctx.db.patch(lease._id, {
+        stoppedProjects: [...lease.stoppedProjects, projectId],
+      });
+    }
+    notified++;
+  }
+  return notified;
+}
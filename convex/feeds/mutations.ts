@@ -1,5 +1,11 @@
 import { v } from "convex/values";
 import { internalMutation } from "../_generated/server";
+import { analysisUsageValidator, fetchOutcomeValidator } from "../schema";
+import { updateFetchStats } from "./scheduler";
+import { resolveTermIds } from "../vocabulary/terms";
+
+// Fetch history retention (used by the scheduler simulator)
+const FETCH_HISTORY_DAYS = 14;
 
 // Insert a feed item (with deduplication) - internal
 export const insertFeedItem = internalMutation({
@@ -42,22 +48,87 @@ export const insertFeedItem = internalMutation({
   },
 });
 
-// Update source last fetched timestamp - internal
-export const updateSourceLastFetched = internalMutation({
-  args: { sourceId: v.id("sources") },
+// Record a fetch attempt and update the source's scheduling stats - internal
+export const recordFetchOutcome = internalMutation({
+  args: {
+    sourceId: v.id("sources"),
+    outcome: fetchOutcomeValidator,
+    itemsAdded: v.number(),
+    latencyMs: v.number(),
+    etag: v.optional(v.string()),
+    lastModified: v.optional(v.string()),
+  },
   handler: async (ctx, args) => {
-    await ctx.db.patch(args.sourceId, { lastFetched: Date.now() });
+    const source = await ctx.db.get(args.sourceId);
+    if (!source) return;
+
+    const now = Date.now();
+    const fetchStats = updateFetchStats(source.fetchStats, {
+      outcome: args.outcome,
+      itemsAdded: args.itemsAdded,
+      latencyMs: args.latencyMs,
+      at: now,
+      etag: args.etag,
+      lastModified: args.lastModified,
+    });
+
+    // lastFetched keeps meaning "last successful fetch"
+    const failed = args.outcome === "error" || args.outcome === "rate_limited";
+    await ctx.db.patch(args.sourceId, failed ? { fetchStats } : { fetchStats, lastFetched: now });
+
+    await ctx.db.insert("sourceFetches", {
+      sourceId: args.sourceId,
+      projectId: source.projectId,
+      fetchedAt: now,
+      outcome: args.outcome,
+      itemsAdded: args.itemsAdded,
+      latencyMs: Math.round(args.latencyMs),
+    });
+  },
+});
+
+// Delete fetch history older than the retention window - internal
+export const pruneFetchHistory = internalMutation({
+  args: {},
+  handler: async (ctx) => {
+    const cutoff = Date.now() - FETCH_HISTORY_DAYS * 24 * 60 * 60 * 1000;
+    const old = await ctx.db
+      .query("sourceFetches")
+      .withIndex("by_fetchedAt", (q) => q.lt("fetchedAt", cutoff))
+      .take(1000);
+
+    for (const entry of old) {
+      await ctx.db.delete(entry._id);
+    }
+    return old.length;
   },
 });
 
 // Mark feed item as analyzed - internal
 export const markItemAnalyzed = internalMutation({
-  args: { feedItemId: v.id("feedItems") },
+  args: {
+    feedItemId: v.id("feedItems"),
+  },
   handler: async (ctx, args) => {
     await ctx.db.patch(args.feedItemId, { analyzed: true });
   },
 });
 
+// Record token accounting for a Gemini call, whether or not its response parses - internal
+export const recordAnalysisUsage = internalMutation({
+  args: {
+    feedItemId: v.id("feedItems"),
+    usage: analysisUsageValidator,
+  },
+  handler: async (ctx, args) => {
+    await ctx.db.insert("analysisUsage", {
+      ...args.usage,
+      feedItemId: args.feedItemId,
+      createdAt: Date.now(),
+    });
+  },
+});
+
 // Set project fetch status - internal
 export const setProjectFetchStatus = internalMutation({
   args: {
@@ -95,8 +166,12 @@ export const createInsight = internalMutation({
     feedItemPublishedAt: v.number(),
   },
   handler: async (ctx, args) => {
+    // Model output is stored as canonical term IDs
+    const { entities, themes, ...fields } = args;
     const insightId = await ctx.db.insert("insights", {
-      ...args,
+      ...fields,
+      entityIds: await resolveTermIds(ctx, args.projectId, "entity", entities),
+      themeIds: await resolveTermIds(ctx, args.projectId, "theme", themes),
       analyzedAt: Date.now(),
     });
     return insightId;
@@ -4,6 +4,12 @@
 // Safety limits for parsing
 const MAX_REGEX_ITERATIONS = 10000;
 const FETCH_TIMEOUT_MS = 15000; // 15 seconds timeout (reduced for faster demo)
+const PROBE_TIMEOUT_MS = 8000; // Single attempt when validating suggested feeds
+
+// Reddit blocks non-browser agents on its RSS endpoints
+const BROWSER_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36";
+const BOT_USER_AGENT = "Mozilla/5.0 (compatible; ProductPulse/1.0; +https://productpulse.app)";
+const FEED_ACCEPT = "application/rss+xml, application/xml, text/xml, application/atom+xml, text/html, */*";
 
 export interface FeedItem {
   id: string;
@@ -17,6 +23,16 @@ export interface FeedItem {
 export interface ParsedFeed {
   title: string;
   items: FeedItem[];
+  notModified?: boolean; // Server answered 304 to a conditional request
+  etag?: string;
+  lastModified?: string;
+  timing?: { httpMs: number; parseMs: number }; // Set by fetchFeed for tracing
+}
+
+// Cache validators from a previous response, sent as conditional request headers
+export interface FeedValidators {
+  etag?: string;
+  lastModified?: string;
 }
 
 // Helper to decode HTML entities
@@ -183,7 +199,11 @@ export function parseFeed(xml: string): ParsedFeed {
 const sleep = (ms: number) => new Promise(resolve => setTimeout(resolve, ms));
 
 // Fetch and parse a feed URL with retry logic for rate limiting
-export async function fetchFeed(url: string, retries = 1): Promise<ParsedFeed> {
+export async function fetchFeed(
+  url: string,
+  retries = 1,
+  validators: FeedValidators = {}
+): Promise<ParsedFeed> {
   let lastError: Error | null = null;
   const isReddit = url.includes("reddit.com");
   
@@ -199,14 +219,15 @@ export async function fetchFeed(url: string, retries = 1): Promise<ParsedFeed> {
         await sleep(2000 + Math.random() * 2000);
       }
 
+      const requestStartedAt = Date.now();
       const response = await fetch(url, {
         headers: {
           // Use a realistic browser User-Agent for Reddit
-          "User-Agent": isReddit 
-            ? "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-            : "Mozilla/5.0 (compatible; ProductPulse/1.0; +https://productpulse.app)",
-          "Accept": "application/rss+xml, application/xml, text/xml, application/atom+xml, text/html, */*",
+          "User-Agent": isReddit ? BROWSER_USER_AGENT : BOT_USER_AGENT,
+          "Accept": FEED_ACCEPT,
           "Accept-Language": "en-US,en;q=0.9",
+          ...(validators.etag ? { "If-None-Match": validators.etag } : {}),
+          ...(validators.lastModified ? { "If-Modified-Since": validators.lastModified } : {}),
         },
         signal: controller.signal, // Add abort signal for timeout
       });
@@ -224,12 +245,25 @@ export async function fetchFeed(url: string, retries = 1): Promise<ParsedFeed> {
         continue; // Go to next retry attempt
       }
 
+      // Feed unchanged since the validators were issued
+      if (response.status === 304) {
+        const httpMs = Date.now() - requestStartedAt;
+        return { title: "", items: [], notModified: true, ...validators, timing: { httpMs, parseMs: 0 } };
+      }
+
       if (!response.ok) {
         throw new Error(`Failed to fetch feed: ${response.status} ${response.statusText}`);
       }
 
       const xml = await response.text();
-      return parseFeed(xml);
+      const parseStartedAt = Date.now();
+      const parsed = parseFeed(xml);
+      return {
+        ...parsed,
+        etag: response.headers.get("etag") ?? undefined,
+        lastModified: response.headers.get("last-modified") ?? undefined,
+        timing: { httpMs: parseStartedAt - requestStartedAt, parseMs: Date.now() - parseStartedAt },
+      };
     } catch (error) {
       // Clear timeout on error
       clearTimeout(timeoutId);
@@ -266,3 +300,113 @@ export async function fetchFeed(url: string, retries = 1): Promise<ParsedFeed> {
 
   throw lastError || new Error("Failed to fetch feed after retries");
 }
+
+// Measured health of a feed's first page (see probeFeed)
+export interface FeedProbe {
+  feedUrl: string;
+  ok: boolean | null; // null when the probe failed in a way that says nothing about the feed
+  status?: number;
+  error?: string;
+  itemCount: number;
+  itemsPerDay: number;
+  newestAgeHours?: number;
+  yieldScore: number;
+  latencyMs: number;
+  checkedAt: number;
+}
+
+const HOUR_MS = 60 * 60 * 1000;
+const DAY_MS = 24 * HOUR_MS;
+
+// Posting rate and freshness from the dated items of one page. Items without a
+// date are parsed as "now" and would look infinitely fresh, so they are ignored.
+export function measureFeed(items: FeedItem[], now: number): Pick<FeedProbe, "itemsPerDay" | "newestAgeHours" | "yieldScore"> {
+  const dates = items
+    .map((item) => item.pubDate.getTime())
+    .filter((t) => t < now - 1000)
+    .sort((a, b) => b - a);
+  if (dates.length === 0) {
+    return { itemsPerDay: 0, yieldScore: 0 };
+  }
+
+  const newest = dates[0];
+  const spanMs = Math.max(HOUR_MS, newest - dates[dates.length - 1]);
+  // A single dated item only tells us one post per "time since it appeared"
+  const itemsPerDay = dates.length > 1
+    ? ((dates.length - 1) * DAY_MS) / spanMs
+    : DAY_MS / Math.max(DAY_MS, now - newest);
+  const ageDays = (now - newest) / DAY_MS;
+
+  return {
+    itemsPerDay: Math.round(itemsPerDay * 100) / 100,
+    newestAgeHours: Math.round(((now - newest) / HOUR_MS) * 10) / 10,
+    // Expected new items per day, halved for every week the feed has been quiet
+    yieldScore: Math.round(itemsPerDay * Math.pow(0.5, ageDays / 7) * 100) / 100,
+  };
+}
+
+// HTTP statuses that mean the feed itself is gone; anything else may be temporary
+const DEAD_FEED_STATUSES = [404, 410];
+
+// Fetch and measure one page of a feed without retries or rate-limit waits, for
+// validating suggested sources before they are added. Only a missing feed
+// (404/410), an unparseable page or an empty feed is ok: false; rate limits,
+// server errors, timeouts and network errors are ok: null.
+export async function probeFeed(url: string): Promise<FeedProbe> {
+  const startedAt = Date.now();
+  const failed = (ok: false | null, error: string, status?: number): FeedProbe => ({
+    feedUrl: url,
+    ok,
+    status,
+    error,
+    itemCount: 0,
+    itemsPerDay: 0,
+    yieldScore: 0,
+    latencyMs: Date.now() - startedAt,
+    checkedAt: startedAt,
+  });
+
+  const controller = new AbortController();
+  const timeoutId = setTimeout(() => controller.abort(), PROBE_TIMEOUT_MS);
+  try {
+    const response = await fetch(url, {
+      headers: {
+        "User-Agent": url.includes("reddit.com") ? BROWSER_USER_AGENT : BOT_USER_AGENT,
+        "Accept": FEED_ACCEPT,
+        "Accept-Language": "en-US,en;q=0.9",
+      },
+      signal: controller.signal,
+    });
+    if (!response.ok) {
+      const dead = DEAD_FEED_STATUSES.includes(response.status);
+      return failed(dead ? false : null, `${response.status} ${response.statusText}`.trim(), response.status);
+    }
+
+    const text = await response.text();
+    let feed: ParsedFeed;
+    try {
+      feed = parseFeed(text);
+    } catch (error) {
+      return failed(false, error instanceof Error ? error.message : String(error), response.status);
+    }
+    if (feed.items.length === 0) {
+      return failed(false, "No feed items found", response.status);
+    }
+    return {
+      feedUrl: url,
+      ok: true,
+      status: response.status,
+      itemCount: feed.items.length,
+      ...measureFeed(feed.items, startedAt),
+      latencyMs: Date.now() - startedAt,
+      checkedAt: startedAt,
+    };
+  } catch (error) {
+    if (error instanceof Error && error.name === "AbortError") {
+      return failed(null, `Timeout after ${PROBE_TIMEOUT_MS / 1000} seconds`);
+    }
+    return failed(null, error instanceof Error ? error.message : String(error));
+  } finally {
+    clearTimeout(timeoutId);
+  }
+}
@@ -61,27 +61,29 @@ export const feedItemExists = internalQuery({
   },
 });
 
-// Get active sources with their project's fetch interval (internal)
-export const listActiveSourcesWithInterval = internalQuery({
-  args: {},
-  handler: async (ctx) => {
-    const sources = await ctx.db
+// Get active sources in one shard with their project's fetch interval (internal - fetch workers)
+export const listActiveSourcesForShard = internalQuery({
+  args: { shard: v.number() },
+  handler: async (ctx, args) => {
+    // Reads only this shard's sources (shard is stored on insert, see assignSourceShard)
+    const shardSources = await ctx.db
       .query("sources")
-      .withIndex("by_active", (q) => q.eq("active", true))
+      .withIndex("by_active_shard", (q) => q.eq("active", true).eq("shard", args.shard))
       .collect();
 
-    // Get project fetch intervals
-    const sourcesWithInterval = await Promise.all(
-      sources.map(async (source) => {
+    // Get project fetch intervals (once per project)
+    const intervals = new Map<string, number>();
+    for (const source of shardSources) {
+      if (!intervals.has(source.projectId)) {
         const project = await ctx.db.get(source.projectId);
-        return {
-          ...source,
-          projectFetchInterval: project?.fetchInterval ?? 15, // Default 15 minutes
-        };
-      })
-    );
+        intervals.set(source.projectId, project?.fetchInterval ?? 15); // Default 15 minutes
+      }
+    }
 
-    return sourcesWithInterval;
+    return shardSources.map((source) => ({
+      ...source,
+      projectFetchInterval: intervals.get(source.projectId)!,
+    }));
   },
 });
 
@@ -126,3 +128,46 @@ export const getUnanalyzedItemsForProject = internalQuery({
     return projectItems;
   },
 });
+
+// Export recent fetch history grouped by source (internal - input for the scheduler simulator)
+// Usage: npx convex run feeds/queries:exportFetchHistory '{"daysBack": 14}' > history.json
+export const exportFetchHistory = internalQuery({
+  args: { daysBack: v.optional(v.number()) },
+  handler: async (ctx, args) => {
+    const cutoff = Date.now() - (args.daysBack ?? 14) * 24 * 60 * 60 * 1000;
+    const fetches = await ctx.db
+      .query("sourceFetches")
+      .withIndex("by_fetchedAt", (q) => q.gte("fetchedAt", cutoff))
+      .collect();
+
+    const bySource = new Map<string, typeof fetches>();
+    for (const entry of fetches) {
+      const list = bySource.get(entry.sourceId) ?? [];
+      list.push(entry);
+      bySource.set(entry.sourceId, list);
+    }
+
+    const intervals = new Map<string, number>();
+    const history = [];
+    for (const [sourceId, entries] of bySource) {
+      const projectId = entries[0].projectId;
+      if (!intervals.has(projectId)) {
+        const project = await ctx.db.get(projectId);
+        intervals.set(projectId, project?.fetchInterval ?? 15);
+      }
+      history.push({
+        sourceId,
+        projectId,
+        fetchInterval: intervals.get(projectId)!,
+        fetches: entries.map((e) => ({
+          fetchedAt: e.fetchedAt,
+          outcome: e.outcome,
+          itemsAdded: e.itemsAdded,
+          latencyMs: e.latencyMs,
+        })),
+      });
+    }
+
+    return history;
+  },
+});
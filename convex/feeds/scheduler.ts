@@ -0,0 +1,131 @@
+// Adaptive per-source fetch scheduling
+// Pure helpers shared by the fetch actions and mutations (no Convex imports)
+
+export type FetchOutcome = "new_items" | "unchanged" | "error" | "rate_limited";
+
+export interface SourceFetchStats {
+  fetchCount: number;
+  yieldAvg: number; // Moving average of new items per fetch
+  unchangedRate: number; // Share of fetches returning 304 or only duplicates
+  errorRate: number; // Share of fetches that failed
+  rateLimitRate: number; // Share of fetches that hit a 429
+  latencyAvgMs: number; // Moving average of fetch latency
+  consecutiveFailures: number;
+  lastAttemptAt: number;
+  lastOutcome: FetchOutcome;
+  etag?: string; // Validators for conditional requests
+  lastModified?: string;
+}
+
+export interface FetchSample {
+  outcome: FetchOutcome;
+  itemsAdded: number;
+  latencyMs: number;
+  at: number;
+  etag?: string;
+  lastModified?: string;
+}
+
+// Weight given to the newest sample in moving averages
+const EWMA_ALPHA = 0.3;
+
+// Number of fetches before yield is trusted to stretch or shrink the interval
+const WARMUP_FETCHES = 3;
+
+// New items per fetch that keeps a source on the project's base interval
+const TARGET_ITEMS_PER_FETCH = 3;
+
+// Adaptive interval bounds, relative to the project's fetch interval. Busy
+// sources never poll faster than the configured interval; quiet ones stretch it.
+const MIN_INTERVAL_FACTOR = 1;
+const MAX_INTERVAL_FACTOR = 4;
+
+// Exponential backoff for failing sources
+const MAX_BACKOFF_EXPONENT = 6;
+const MAX_BACKOFF_MS = 48 * 60 * 60 * 1000; // 48 hours
+
+const ewma = (prev: number, sample: number) => prev + EWMA_ALPHA * (sample - prev);
+
+// Fold a fetch result into a source's running statistics
+export function updateFetchStats(
+  prev: SourceFetchStats | undefined,
+  sample: FetchSample
+): SourceFetchStats {
+  const failed = sample.outcome === "error" || sample.outcome === "rate_limited";
+
+  // First sample seeds the averages directly
+  if (!prev) {
+    return {
+      fetchCount: 1,
+      yieldAvg: sample.itemsAdded,
+      unchangedRate: sample.outcome === "unchanged" ? 1 : 0,
+      errorRate: sample.outcome === "error" ? 1 : 0,
+      rateLimitRate: sample.outcome === "rate_limited" ? 1 : 0,
+      latencyAvgMs: sample.latencyMs,
+      consecutiveFailures: failed ? 1 : 0,
+      lastAttemptAt: sample.at,
+      lastOutcome: sample.outcome,
+      etag: sample.etag,
+      lastModified: sample.lastModified,
+    };
+  }
+
+  return {
+    fetchCount: prev.fetchCount + 1,
+    // Failed fetches say nothing about how busy the feed is
+    yieldAvg: failed ? prev.yieldAvg : ewma(prev.yieldAvg, sample.itemsAdded),
+    unchangedRate: ewma(prev.unchangedRate, sample.outcome === "unchanged" ? 1 : 0),
+    errorRate: ewma(prev.errorRate, sample.outcome === "error" ? 1 : 0),
+    rateLimitRate: ewma(prev.rateLimitRate, sample.outcome === "rate_limited" ? 1 : 0),
+    latencyAvgMs: ewma(prev.latencyAvgMs, sample.latencyMs),
+    consecutiveFailures: failed ? prev.consecutiveFailures + 1 : 0,
+    lastAttemptAt: sample.at,
+    lastOutcome: sample.outcome,
+    // Keep the last known validators when a failed fetch returned none
+    etag: failed ? prev.etag : sample.etag ?? prev.etag,
+    lastModified: failed ? prev.lastModified : sample.lastModified ?? prev.lastModified,
+  };
+}
+
+// Interval multiplier derived from observed yield (1 = the project's interval, up to 4x slower)
+export function yieldIntervalFactor(stats: SourceFetchStats | undefined): number {
+  if (!stats || stats.fetchCount < WARMUP_FETCHES) return 1;
+  const factor = TARGET_ITEMS_PER_FETCH / Math.max(stats.yieldAvg, 0.01);
+  return Math.max(MIN_INTERVAL_FACTOR, Math.min(MAX_INTERVAL_FACTOR, factor));
+}
+
+// Timestamp at which a source should next be fetched (null = manual only)
+export function nextDueAt(
+  source: { lastFetched?: number; fetchStats?: SourceFetchStats },
+  intervalMinutes: number
+): number | null {
+  if (intervalMinutes === 0) return null;
+  const intervalMs = intervalMinutes * 60 * 1000;
+  const stats = source.fetchStats;
+
+  // Sources without history keep the plain interval behavior
+  if (!stats) {
+    return (source.lastFetched || 0) + intervalMs;
+  }
+
+  // Failing sources back off exponentially from their last attempt
+  if (stats.consecutiveFailures > 0) {
+    const exponent = Math.min(stats.consecutiveFailures, MAX_BACKOFF_EXPONENT);
+    const backoffMs = Math.min(intervalMs * 2 ** exponent, Math.max(MAX_BACKOFF_MS, intervalMs));
+    return stats.lastAttemptAt + backoffMs;
+  }
+
+  return stats.lastAttemptAt + intervalMs * yieldIntervalFactor(stats);
+}
+
+// Ordering key for due sources: overdue, high-yield sources go first
+export function fetchPriority(
+  source: { lastFetched?: number; fetchStats?: SourceFetchStats },
+  intervalMinutes: number,
+  now: number
+): number {
+  const due = nextDueAt(source, intervalMinutes);
+  if (due === null) return 0;
+  const overdue = Math.max(0, now - due) / (intervalMinutes * 60 * 1000);
+  return (1 + overdue) * (1 + (source.fetchStats?.yieldAvg ?? TARGET_ITEMS_PER_FETCH));
+}
@@ -0,0 +1,80 @@
+// Source partitioning for multi-worker fetching
+// Pure helpers shared by lease mutations, queries and worker actions
+import type { MutationCtx } from "../_generated/server";
+import type { Id } from "../_generated/dataModel";
+
+// Number of shards sources are partitioned into (each shard is leased by one worker)
+export const SHARD_COUNT = 64;
+
+// Reddit sources share one shard so a single worker paces them (rate limiting)
+export const REDDIT_SHARD = 0;
+
+// Virtual nodes per shard on the hash ring (smooths the distribution)
+const VIRTUAL_NODES_PER_SHARD = 32;
+
+// 32-bit FNV-1a hash
+export function hashString(value: string): number {
+  let hash = 0x811c9dc5;
+  for (let i = 0; i < value.length; i++) {
+    hash ^= value.charCodeAt(i);
+    hash = Math.imul(hash, 0x01000193) >>> 0;
+  }
+  return hash >>> 0;
+}
+
+// Sorted ring of [position, shard] points, built once per shard count
+const rings = new Map<number, Array<[number, number]>>();
+
+function getRing(shardCount: number): Array<[number, number]> {
+  let ring = rings.get(shardCount);
+  if (!ring) {
+    ring = [];
+    // Shard 0 is reserved for Reddit, the rest share the ring
+    for (let shard = 1; shard < shardCount; shard++) {
+      for (let node = 0; node < VIRTUAL_NODES_PER_SHARD; node++) {
+        ring.push([hashString(`shard-${shard}-${node}`), shard]);
+      }
+    }
+    ring.sort((a, b) => a[0] - b[0]);
+    rings.set(shardCount, ring);
+  }
+  return ring;
+}
+
+// Shard owning a position: first ring point clockwise from it
+function lookupRing(ring: Array<[number, number]>, position: number): number {
+  let lo = 0;
+  let hi = ring.length;
+  while (lo < hi) {
+    const mid = (lo + hi) >>> 1;
+    if (ring[mid][0] < position) lo = mid + 1;
+    else hi = mid;
+  }
+  return ring[lo % ring.length][1];
+}
+
+// Shard a source belongs to
+export function shardForSource(
+  source: { _id: string; feedUrl: string },
+  shardCount = SHARD_COUNT
+): number {
+  if (source.feedUrl.includes("reddit.com")) return REDDIT_SHARD;
+  return lookupRing(getRing(shardCount), hashString(source._id));
+}
+
+// Store a source's shard so each worker reads only its own sources (by_active_shard)
+export async function assignSourceShard(
+  ctx: MutationCtx,
+  sourceId: Id<"sources">,
+  feedUrl: string
+): Promise<number> {
+  const shard = shardForSource({ _id: sourceId, feedUrl });
+  await ctx.db.patch(sourceId, { shard });
+  return shard;
+}
+
+// Order in which a worker tries to claim shards (spreads workers across the ring)
+export function shardClaimOrder(workerId: string, shardCount = SHARD_COUNT): number[] {
+  const start = hashString(workerId) % shardCount;
+  return Array.from({ length: shardCount }, (_, i) => (start + i) % shardCount);
+}
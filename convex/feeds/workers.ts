@@ -0,0 +1,163 @@
+"use node";
+
+import { v } from "convex/values";
+import { ActionCtx, internalAction } from "../_generated/server";
+import { internal } from "../_generated/api";
+import { MAX_REDDIT_SOURCES_PER_FETCH } from "./fetch";
+import { fetchPriority, nextDueAt } from "./scheduler";
+import { REDDIT_SHARD } from "./sharding";
+
+// Result types
+type ShardResult = { fetched: number; successful: number; itemsAdded: number; completed: boolean; stop: boolean };
+type WorkerResult = { shards: number; fetched: number; successful: number; itemsAdded: number };
+
+// Leave headroom below the 10 minute action limit
+const WORKER_MAX_RUNTIME_MS = 8 * 60 * 1000;
+
+// Longest wait between claims while other workers hold the unfinished shards
+const CLAIM_RETRY_MAX_MS = 30 * 1000;
+
+// Helper to add delay between requests
+const delay = (ms: number) => new Promise(resolve => setTimeout(resolve, ms));
+
+// Fetch the due sources of one leased shard, heartbeating between sources
+async function fetchShard(
+  ctx: ActionCtx,
+  workerId: string,
+  shard: number,
+  deadline: number
+): Promise<ShardResult> {
+  const sources = await ctx.runQuery(internal.feeds.queries.listActiveSourcesForShard, { shard });
+
+  const now = Date.now();
+  const dueSources = sources
+    .filter(source => {
+      const dueAt = nextDueAt(source, source.projectFetchInterval);
+      return dueAt !== null && now >= dueAt;
+    })
+    .sort((a, b) =>
+      fetchPriority(b, b.projectFetchInterval, now) - fetchPriority(a, a.projectFetchInterval, now)
+    );
+
+  // The Reddit shard keeps the per-cycle cap and long delays
+  const isRedditShard = shard === REDDIT_SHARD;
+  const toFetch = isRedditShard ? dueSources.slice(0, MAX_REDDIT_SOURCES_PER_FETCH) : dueSources;
+
+  const result: ShardResult = { fetched: 0, successful: 0, itemsAdded: 0, completed: false, stop: false };
+
+  // Cache project stop status (avoid repeated queries for same project)
+  const projectStopStatus = new Map<string, boolean>();
+
+  for (let i = 0; i < toFetch.length; i++) {
+    const source = toFetch[i];
+
+    // Out of time - leave the rest of the shard for the next cycle
+    if (Date.now() >= deadline) return result;
+
+    // Heartbeat also carries stop requests propagated through the lease
+    const lease = await ctx.runMutation(internal.feeds.leases.heartbeatShardLease, {
+      shard,
+      workerId,
+    });
+    if (!lease.held) {
+      console.warn(`Worker ${workerId} lost lease on shard ${shard}`);
+      return result;
+    }
+    if (lease.stopRequested) {
+      // Stopped shards count as done; remaining sources wait for the next cycle
+      result.stop = true;
+      result.completed = true;
+      return result;
+    }
+    if (lease.stoppedProjects.includes(source.projectId)) {
+      console.log(`Skipping source ${source.name} - project requested stop`);
+      continue;
+    }
+
+    if (!projectStopStatus.has(source.projectId)) {
+      const project = await ctx.runQuery(internal.feeds.queries.getProject, {
+        id: source.projectId,
+      });
+      projectStopStatus.set(source.projectId, project?.fetchStatus === "stopping");
+    }
+    if (projectStopStatus.get(source.projectId)) {
+      console.log(`Skipping source ${source.name} - project requested stop`);
+      continue;
+    }
+
+    if (isRedditShard) {
+      // 8-12 seconds between Reddit requests to avoid rate limiting
+      await delay(8000 + Math.random() * 4000);
+    } else if (i > 0) {
+      await delay(200);
+    }
+
+    result.fetched++;
+    const fetchResult = await ctx.runAction(internal.feeds.fetch.fetchSource, {
+      sourceId: source._id,
+      dueAt: nextDueAt(source, source.projectFetchInterval) ?? undefined,
+    });
+
+    if (fetchResult.success) {
+      result.successful++;
+      result.itemsAdded += fetchResult.itemsAdded;
+    }
+  }
+
+  result.completed = true;
+  return result;
+}
+
+// Fetch worker: claims shard leases until every shard is done for this cycle.
+// While the only unfinished shards are leased, it waits and claims again, so a
+// crashed worker's shard is taken over once its lease expires.
+export const runFetchWorker = internalAction({
+  args: {
+    workerId: v.string(),
+    cycleStartedAt: v.number(),
+  },
+  handler: async (ctx, args): Promise<WorkerResult> => {
+    const deadline = Date.now() + WORKER_MAX_RUNTIME_MS;
+    const totals: WorkerResult = { shards: 0, fetched: 0, successful: 0, itemsAdded: 0 };
+
+    while (Date.now() < deadline) {
+      const { shard, retryAt } = await ctx.runMutation(internal.feeds.leases.claimShardLease, {
+        workerId: args.workerId,
+        cycleStartedAt: args.cycleStartedAt,
+      });
+      if (shard === null) {
+        if (retryAt === null || retryAt >= deadline) break;
+        await delay(Math.min(Math.max(retryAt - Date.now(), 0) + 100, CLAIM_RETRY_MAX_MS));
+        continue;
+      }
+
+      let result: ShardResult = { fetched: 0, successful: 0, itemsAdded: 0, completed: false, stop: false };
+      try {
+        result = await fetchShard(ctx, args.workerId, shard, deadline);
+      } catch (error) {
+        console.error(`Worker ${args.workerId} failed on shard ${shard}:`, error);
+        // Don't hand a failing shard straight back to the next claimer
+        result.completed = true;
+      } finally {
+        // Incomplete shards are picked up again by another worker this cycle
+        await ctx.runMutation(internal.feeds.leases.releaseShardLease, {
+          shard,
+          workerId: args.workerId,
+          completed: result.completed,
+        });
+      }
+
+      totals.shards++;
+      totals.fetched += result.fetched;
+      totals.successful += result.successful;
+      totals.itemsAdded += result.itemsAdded;
+
+      if (result.stop) break;
+    }
+
+    console.log(
+      `Worker ${args.workerId}: ${totals.shards} shards, ${totals.successful}/${totals.fetched} sources, ${totals.itemsAdded} new items`
+    );
+    return totals;
+  },
+});
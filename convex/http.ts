@@ -1,8 +1,13 @@
 import { httpRouter } from "convex/server";
 import { auth } from "./auth";
+import { exportPreflight, streamInsightsCsv } from "./exports/csv";
 
 const http = httpRouter();
 
 auth.addHttpRoutes(http);
 
+// Streamed CSV export (called by the dashboard's export button)
+http.route({ path: "/export/insights.csv", method: "GET", handler: streamInsightsCsv });
+http.route({ path: "/export/insights.csv", method: "OPTIONS", handler: exportPreflight });
+
 export default http;
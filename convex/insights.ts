@@ -1,5 +1,6 @@
 import { v } from "convex/values";
 import { query, mutation } from "./_generated/server";
+import { Vocabulary, resolveTermIds } from "./vocabulary/terms";
 
 const sentimentLabelValidator = v.union(
   v.literal("positive"),
@@ -24,6 +25,7 @@ export const listByProject = query({
     competitorFilter: v.optional(v.string()), // Filter by competitor mention in entities
   },
   handler: async (ctx, args) => {
+    const vocabulary = await Vocabulary.load(ctx, args.projectId);
     let results = await ctx.db
       .query("insights")
       .withIndex("by_project_date", (q) => q.eq("projectId", args.projectId))
@@ -35,18 +37,26 @@ export const listByProject = query({
       results = results.filter((i) => i.sentimentLabel === args.sentimentFilter);
     }
     if (args.themeFilter !== undefined) {
-      const themeToFilter = args.themeFilter;
-      results = results.filter((i) => i.themes.includes(themeToFilter));
+      const themeId = vocabulary.lookup("theme", args.themeFilter);
+      results = results.filter((i) => vocabulary.ids("theme", i).includes(themeId));
     }
     if (args.minRelevance !== undefined && args.minRelevance > 0) {
       const minScore = args.minRelevance;
       results = results.filter((i) => (i.relevanceScore ?? 1) >= minScore);
     }
     if (args.competitorFilter) {
+      // Match each entity label once, then filter on IDs
       const competitor = args.competitorFilter.toLowerCase();
-      results = results.filter((i) => 
-        i.entities.some((e) => e.toLowerCase().includes(competitor))
-      );
+      const matches = new Map<number, boolean>();
+      const isMatch = (id: number) => {
+        let match = matches.get(id);
+        if (match === undefined) {
+          match = vocabulary.label("entity", id).toLowerCase().includes(competitor);
+          matches.set(id, match);
+        }
+        return match;
+      };
+      results = results.filter((i) => vocabulary.ids("entity", i).some(isMatch));
     }
 
     // Apply limit
@@ -54,7 +64,7 @@ export const listByProject = query({
       results = results.slice(0, args.limit);
     }
 
-    return results;
+    return results.map((i) => vocabulary.withLabels(i));
   },
 });
 
@@ -62,10 +72,14 @@ export const listByProject = query({
 export const getByFeedItem = query({
   args: { feedItemId: v.id("feedItems") },
   handler: async (ctx, args) => {
-    return await ctx.db
+    const insight = await ctx.db
       .query("insights")
       .withIndex("by_feedItem", (q) => q.eq("feedItemId", args.feedItemId))
       .first();
+    if (!insight) return null;
+
+    const vocabulary = await Vocabulary.load(ctx, insight.projectId);
+    return vocabulary.withLabels(insight);
   },
 });
 
@@ -95,32 +109,35 @@ export const getStats = query({
       neutral: 0,
     };
 
-    const themeCounts: Record<string, number> = {};
-    const entityCounts: Record<string, number> = {};
+    const vocabulary = await Vocabulary.load(ctx, args.projectId);
+    const themeCounts = new Map<number, number>();
+    const entityCounts = new Map<number, number>();
     let totalSentiment = 0;
 
     for (const insight of filteredInsights) {
       sentimentCounts[insight.sentimentLabel]++;
       totalSentiment += insight.sentimentScore;
 
-      for (const theme of insight.themes) {
-        themeCounts[theme] = (themeCounts[theme] || 0) + 1;
+      for (const theme of vocabulary.ids("theme", insight)) {
+        themeCounts.set(theme, (themeCounts.get(theme) ?? 0) + 1);
       }
-      for (const entity of insight.entities) {
-        entityCounts[entity] = (entityCounts[entity] || 0) + 1;
+      for (const entity of vocabulary.ids("entity", insight)) {
+        entityCounts.set(entity, (entityCounts.get(entity) ?? 0) + 1);
       }
     }
 
     const avgSentiment =
       filteredInsights.length > 0 ? totalSentiment / filteredInsights.length : 0;
 
-    // Sort themes and entities by count
-    const topThemes = Object.entries(themeCounts)
+    // Sort themes and entities by count, labels only for the top 10
+    const topThemes = [...themeCounts]
       .sort((a, b) => b[1] - a[1])
-      .slice(0, 10);
-    const topEntities = Object.entries(entityCounts)
+      .slice(0, 10)
+      .map(([id, count]): [string, number] => [vocabulary.label("theme", id), count]);
+    const topEntities = [...entityCounts]
       .sort((a, b) => b[1] - a[1])
-      .slice(0, 10);
+      .slice(0, 10)
+      .map(([id, count]): [string, number] => [vocabulary.label("entity", id), count]);
 
     return {
       totalInsights: filteredInsights.length,
@@ -259,8 +276,11 @@ export const create = mutation({
     feedItemPublishedAt: v.number(),
   },
   handler: async (ctx, args) => {
+    const { entities, themes, ...fields } = args;
     const insightId = await ctx.db.insert("insights", {
-      ...args,
+      ...fields,
+      entityIds: await resolveTermIds(ctx, args.projectId, "entity", entities),
+      themeIds: await resolveTermIds(ctx, args.projectId, "theme", themes),
       analyzedAt: Date.now(),
     });
     return insightId;
@@ -281,7 +301,8 @@ export const getHighActionability = query({
       .collect();
 
     const filtered = insights.filter((i) => i.actionability === "high");
-    return args.limit ? filtered.slice(0, args.limit) : filtered;
+    const vocabulary = await Vocabulary.load(ctx, args.projectId);
+    return (args.limit ? filtered.slice(0, args.limit) : filtered).map((i) => vocabulary.withLabels(i));
   },
 });
 
@@ -392,17 +413,28 @@ export const getCompetitorMentions = query({
       };
     }
 
+    // Competitors matched by each entity term, worked out once per term
+    const vocabulary = await Vocabulary.load(ctx, args.projectId);
+    const competitorKeys = trackedCompetitors.map((comp) => comp.toLowerCase());
+    const matchedByEntity = new Map<number, string[]>();
+    const competitorsFor = (entityId: number) => {
+      let matched = matchedByEntity.get(entityId);
+      if (!matched) {
+        const entityLower = vocabulary.label("entity", entityId).toLowerCase();
+        matched = competitorKeys.filter((comp) => entityLower.includes(comp) || comp.includes(entityLower));
+        matchedByEntity.set(entityId, matched);
+      }
+      return matched;
+    };
+
     // Analyze entities in insights
     for (const insight of filteredInsights) {
-      for (const entity of insight.entities) {
-        const entityLower = entity.toLowerCase();
-        for (const comp of trackedCompetitors) {
-          if (entityLower.includes(comp.toLowerCase()) || comp.toLowerCase().includes(entityLower)) {
-            const stats = competitorStats[comp.toLowerCase()];
-            stats.mentions++;
-            stats.totalSentiment += insight.sentimentScore;
-            stats[insight.sentimentLabel]++;
-          }
+      for (const entityId of vocabulary.ids("entity", insight)) {
+        for (const comp of competitorsFor(entityId)) {
+          const stats = competitorStats[comp];
+          stats.mentions++;
+          stats.totalSentiment += insight.sentimentScore;
+          stats[insight.sentimentLabel]++;
         }
       }
     }
@@ -433,10 +465,9 @@ export const getCompetitorMentions = query({
         }
       }
 
-      for (const entity of insight.entities) {
-        const entityLower = entity.toLowerCase();
-        for (const comp of topCompetitors) {
-          if (entityLower.includes(comp) || comp.includes(entityLower)) {
+      for (const entityId of vocabulary.ids("entity", insight)) {
+        for (const comp of competitorsFor(entityId)) {
+          if (comp in dailyTrends[date]) {
             dailyTrends[date][comp]++;
           }
         }
@@ -470,25 +501,31 @@ export const getThemeTrends = query({
 
     const filteredInsights = insights.filter((i) => i.analyzedAt >= cutoff);
 
+    // Canonical theme IDs per insight, resolved once
+    const vocabulary = await Vocabulary.load(ctx, args.projectId);
+    const rows = filteredInsights.map((i) => ({ analyzedAt: i.analyzedAt, themes: vocabulary.ids("theme", i) }));
+
     // Count total mentions per theme
-    const themeTotals: Record<string, number> = {};
-    for (const insight of filteredInsights) {
-      for (const theme of insight.themes) {
-        themeTotals[theme] = (themeTotals[theme] || 0) + 1;
+    const themeTotals = new Map<number, number>();
+    for (const row of rows) {
+      for (const theme of row.themes) {
+        themeTotals.set(theme, (themeTotals.get(theme) ?? 0) + 1);
       }
     }
 
     // Get top N themes
-    const topThemes = Object.entries(themeTotals)
+    const topIds = [...themeTotals]
       .sort((a, b) => b[1] - a[1])
       .slice(0, topN)
-      .map(([name]) => name);
+      .map(([id]) => id);
+    const topLabels = new Map(topIds.map((id) => [id, vocabulary.label("theme", id)]));
+    const topThemes = [...topLabels.values()];
 
     // Build daily trends
     const dailyData: Record<string, Record<string, number>> = {};
 
-    for (const insight of filteredInsights) {
-      const date = new Date(insight.analyzedAt).toISOString().split("T")[0];
+    for (const row of rows) {
+      const date = new Date(row.analyzedAt).toISOString().split("T")[0];
       if (!dailyData[date]) {
         dailyData[date] = {};
         for (const theme of topThemes) {
@@ -496,9 +533,10 @@ export const getThemeTrends = query({
         }
       }
 
-      for (const theme of insight.themes) {
-        if (topThemes.includes(theme)) {
-          dailyData[date][theme]++;
+      for (const theme of row.themes) {
+        const label = topLabels.get(theme);
+        if (label !== undefined) {
+          dailyData[date][label]++;
         }
       }
     }
@@ -512,40 +550,34 @@ export const getThemeTrends = query({
     const oneWeekAgo = now - 7 * 24 * 60 * 60 * 1000;
     const twoWeeksAgo = now - 14 * 24 * 60 * 60 * 1000;
 
-    const recentInsights = filteredInsights.filter((i) => i.analyzedAt >= oneWeekAgo);
-    const previousInsights = filteredInsights.filter(
-      (i) => i.analyzedAt >= twoWeeksAgo && i.analyzedAt < oneWeekAgo
-    );
+    const recentCounts = new Map<number, number>();
+    const previousCounts = new Map<number, number>();
+    const seenBefore = new Set<number>();
+    for (const row of rows) {
+      const counts = row.analyzedAt >= oneWeekAgo ? recentCounts : row.analyzedAt >= twoWeeksAgo ? previousCounts : null;
+      for (const theme of row.themes) {
+        if (counts) counts.set(theme, (counts.get(theme) ?? 0) + 1);
+        if (row.analyzedAt < oneWeekAgo) seenBefore.add(theme);
+      }
+    }
 
-    const themeGrowth = topThemes.map((theme) => {
-      const recentCount = recentInsights.filter((i) => i.themes.includes(theme)).length;
-      const previousCount = previousInsights.filter((i) => i.themes.includes(theme)).length;
+    const themeGrowth = topIds.map((id) => {
+      const recentCount = recentCounts.get(id) ?? 0;
+      const previousCount = previousCounts.get(id) ?? 0;
       const growth = previousCount > 0 
         ? Math.round(((recentCount - previousCount) / previousCount) * 100)
         : recentCount > 0 ? 100 : 0;
 
-      return { theme, recentCount, previousCount, growth };
+      return { theme: topLabels.get(id)!, recentCount, previousCount, growth };
     });
 
     // Detect emerging themes (appeared in last 7 days but not before)
-    const allThemesRecent = new Set<string>();
-    const allThemesPrevious = new Set<string>();
-
-    for (const insight of recentInsights) {
-      insight.themes.forEach((t) => allThemesRecent.add(t));
-    }
-    for (const insight of filteredInsights.filter((i) => i.analyzedAt < oneWeekAgo)) {
-      insight.themes.forEach((t) => allThemesPrevious.add(t));
-    }
-
-    const emergingThemes = [...allThemesRecent]
-      .filter((t) => !allThemesPrevious.has(t))
-      .map((theme) => ({
-        theme,
-        count: recentInsights.filter((i) => i.themes.includes(theme)).length,
-      }))
+    const emergingThemes = [...recentCounts]
+      .filter(([id]) => !seenBefore.has(id))
+      .map(([id, count]) => ({ id, count }))
       .sort((a, b) => b.count - a.count)
-      .slice(0, 5);
+      .slice(0, 5)
+      .map(({ id, count }) => ({ theme: vocabulary.label("theme", id), count }));
 
     return { topThemes, trends, themeGrowth, emergingThemes };
   },
@@ -654,18 +686,19 @@ export const getActionabilityStats = query({
 
     // High-priority themes breakdown
     const highActionabilityInsights = filteredInsights.filter((i) => i.actionability === "high");
-    const highPriorityThemes: Record<string, number> = {};
+    const vocabulary = await Vocabulary.load(ctx, args.projectId);
+    const highPriorityThemes = new Map<number, number>();
 
     for (const insight of highActionabilityInsights) {
-      for (const theme of insight.themes) {
-        highPriorityThemes[theme] = (highPriorityThemes[theme] || 0) + 1;
+      for (const theme of vocabulary.ids("theme", insight)) {
+        highPriorityThemes.set(theme, (highPriorityThemes.get(theme) ?? 0) + 1);
       }
     }
 
-    const topHighPriorityThemes = Object.entries(highPriorityThemes)
+    const topHighPriorityThemes = [...highPriorityThemes]
       .sort((a, b) => b[1] - a[1])
       .slice(0, 10)
-      .map(([theme, count]) => ({ theme, count }));
+      .map(([id, count]) => ({ theme: vocabulary.label("theme", id), count }));
 
     return { distribution, trend, topHighPriorityThemes };
   },
@@ -0,0 +1,259 @@
+import { v } from "convex/values";
+import { internalMutation, internalQuery } from "./_generated/server";
+import { internal } from "./_generated/api";
+import { traceStageValidator } from "./schema";
+import { HISTOGRAM_BOUNDS_MS, histogramBucket } from "./tracing";
+
+// Raw span retention (histograms are kept)
+const TRACE_SPAN_DAYS = 3;
+
+// Per-call token usage retention
+const ANALYSIS_USAGE_DAYS = 30;
+
+const HOUR_MS = 60 * 60 * 1000;
+
+// Histogram rollup: spans per run, and how far behind "now" it reads so that
+// spans still being written (recordSpans in flight) are picked up next time
+const ROLLUP_BATCH = 2000;
+const ROLLUP_LAG_MS = 60 * 1000;
+
+const spanValidator = v.object({
+  traceId: v.string(),
+  stage: traceStageValidator,
+  startedAt: v.number(),
+  durationMs: v.number(),
+  projectId: v.optional(v.id("projects")),
+  sourceId: v.optional(v.id("sources")),
+  feedItemId: v.optional(v.id("feedItems")),
+  count: v.optional(v.number()),
+  ok: v.boolean(),
+});
+
+// Store a batch of spans (internal). Insert-only, so concurrent traced actions
+// never contend on shared rows; rollupStageMetrics builds the histograms.
+export const recordSpans = internalMutation({
+  args: { spans: v.array(spanValidator) },
+  handler: async (ctx, args) => {
+    for (const span of args.spans) {
+      await ctx.db.insert("traceSpans", span);
+    }
+  },
+});
+
+// Fold spans recorded since the last run into the hourly histograms (cron).
+// The only writer of stageMetrics; spans are read in creation order behind a
+// stored cursor, lagging a little so no in-flight recordSpans is skipped.
+export const rollupStageMetrics = internalMutation({
+  args: {},
+  handler: async (ctx): Promise<number> => {
+    const until = Date.now() - ROLLUP_LAG_MS;
+    const cursor = await ctx.db.query("stageMetricsCursor").first();
+    if (!cursor) {
+      // First run: earlier spans were folded in by recordSpans itself
+      await ctx.db.insert("stageMetricsCursor", { spansThrough: until });
+      return 0;
+    }
+
+    const spans = await ctx.db
+      .query("traceSpans")
+      .withIndex("by_creation_time", (q) =>
+        q.gt("_creationTime", cursor.spansThrough).lt("_creationTime", until)
+      )
+      .take(ROLLUP_BATCH);
+    if (spans.length === 0) return 0;
+
+    // Aggregate per stage/hour first so each metrics row is written once
+    const rollups = new Map<string, { stage: typeof spans[number]["stage"]; hour: number; durations: number[]; errors: number }>();
+    for (const span of spans) {
+      const hour = Math.floor(span.startedAt / HOUR_MS) * HOUR_MS;
+      const key = `${span.stage}:${hour}`;
+      const rollup = rollups.get(key) ?? { stage: span.stage, hour, durations: [], errors: 0 };
+      rollup.durations.push(span.durationMs);
+      if (!span.ok) rollup.errors++;
+      rollups.set(key, rollup);
+    }
+
+    for (const { stage, hour, durations, errors } of rollups.values()) {
+      const existing = await ctx.db
+        .query("stageMetrics")
+        .withIndex("by_stage_hour", (q) => q.eq("stage", stage).eq("hour", hour))
+        .first();
+
+      const buckets = existing?.buckets.slice() ?? new Array(HISTOGRAM_BOUNDS_MS.length + 1).fill(0);
+      for (const duration of durations) {
+        buckets[histogramBucket(duration)]++;
+      }
+
+      const count = (existing?.count ?? 0) + durations.length;
+      const sumMs = (existing?.sumMs ?? 0) + durations.reduce((sum, d) => sum + d, 0);
+      const maxMs = Math.max(existing?.maxMs ?? 0, ...durations);
+
+      if (existing) {
+        await ctx.db.patch(existing._id, {
+          count,
+          errors: existing.errors + errors,
+          sumMs,
+          maxMs,
+          buckets,
+        });
+      } else {
+        await ctx.db.insert("stageMetrics", { stage, hour, count, errors, sumMs, maxMs, buckets });
+      }
+    }
+
+    await ctx.db.patch(cursor._id, { spansThrough: spans[spans.length - 1]._creationTime });
+
+    // Backlog larger than one batch: continue right away
+    if (spans.length === ROLLUP_BATCH) {
+      await ctx.scheduler.runAfter(0, internal.metrics.rollupStageMetrics, {});
+    }
+    return spans.length;
+  },
+});
+
+// Per-stage latency summary from the hourly histograms (internal; trails the
+// newest spans by up to one rollup interval)
+// Usage: npx convex run metrics:getStageLatency '{"hoursBack": 24}'
+export const getStageLatency = internalQuery({
+  args: { hoursBack: v.optional(v.number()) },
+  handler: async (ctx, args) => {
+    const cutoff = Date.now() - (args.hoursBack ?? 24) * HOUR_MS;
+    const rows = await ctx.db
+      .query("stageMetrics")
+      .withIndex("by_hour", (q) => q.gte("hour", cutoff))
+      .collect();
+
+    const byStage = new Map<string, { count: number; errors: number; sumMs: number; maxMs: number; buckets: number[] }>();
+    for (const row of rows) {
+      const total = byStage.get(row.stage) ?? {
+        count: 0,
+        errors: 0,
+        sumMs: 0,
+        maxMs: 0,
+        buckets: new Array(HISTOGRAM_BOUNDS_MS.length + 1).fill(0),
+      };
+      total.count += row.count;
+      total.errors += row.errors;
+      total.sumMs += row.sumMs;
+      total.maxMs = Math.max(total.maxMs, row.maxMs);
+      row.buckets.forEach((n, i) => (total.buckets[i] += n));
+      byStage.set(row.stage, total);
+    }
+
+    // Percentile as the upper bound of the bucket containing it
+    const percentile = (buckets: number[], count: number, p: number, maxMs: number) => {
+      const target = Math.ceil(count * p);
+      let seen = 0;
+      for (let i = 0; i < buckets.length; i++) {
+        seen += buckets[i];
+        if (seen >= target) return Math.min(HISTOGRAM_BOUNDS_MS[i] ?? maxMs, maxMs);
+      }
+      return maxMs;
+    };
+
+    return [...byStage.entries()].map(([stage, total]) => ({
+      stage,
+      count: total.count,
+      errors: total.errors,
+      avgMs: total.count > 0 ? Math.round(total.sumMs / total.count) : 0,
+      p50Ms: percentile(total.buckets, total.count, 0.5, total.maxMs),
+      p95Ms: percentile(total.buckets, total.count, 0.95, total.maxMs),
+      p99Ms: percentile(total.buckets, total.count, 0.99, total.maxMs),
+      maxMs: total.maxMs,
+    }));
+  },
+});
+
+// Export raw spans for offline analysis (internal - input for scripts/trace_report.py)
+// Usage: npx convex run metrics:exportTraceSpans '{"hoursBack": 24}' > trace.json
+export const exportTraceSpans = internalQuery({
+  args: { hoursBack: v.optional(v.number()) },
+  handler: async (ctx, args) => {
+    const cutoff = Date.now() - (args.hoursBack ?? 24) * HOUR_MS;
+    const spans = await ctx.db
+      .query("traceSpans")
+      .withIndex("by_startedAt", (q) => q.gte("startedAt", cutoff))
+      .collect();
+
+    return spans.map(({ _id, _creationTime, ...span }) => span);
+  },
+});
+
+// Delete raw spans past the retention window (internal)
+export const pruneTraceSpans = internalMutation({
+  args: {},
+  handler: async (ctx) => {
+    const cutoff = Date.now() - TRACE_SPAN_DAYS * 24 * HOUR_MS;
+    const old = await ctx.db
+      .query("traceSpans")
+      .withIndex("by_startedAt", (q) => q.lt("startedAt", cutoff))
+      .take(2000);
+
+    for (const span of old) {
+      await ctx.db.delete(span._id);
+    }
+    return old.length;
+  },
+});
+
+// Gemini token usage per analyzed item, split by cached/inline prompt (internal)
+// Usage: npx convex run metrics:getTokenUsage '{"hoursBack": 24}'
+export const getTokenUsage = internalQuery({
+  args: {
+    projectId: v.optional(v.id("projects")),
+    hoursBack: v.optional(v.number()),
+  },
+  handler: async (ctx, args) => {
+    const cutoff = Date.now() - (args.hoursBack ?? 24) * HOUR_MS;
+    const rows = args.projectId
+      ? await ctx.db
+          .query("analysisUsage")
+          .withIndex("by_project", (q) => q.eq("projectId", args.projectId!).gte("createdAt", cutoff))
+          .collect()
+      : await ctx.db
+          .query("analysisUsage")
+          .withIndex("by_createdAt", (q) => q.gte("createdAt", cutoff))
+          .collect();
+
+    const sum = (values: number[]) => values.reduce((total, n) => total + n, 0);
+    const perItem = (total: number) => (rows.length > 0 ? Math.round(total / rows.length) : 0);
+    const promptTokens = sum(rows.map((row) => row.promptTokens));
+    const cachedTokens = sum(rows.map((row) => row.cachedTokens));
+    const outputTokens = sum(rows.map((row) => row.outputTokens + row.thoughtsTokens));
+    const latencies = rows.map((row) => row.latencyMs).sort((a, b) => a - b);
+    const at = (p: number) => (latencies.length > 0 ? latencies[Math.min(latencies.length - 1, Math.floor(latencies.length * p))] : 0);
+
+    return {
+      items: rows.length,
+      cachedCalls: rows.filter((row) => row.promptMode === "cached").length,
+      promptTokens,
+      cachedTokens,
+      uncachedTokens: promptTokens - cachedTokens,
+      outputTokens,
+      promptTokensPerItem: perItem(promptTokens),
+      uncachedTokensPerItem: perItem(promptTokens - cachedTokens),
+      outputTokensPerItem: perItem(outputTokens),
+      bodyCharsSent: sum(rows.map((row) => row.sentChars)),
+      bodyCharsTotal: sum(rows.map((row) => row.bodyChars)),
+      p50LatencyMs: at(0.5),
+      p95LatencyMs: at(0.95),
+    };
+  },
+});
+
+// Delete token usage rows past the retention window (internal)
+export const pruneAnalysisUsage = internalMutation({
+  args: {},
+  handler: async (ctx) => {
+    const cutoff = Date.now() - ANALYSIS_USAGE_DAYS * 24 * HOUR_MS;
+    const old = await ctx.db
+      .query("analysisUsage")
+      .withIndex("by_createdAt", (q) => q.lt("createdAt", cutoff))
+      .take(2000);
+
+    for (const row of old) {
+      await ctx.db.delete(row._id);
+    }
+    return old.length;
+  },
+});
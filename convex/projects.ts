@@ -1,6 +1,10 @@
 import { v } from "convex/values";
 import { query, mutation } from "./_generated/server";
 import { auth } from "./auth";
+import { propagateProjectStop } from "./feeds/leases";
+import { assignSourceShard } from "./feeds/sharding";
+import { deleteProjectSnapshot } from "./exports/mutations";
+import { deleteProjectVocabulary } from "./vocabulary/mutations";
 
 // Helper to get authenticated user ID
 async function getAuthenticatedUserId(ctx: any) {
@@ -305,13 +309,14 @@ export const createWithSources = mutation({
 
     // Create all sources
     for (const source of args.sources) {
-      await ctx.db.insert("sources", {
+      const sourceId = await ctx.db.insert("sources", {
         projectId,
         type: source.type,
         name: source.name,
         feedUrl: source.feedUrl,
         active: true,
       });
+      await assignSourceShard(ctx, sourceId, source.feedUrl);
     }
 
     return projectId;
@@ -361,6 +366,7 @@ export const addSources = mutation({
         feedUrl: source.feedUrl,
         active: true,
       });
+      await assignSourceShard(ctx, id, source.feedUrl);
       createdIds.push(id);
     }
 
@@ -443,12 +449,19 @@ export const requestStopFetch = mutation({
       throw new Error("Access denied");
     }
     
+    // Tell fetch workers through their leases
+    const workersNotified = await propagateProjectStop(ctx, args.id);
+    
     // Only set to stopping if currently fetching
     if (project.fetchStatus === "fetching") {
       await ctx.db.patch(args.id, { fetchStatus: "stopping" });
       return { success: true, message: "Stop requested" };
     }
     
+    if (workersNotified > 0) {
+      return { success: true, message: "Stop requested" };
+    }
+    
     return { success: false, message: "Not currently fetching" };
   },
 });
@@ -580,6 +593,12 @@ export const remove = mutation({
       await ctx.db.delete(insight._id);
     }
 
+    // Delete the export snapshot and its stored files
+    await deleteProjectSnapshot(ctx, args.id);
+
+    // Delete the theme/entity vocabulary
+    await deleteProjectVocabulary(ctx, args.id);
+
     // Delete all alerts for this project
     const alerts = await ctx.db
       .query("alerts")
@@ -590,6 +609,25 @@ export const remove = mutation({
       await ctx.db.delete(alert._id);
     }
 
+    // Delete prompt cache entries and token usage (Gemini caches expire on their own)
+    const promptCaches = await ctx.db
+      .query("promptCaches")
+      .withIndex("by_project", (q) => q.eq("projectId", args.id))
+      .collect();
+
+    for (const cache of promptCaches) {
+      await ctx.db.delete(cache._id);
+    }
+
+    const usage = await ctx.db
+      .query("analysisUsage")
+      .withIndex("by_project", (q) => q.eq("projectId", args.id))
+      .collect();
+
+    for (const row of usage) {
+      await ctx.db.delete(row._id);
+    }
+
     // Get all sources and their feed items
     const sources = await ctx.db
       .query("sources")
@@ -607,6 +645,16 @@ export const remove = mutation({
         await ctx.db.delete(item._id);
       }
       
+      // Delete fetch history for this source
+      const fetches = await ctx.db
+        .query("sourceFetches")
+        .withIndex("by_source", (q) => q.eq("sourceId", source._id))
+        .collect();
+
+      for (const entry of fetches) {
+        await ctx.db.delete(entry._id);
+      }
+      
       // Delete the source
       await ctx.db.delete(source._id);
     }
@@ -2,6 +2,56 @@ import { defineSchema, defineTable } from "convex/server";
 import { v } from "convex/values";
 import { authTables } from "@convex-dev/auth/server";
 
+export const fetchOutcomeValidator = v.union(
+  v.literal("new_items"),
+  v.literal("unchanged"),
+  v.literal("error"),
+  v.literal("rate_limited")
+);
+
+export const traceStageValidator = v.union(
+  v.literal("schedule"),
+  v.literal("http_fetch"),
+  v.literal("parse"),
+  v.literal("dedup"),
+  v.literal("insert"),
+  v.literal("queue_wait"),
+  v.literal("prompt_build"),
+  v.literal("prompt_cache"),
+  v.literal("model_latency"),
+  v.literal("json_parse"),
+  v.literal("insight_write"),
+  v.literal("alert_dispatch")
+);
+
+export const termKindValidator = v.union(v.literal("theme"), v.literal("entity"));
+
+export const analysisUsageValidator = v.object({
+  projectId: v.id("projects"),
+  model: v.string(),
+  promptMode: v.union(v.literal("cached"), v.literal("inline")),
+  promptTokens: v.number(), // Includes cached tokens
+  cachedTokens: v.number(),
+  outputTokens: v.number(),
+  thoughtsTokens: v.number(),
+  bodyChars: v.number(), // Feed item body before compaction
+  sentChars: v.number(), // Body actually sent
+  latencyMs: v.number(),
+});
+
+export const feedProbeValidator = v.object({
+  feedUrl: v.string(),
+  ok: v.union(v.boolean(), v.null()), // null: temporary failure (429, 5xx, timeout), feed state unknown
+  status: v.optional(v.number()), // HTTP status, undefined on network error/timeout
+  error: v.optional(v.string()),
+  itemCount: v.number(), // Items on the first page
+  itemsPerDay: v.number(), // Posting rate measured over the first page's dates
+  newestAgeHours: v.optional(v.number()), // Age of the newest dated item
+  yieldScore: v.number(), // Items/day discounted by staleness; 0 for dead feeds
+  latencyMs: v.number(),
+  checkedAt: v.number(),
+});
+
 export default defineSchema({
   // Auth tables (users, sessions, accounts, etc.)
   ...authTables,
@@ -36,9 +86,24 @@ export default defineSchema({
     active: v.boolean(),
     lastFetched: v.optional(v.number()),
     config: v.optional(v.any()), // Additional source-specific config
+    shard: v.optional(v.number()), // Fetch shard (see feeds/sharding.ts), set on insert
+    fetchStats: v.optional(v.object({
+      fetchCount: v.number(),
+      yieldAvg: v.number(), // Moving average of new items per fetch
+      unchangedRate: v.number(), // Share of 304 / duplicate-only fetches
+      errorRate: v.number(),
+      rateLimitRate: v.number(),
+      latencyAvgMs: v.number(),
+      consecutiveFailures: v.number(),
+      lastAttemptAt: v.number(),
+      lastOutcome: fetchOutcomeValidator,
+      etag: v.optional(v.string()), // Validators for conditional requests
+      lastModified: v.optional(v.string()),
+    })), // Adaptive scheduling stats (see feeds/scheduler.ts)
   })
     .index("by_project", ["projectId"])
-    .index("by_active", ["active"]),
+    .index("by_active", ["active"])
+    .index("by_active_shard", ["active", "shard"]),
 
   feedItems: defineTable({
     sourceId: v.id("sources"),
@@ -66,8 +131,10 @@ export default defineSchema({
       v.literal("neutral")
     ),
     relevanceScore: v.optional(v.number()), // 0 to 1 - how relevant to tracked keywords
-    entities: v.array(v.string()),
-    themes: v.array(v.string()),
+    entityIds: v.optional(v.array(v.number())), // Term IDs in vocabularyTerms (see vocabulary/terms.ts)
+    themeIds: v.optional(v.array(v.number())),
+    entities: v.optional(v.array(v.string())), // Legacy free-form strings, replaced by IDs on migration
+    themes: v.optional(v.array(v.string())),
     summary: v.string(),
     actionability: v.union(
       v.literal("high"),
@@ -85,6 +152,129 @@ export default defineSchema({
     .index("by_feedItem", ["feedItemId"])
     .index("by_sentiment", ["projectId", "sentimentLabel"]),
 
+  // Per-fetch history used to tune and simulate adaptive scheduling
+  sourceFetches: defineTable({
+    sourceId: v.id("sources"),
+    projectId: v.id("projects"),
+    fetchedAt: v.number(),
+    outcome: fetchOutcomeValidator,
+    itemsAdded: v.number(),
+    latencyMs: v.number(),
+  })
+    .index("by_source", ["sourceId", "fetchedAt"])
+    .index("by_fetchedAt", ["fetchedAt"]),
+
+  // Shard leases coordinating concurrent fetch workers (see feeds/leases.ts)
+  fetchLeases: defineTable({
+    shard: v.number(),
+    workerId: v.optional(v.string()), // Holder, undefined when free
+    expiresAt: v.number(), // Lease is reclaimable after this time
+    cycleStartedAt: v.number(), // Dispatch cycle the lease was claimed for
+    lastCompletedAt: v.number(), // When a worker last finished the whole shard
+    stopRequested: v.boolean(), // Holder should release and exit
+    stoppedProjects: v.array(v.id("projects")), // Projects the holder should skip
+  })
+    .index("by_shard", ["shard"]),
+
+  // Raw pipeline spans, kept briefly for trace exports (see tracing.ts)
+  traceSpans: defineTable({
+    traceId: v.string(),
+    stage: traceStageValidator,
+    startedAt: v.number(),
+    durationMs: v.number(),
+    projectId: v.optional(v.id("projects")),
+    sourceId: v.optional(v.id("sources")),
+    feedItemId: v.optional(v.id("feedItems")),
+    count: v.optional(v.number()),
+    ok: v.boolean(),
+  })
+    .index("by_startedAt", ["startedAt"]),
+
+  // Hourly per-stage latency histograms (bucket bounds in tracing.ts)
+  stageMetrics: defineTable({
+    stage: traceStageValidator,
+    hour: v.number(), // Start of the hour (ms)
+    count: v.number(),
+    errors: v.number(),
+    sumMs: v.number(),
+    maxMs: v.number(),
+    buckets: v.array(v.number()),
+  })
+    .index("by_stage_hour", ["stage", "hour"])
+    .index("by_hour", ["hour"]),
+
+  // Rollup position: creation time of the last trace span folded into stageMetrics
+  stageMetricsCursor: defineTable({
+    spansThrough: v.number(),
+  }),
+
+  // Gemini context caches holding a project's prompt prefix (see analysis/gemini.ts)
+  promptCaches: defineTable({
+    projectId: v.id("projects"),
+    prefixHash: v.string(), // Cache is stale once the project's prefix changes
+    cacheName: v.optional(v.string()), // cachedContents/...; undefined = caching unavailable, use inline prompt
+    claimId: v.optional(v.string()), // Set while one analyzeItem call creates the cache
+    expiresAt: v.number(),
+    tokenCount: v.optional(v.number()),
+  })
+    .index("by_project", ["projectId"]),
+
+  // Per-call Gemini token accounting for analyzeItem
+  analysisUsage: defineTable({
+    ...analysisUsageValidator.fields,
+    feedItemId: v.id("feedItems"),
+    createdAt: v.number(),
+  })
+    .index("by_createdAt", ["createdAt"])
+    .index("by_project", ["projectId", "createdAt"]),
+
+  // Canonical themes/entities per project (integer termId per kind)
+  vocabularyTerms: defineTable({
+    projectId: v.id("projects"),
+    kind: termKindValidator,
+    termId: v.number(),
+    label: v.string(), // Display form (first spelling seen, or set on merge/rename)
+    mergedInto: v.optional(v.number()), // Merged terms resolve to this termId
+    createdAt: v.number(),
+  })
+    .index("by_project_term", ["projectId", "kind", "termId"]),
+
+  // Normalized spellings -> termId (the alias cache used to resolve model output)
+  vocabularyAliases: defineTable({
+    projectId: v.id("projects"),
+    kind: termKindValidator,
+    alias: v.string(),
+    termId: v.number(),
+  })
+    .index("by_alias", ["projectId", "kind", "alias"])
+    .index("by_term", ["projectId", "kind", "termId"]),
+
+  // Gemini project-setup suggestions keyed by normalized name/description (see ai/suggest.ts)
+  suggestionCaches: defineTable({
+    descriptionHash: v.string(),
+    suggestions: v.any(), // ProjectSuggestions
+    createdAt: v.number(),
+    expiresAt: v.number(),
+  })
+    .index("by_hash", ["descriptionHash"])
+    .index("by_expiresAt", ["expiresAt"]),
+
+  // Last validation of a suggested feed URL (first page only)
+  feedProbes: defineTable(feedProbeValidator.fields)
+    .index("by_url", ["feedUrl"])
+    .index("by_checkedAt", ["checkedAt"]),
+
+  // Latest columnar insight snapshot per project (format in exports/columnar.ts)
+  insightSnapshots: defineTable({
+    projectId: v.id("projects"),
+    manifestId: v.id("_storage"), // JSON manifest (dictionaries + segment layout)
+    segmentIds: v.array(v.id("_storage")), // Append-only binary segments, oldest first
+    watermark: v.number(), // Highest analyzedAt covered
+    rowCount: v.number(),
+    updatedAt: v.number(),
+  })
+    .index("by_project", ["projectId"]),
+
   alerts: defineTable({
     projectId: v.id("projects"),
     name: v.string(),
@@ -1,5 +1,6 @@
 import { v } from "convex/values";
 import { query, mutation } from "./_generated/server";
+import { assignSourceShard } from "./feeds/sharding";
 
 const sourceTypeValidator = v.union(
   v.literal("reddit"),
@@ -84,6 +85,7 @@ export const create = mutation({
       active: true,
       config: args.config,
     });
+    await assignSourceShard(ctx, sourceId, args.feedUrl);
     return sourceId;
   },
 });
@@ -107,6 +109,10 @@ export const update = mutation({
     }
 
     await ctx.db.patch(id, filteredUpdates);
+    if (args.feedUrl !== undefined) {
+      // Reddit sources live in their own shard
+      await assignSourceShard(ctx, id, args.feedUrl);
+    }
     return id;
   },
 });
@@ -160,6 +166,16 @@ export const remove = mutation({
       await ctx.db.delete(item._id);
     }
 
+    // Delete fetch history for this source
+    const fetches = await ctx.db
+      .query("sourceFetches")
+      .withIndex("by_source", (q) => q.eq("sourceId", args.id))
+      .collect();
+
+    for (const entry of fetches) {
+      await ctx.db.delete(entry._id);
+    }
+
     // Delete the source
     await ctx.db.delete(args.id);
     return args.id;
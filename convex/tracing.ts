@@ -0,0 +1,106 @@
+// Pipeline tracing helpers
+// Actions collect spans in memory and flush them in one insert-only mutation;
+// a cron folds them into the hourly histograms (see metrics.ts)
+
+import { internal } from "./_generated/api";
+import { Id } from "./_generated/dataModel";
+import { ActionCtx } from "./_generated/server";
+
+export type TraceStage =
+  | "schedule" // Time a source waited past its due time
+  | "http_fetch"
+  | "parse"
+  | "dedup" // insertFeedItem calls that hit an existing item
+  | "insert" // insertFeedItem calls that wrote a new item
+  | "queue_wait" // Item fetched -> analysis started
+  | "prompt_build"
+  | "prompt_cache" // Context cache lookup/creation for the prompt prefix
+  | "model_latency"
+  | "json_parse"
+  | "insight_write"
+  | "alert_dispatch";
+
+export interface TraceIds {
+  projectId?: Id<"projects">;
+  sourceId?: Id<"sources">;
+  feedItemId?: Id<"feedItems">;
+}
+
+export interface Span extends TraceIds {
+  traceId: string;
+  stage: TraceStage;
+  startedAt: number;
+  durationMs: number;
+  count?: number; // Operations folded into the span (e.g. items deduplicated)
+  ok: boolean;
+}
+
+// Upper bounds (ms) of the latency histogram buckets; last bucket is open-ended
+export const HISTOGRAM_BOUNDS_MS = [
+  1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 20000, 60000, 120000,
+];
+
+// Histogram bucket index for a duration
+export function histogramBucket(durationMs: number): number {
+  const index = HISTOGRAM_BOUNDS_MS.findIndex((bound) => durationMs <= bound);
+  return index === -1 ? HISTOGRAM_BOUNDS_MS.length : index;
+}
+
+// Share of traces that are recorded (TRACE_SAMPLE_RATE, 0 to 1, default 1)
+function sampleRate(): number {
+  const rate = Number(process.env.TRACE_SAMPLE_RATE ?? 1);
+  return isNaN(rate) ? 1 : Math.max(0, Math.min(1, rate));
+}
+
+export class Tracer {
+  readonly traceId: string;
+  readonly spans: Span[] = [];
+  private readonly sampled: boolean;
+
+  constructor(private ids: TraceIds = {}) {
+    this.traceId = `${Date.now().toString(36)}-${Math.random().toString(36).slice(2, 10)}`;
+    this.sampled = Math.random() < sampleRate();
+  }
+
+  // Attach IDs learned after the trace started (e.g. project of a feed item)
+  setIds(ids: TraceIds) {
+    this.ids = { ...this.ids, ...ids };
+  }
+
+  record(stage: TraceStage, startedAt: number, durationMs: number, extra: Partial<Span> = {}) {
+    if (!this.sampled) return;
+    this.spans.push({
+      ...this.ids,
+      traceId: this.traceId,
+      stage,
+      startedAt,
+      durationMs: Math.max(0, Math.round(durationMs)),
+      ok: true,
+      ...extra,
+    });
+  }
+
+  // Time an async step; failures are recorded with ok: false and rethrown
+  async span<T>(stage: TraceStage, fn: () => Promise<T>, extra: Partial<Span> = {}): Promise<T> {
+    const startedAt = Date.now();
+    try {
+      const result = await fn();
+      this.record(stage, startedAt, Date.now() - startedAt, extra);
+      return result;
+    } catch (error) {
+      this.record(stage, startedAt, Date.now() - startedAt, { ...extra, ok: false });
+      throw error;
+    }
+  }
+
+  // Write collected spans; never fails the traced action
+  async flush(ctx: ActionCtx) {
+    if (this.spans.length === 0) return;
+    try {
+      await ctx.runMutation(internal.metrics.recordSpans, { spans: this.spans });
+    } catch (error) {
+      console.error("Failed to record trace spans:", error);
+    }
+    this.spans.length = 0;
+  }
+}
@@ -0,0 +1,36 @@
+import { v } from "convex/values";
+import { internalAction } from "../_generated/server";
+import { internal } from "../_generated/api";
+import { Id } from "../_generated/dataModel";
+
+// Insights converted per mutation
+const PAGE_SIZE = 200;
+
+// Move insights to canonical term IDs, one project or all (internal)
+// Run once after deploying the vocabulary; mergeTerms schedules it per project
+// Usage: npx convex run vocabulary/migrate:migrateInsights '{}'
+export const migrateInsights = internalAction({
+  args: { projectId: v.optional(v.id("projects")) },
+  handler: async (ctx, args): Promise<{ projects: number; updated: number }> => {
+    const projectIds: Id<"projects">[] = args.projectId
+      ? [args.projectId]
+      : await ctx.runQuery(internal.vocabulary.queries.listProjectIds, {});
+
+    let updated = 0;
+    for (const projectId of projectIds) {
+      let cursor: string | null = null;
+      let isDone = false;
+      while (!isDone) {
+        const result: { isDone: boolean; continueCursor: string; updated: number } = await ctx.runMutation(
+          internal.vocabulary.mutations.migrateInsightsPage,
+          { projectId, paginationOpts: { numItems: PAGE_SIZE, cursor } }
+        );
+        updated += result.updated;
+        cursor = result.continueCursor;
+        isDone = result.isDone;
+      }
+    }
+
+    return { projects: projectIds.length, updated };
+  },
+});
@@ -0,0 +1,166 @@
+import { v } from "convex/values";
+import { paginationOptsValidator } from "convex/server";
+import { internalMutation, MutationCtx } from "../_generated/server";
+import { internal } from "../_generated/api";
+import { Doc, Id } from "../_generated/dataModel";
+import { termKindValidator } from "../schema";
+import { Vocabulary, normalizeTerm, resolveTermIds, type TermKind } from "./terms";
+
+async function getTerm(ctx: MutationCtx, projectId: Id<"projects">, kind: TermKind, termId: number) {
+  return await ctx.db
+    .query("vocabularyTerms")
+    .withIndex("by_project_term", (q) => q.eq("projectId", projectId).eq("kind", kind).eq("termId", termId))
+    .unique();
+}
+
+// Convert one page of a project's insights to canonical term IDs (internal)
+// Legacy string arrays are replaced by IDs; IDs of merged terms are rewritten
+export const migrateInsightsPage = internalMutation({
+  args: {
+    projectId: v.id("projects"),
+    paginationOpts: paginationOptsValidator,
+  },
+  handler: async (ctx, args) => {
+    const vocabulary = await Vocabulary.load(ctx, args.projectId);
+    const result = await ctx.db
+      .query("insights")
+      .withIndex("by_project", (q) => q.eq("projectId", args.projectId))
+      .paginate(args.paginationOpts);
+
+    let updated = 0;
+    for (const insight of result.page) {
+      const patch: Partial<Doc<"insights">> = {};
+      for (const [kind, idsField, legacyField] of [
+        ["theme", "themeIds", "themes"],
+        ["entity", "entityIds", "entities"],
+      ] as const) {
+        const stored = insight[idsField];
+        if (stored === undefined) {
+          patch[idsField] = await resolveTermIds(ctx, args.projectId, kind, insight[legacyField] ?? []);
+          patch[legacyField] = undefined;
+          continue;
+        }
+        const canonical = vocabulary.ids(kind, insight);
+        if (canonical.length !== stored.length || canonical.some((id, i) => id !== stored[i])) {
+          patch[idsField] = canonical;
+        }
+      }
+
+      if (Object.keys(patch).length > 0) {
+        await ctx.db.patch(insight._id, patch);
+        updated++;
+      }
+    }
+
+    return { isDone: result.isDone, continueCursor: result.continueCursor, updated };
+  },
+});
+
+// Merge terms into one (internal - vocabulary cleanup tool)
+// Spellings of the merged terms resolve to the target from now on; existing
+// insights are rewritten in the background (queries canonicalize meanwhile)
+// Usage: npx convex run vocabulary/mutations:mergeTerms '{"projectId": "...", "kind": "theme", "from": [4, 9], "into": 2}'
+export const mergeTerms = internalMutation({
+  args: {
+    projectId: v.id("projects"),
+    kind: termKindValidator,
+    from: v.array(v.number()),
+    into: v.number(),
+    label: v.optional(v.string()), // New display label for the target
+  },
+  handler: async (ctx, args) => {
+    const target = await getTerm(ctx, args.projectId, args.kind, args.into);
+    if (!target || target.mergedInto !== undefined) {
+      throw new Error(`Term ${args.into} not found or already merged`);
+    }
+
+    let merged = 0;
+    for (const termId of args.from) {
+      if (termId === args.into) continue;
+      const term = await getTerm(ctx, args.projectId, args.kind, termId);
+      if (!term) throw new Error(`Term ${termId} not found`);
+      if (term.mergedInto !== undefined) continue;
+
+      await ctx.db.patch(term._id, { mergedInto: args.into });
+      const aliases = await ctx.db
+        .query("vocabularyAliases")
+        .withIndex("by_term", (q) => q.eq("projectId", args.projectId).eq("kind", args.kind).eq("termId", termId))
+        .collect();
+      for (const alias of aliases) {
+        await ctx.db.patch(alias._id, { termId: args.into });
+      }
+      merged++;
+    }
+
+    if (args.label) {
+      await ctx.db.patch(target._id, { label: args.label.trim() });
+    }
+    if (merged > 0) {
+      await ctx.scheduler.runAfter(0, internal.vocabulary.migrate.migrateInsights, { projectId: args.projectId });
+    }
+    return { merged };
+  },
+});
+
+// Change a term's display label (internal)
+// Usage: npx convex run vocabulary/mutations:renameTerm '{"projectId": "...", "kind": "theme", "termId": 2, "label": "UX"}'
+export const renameTerm = internalMutation({
+  args: {
+    projectId: v.id("projects"),
+    kind: termKindValidator,
+    termId: v.number(),
+    label: v.string(),
+  },
+  handler: async (ctx, args) => {
+    const term = await getTerm(ctx, args.projectId, args.kind, args.termId);
+    if (!term) throw new Error(`Term ${args.termId} not found`);
+    await ctx.db.patch(term._id, { label: args.label.trim() });
+  },
+});
+
+// Map a spelling to a term before the model produces it (internal)
+// Usage: npx convex run vocabulary/mutations:addAlias '{"projectId": "...", "kind": "entity", "alias": "MS Teams", "termId": 7}'
+export const addAlias = internalMutation({
+  args: {
+    projectId: v.id("projects"),
+    kind: termKindValidator,
+    alias: v.string(),
+    termId: v.number(),
+  },
+  handler: async (ctx, args) => {
+    const term = await getTerm(ctx, args.projectId, args.kind, args.termId);
+    if (!term) throw new Error(`Term ${args.termId} not found`);
+    const alias = normalizeTerm(args.kind, args.alias);
+    if (!alias) throw new Error("Alias is empty after normalization");
+
+    const existing = await ctx.db
+      .query("vocabularyAliases")
+      .withIndex("by_alias", (q) => q.eq("projectId", args.projectId).eq("kind", args.kind).eq("alias", alias))
+      .first();
+    if (existing) {
+      await ctx.db.patch(existing._id, { termId: args.termId });
+    } else {
+      await ctx.db.insert("vocabularyAliases", { projectId: args.projectId, kind: args.kind, alias, termId: args.termId });
+    }
+    return alias;
+  },
+});
+
+// Delete a project's vocabulary (used when a project is removed)
+export async function deleteProjectVocabulary(ctx: MutationCtx, projectId: Id<"projects">) {
+  const terms = await ctx.db
+    .query("vocabularyTerms")
+    .withIndex("by_project_term", (q) => q.eq("projectId", projectId))
+    .collect();
+  for (const term of terms) {
+    await ctx.db.delete(term._id);
+  }
+
+  const aliases = await ctx.db
+    .query("vocabularyAliases")
+    .withIndex("by_alias", (q) => q.eq("projectId", projectId))
+    .collect();
+  for (const alias of aliases) {
+    await ctx.db.delete(alias._id);
+  }
+}
@@ -0,0 +1,95 @@
+import { v } from "convex/values";
+import { internalQuery } from "../_generated/server";
+import { termKindValidator } from "../schema";
+import { Vocabulary, normalizeTerm } from "./terms";
+
+// Terms compared by suggestMerges (pairwise)
+const MAX_SUGGEST_TERMS = 2000;
+
+// All project IDs (internal - used by migrateInsights)
+export const listProjectIds = internalQuery({
+  args: {},
+  handler: async (ctx) => {
+    const projects = await ctx.db.query("projects").collect();
+    return projects.map((project) => project._id);
+  },
+});
+
+// A project's canonical terms with their spellings and insight counts (internal)
+// Usage: npx convex run vocabulary/queries:listTerms '{"projectId": "...", "kind": "theme"}'
+export const listTerms = internalQuery({
+  args: {
+    projectId: v.id("projects"),
+    kind: termKindValidator,
+  },
+  handler: async (ctx, args) => {
+    const vocabulary = await Vocabulary.load(ctx, args.projectId);
+    const insights = await ctx.db
+      .query("insights")
+      .withIndex("by_project", (q) => q.eq("projectId", args.projectId))
+      .collect();
+
+    const counts = new Map<number, number>();
+    for (const insight of insights) {
+      for (const id of vocabulary.ids(args.kind, insight)) {
+        counts.set(id, (counts.get(id) ?? 0) + 1);
+      }
+    }
+
+    return vocabulary
+      .terms(args.kind)
+      .map((term) => ({ ...term, insights: counts.get(term.termId) ?? 0 }))
+      .sort((a, b) => b.insights - a.insights);
+  },
+});
+
+// Edit distance, bailing out once it exceeds max
+function withinDistance(a: string, b: string, max: number): boolean {
+  if (Math.abs(a.length - b.length) > max) return false;
+  let previous = Array.from({ length: b.length + 1 }, (_, j) => j);
+  for (let i = 1; i <= a.length; i++) {
+    const current = [i];
+    for (let j = 1; j <= b.length; j++) {
+      current[j] = Math.min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (a[i - 1] === b[j - 1] ? 0 : 1));
+    }
+    if (Math.min(...current) > max) return false;
+    previous = current;
+  }
+  return previous[b.length] <= max;
+}
+
+// Likely duplicates among a project's terms: same letters ignoring spaces and
+// punctuation ("dark mode" / "dark-mode"), or one typo apart (internal)
+// Usage: npx convex run vocabulary/queries:suggestMerges '{"projectId": "...", "kind": "entity"}'
+export const suggestMerges = internalQuery({
+  args: {
+    projectId: v.id("projects"),
+    kind: termKindValidator,
+  },
+  handler: async (ctx, args) => {
+    const terms = (
+      await ctx.db
+        .query("vocabularyTerms")
+        .withIndex("by_project_term", (q) => q.eq("projectId", args.projectId).eq("kind", args.kind))
+        .collect()
+    )
+      .filter((term) => term.mergedInto === undefined)
+      .slice(0, MAX_SUGGEST_TERMS)
+      .map((term) => ({ ...term, key: normalizeTerm(args.kind, term.label).replace(/[\s.\-]+/g, "") }));
+
+    const suggestions: { termIds: number[]; labels: string[] }[] = [];
+    for (let i = 0; i < terms.length; i++) {
+      for (let j = i + 1; j < terms.length; j++) {
+        const a = terms[i].key;
+        const b = terms[j].key;
+        if (a === b || (Math.min(a.length, b.length) >= 6 && withinDistance(a, b, 1))) {
+          suggestions.push({
+            termIds: [terms[i].termId, terms[j].termId],
+            labels: [terms[i].label, terms[j].label],
+          });
+        }
+      }
+    }
+    return suggestions;
+  },
+});
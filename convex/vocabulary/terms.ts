@@ -0,0 +1,191 @@
+import { MutationCtx, QueryCtx } from "../_generated/server";
+import { Doc, Id } from "../_generated/dataModel";
+
+// Per-project theme/entity vocabulary
+// Insights store integer term IDs (themeIds/entityIds); vocabularyAliases maps
+// every normalized spelling seen to its term, so "UX", "ux" and "User Experience"
+// resolve to one ID with a single index lookup.
+
+export type TermKind = "theme" | "entity";
+
+// Theme spellings Gemini uses for the same thing (keys and values normalized)
+const THEME_SYNONYMS: Record<string, string> = {
+  "user experience": "ux",
+  "usability": "ux",
+  "ui ux": "ux",
+  "ux ui": "ux",
+  "user interface": "ux",
+  "price": "pricing",
+  "cost": "pricing",
+  "billing": "pricing",
+  "speed": "performance",
+  "latency": "performance",
+  "feature request": "feature",
+  "new feature": "feature",
+  "bug report": "bug",
+  "customer support": "support",
+  "customer service": "support",
+  "competitor comparison": "comparison",
+  "competition": "comparison",
+  "help request": "question",
+  "release": "announcement",
+  "launch": "announcement",
+};
+
+// Lower-case, drop possessives and punctuation (keeping +#. for names like C++ or Node.js)
+function baseKey(raw: string): string {
+  return raw
+    .normalize("NFKC")
+    .toLowerCase()
+    .replace(/['’]s\b/g, "")
+    .replace(/[^\p{L}\p{N}+#.]+/gu, " ")
+    .replace(/(^|\s)\.+|\.+(\s|$)/g, " ")
+    .trim()
+    .replace(/\s+/g, " ");
+}
+
+// Normalized key for a raw theme/entity string ("" when nothing is left)
+export function normalizeTerm(kind: TermKind, raw: string): string {
+  const key = baseKey(raw);
+  if (kind === "entity") return key;
+
+  // Themes: singular last word, then known synonyms
+  const singular = /[a-z]{3}s$/.test(key) && !/(ss|us|is|ws)$/.test(key) ? key.slice(0, -1) : key;
+  return THEME_SYNONYMS[singular] ?? THEME_SYNONYMS[key] ?? singular;
+}
+
+async function findAlias(ctx: QueryCtx, projectId: Id<"projects">, kind: TermKind, alias: string) {
+  return await ctx.db
+    .query("vocabularyAliases")
+    .withIndex("by_alias", (q) => q.eq("projectId", projectId).eq("kind", kind).eq("alias", alias))
+    .first();
+}
+
+// Term IDs for raw strings, creating terms for spellings never seen before
+export async function resolveTermIds(
+  ctx: MutationCtx,
+  projectId: Id<"projects">,
+  kind: TermKind,
+  values: string[]
+): Promise<number[]> {
+  const ids: number[] = [];
+  for (const value of values) {
+    const label = value.trim();
+    const key = normalizeTerm(kind, label);
+    if (!key) continue;
+
+    let termId = (await findAlias(ctx, projectId, kind, key))?.termId;
+    if (termId === undefined) {
+      const last = await ctx.db
+        .query("vocabularyTerms")
+        .withIndex("by_project_term", (q) => q.eq("projectId", projectId).eq("kind", kind))
+        .order("desc")
+        .first();
+      termId = (last?.termId ?? -1) + 1;
+      await ctx.db.insert("vocabularyTerms", { projectId, kind, termId, label, createdAt: Date.now() });
+      await ctx.db.insert("vocabularyAliases", { projectId, kind, alias: key, termId });
+    }
+    if (!ids.includes(termId)) ids.push(termId);
+  }
+  return ids;
+}
+
+// Insight with theme/entity labels, the shape the dashboard and exports read
+export type LabeledInsight = Doc<"insights"> & { themes: string[]; entities: string[] };
+
+// A canonical term as listed for operators
+export type VocabularyTerm = { termId: number; label: string; aliases: string[] };
+
+// A project's vocabulary loaded once per query; aggregations key on canonical
+// term IDs and only turn them into labels for the response
+export class Vocabulary {
+  private readonly labels = { theme: new Map<number, string>(), entity: new Map<number, string>() };
+  private readonly mergedInto = { theme: new Map<number, number>(), entity: new Map<number, number>() };
+  private readonly aliases = { theme: new Map<string, number>(), entity: new Map<string, number>() };
+  private nextLocalId = -1; // Legacy strings missing from the vocabulary get negative IDs
+
+  constructor(terms: Doc<"vocabularyTerms">[], aliases: Doc<"vocabularyAliases">[]) {
+    for (const term of terms) {
+      this.labels[term.kind].set(term.termId, term.label);
+      if (term.mergedInto !== undefined) this.mergedInto[term.kind].set(term.termId, term.mergedInto);
+    }
+    for (const alias of aliases) {
+      this.aliases[alias.kind].set(alias.alias, alias.termId);
+    }
+  }
+
+  static async load(ctx: QueryCtx, projectId: Id<"projects">): Promise<Vocabulary> {
+    const terms = await ctx.db
+      .query("vocabularyTerms")
+      .withIndex("by_project_term", (q) => q.eq("projectId", projectId))
+      .collect();
+    const aliases = await ctx.db
+      .query("vocabularyAliases")
+      .withIndex("by_alias", (q) => q.eq("projectId", projectId))
+      .collect();
+    return new Vocabulary(terms, aliases);
+  }
+
+  // Follow merges to the surviving term
+  canonical(kind: TermKind, termId: number): number {
+    let id = termId;
+    for (let next = this.mergedInto[kind].get(id); next !== undefined; next = this.mergedInto[kind].get(id)) {
+      id = next;
+    }
+    return id;
+  }
+
+  // Canonical ID of a raw string; one never seen gets the local ID legacy
+  // insights with the same spelling get, so filters still match them
+  lookup(kind: TermKind, raw: string): number {
+    return this.legacyId(kind, raw);
+  }
+
+  // Canonical terms with their spellings (terms merged into another left out)
+  terms(kind: TermKind): VocabularyTerm[] {
+    const aliases = new Map<number, string[]>();
+    for (const [alias, termId] of this.aliases[kind]) {
+      const spellings = aliases.get(termId);
+      if (spellings) spellings.push(alias);
+      else aliases.set(termId, [alias]);
+    }
+    const terms: VocabularyTerm[] = [];
+    for (const [termId, label] of this.labels[kind]) {
+      if (termId < 0 || this.mergedInto[kind].has(termId)) continue;
+      terms.push({ termId, label, aliases: aliases.get(termId) ?? [] });
+    }
+    return terms;
+  }
+
+  label(kind: TermKind, termId: number): string {
+    return this.labels[kind].get(termId) ?? `#${termId}`;
+  }
+
+  // Canonical, de-duplicated term IDs of an insight (legacy string arrays included)
+  ids(kind: TermKind, insight: Doc<"insights">): number[] {
+    const stored = kind === "theme" ? insight.themeIds : insight.entityIds;
+    const ids = stored
+      ? stored.map((id) => this.canonical(kind, id))
+      : (kind === "theme" ? insight.themes : insight.entities)?.map((raw) => this.legacyId(kind, raw)) ?? [];
+    return ids.length > 1 ? [...new Set(ids)] : ids;
+  }
+
+  private legacyId(kind: TermKind, raw: string): number {
+    const key = normalizeTerm(kind, raw);
+    let id = this.aliases[kind].get(key);
+    if (id === undefined) {
+      id = this.nextLocalId--;
+      this.aliases[kind].set(key, id);
+      this.labels[kind].set(id, raw.trim());
+    }
+    return this.canonical(kind, id);
+  }
+
+  withLabels(insight: Doc<"insights">): LabeledInsight {
+    return {
+      ...insight,
+      themes: this.ids("theme", insight).map((id) => this.label("theme", id)),
+      entities: this.ids("entity", insight).map((id) => this.label("entity", id)),
+    };
+  }
+}
@@ -1,67 +1,85 @@
-// CSV Export utilities
+// Export utilities
+// CSV is generated and streamed by the Convex HTTP route in convex/exports/csv.ts
 
-export interface InsightExport {
-  title: string;
-  url: string;
-  publishedAt: string;
-  analyzedAt: string;
-  sentimentScore: number;
-  sentimentLabel: string;
-  actionability: string;
-  summary: string;
-  themes: string;
-  entities: string;
+// Base URL for Convex HTTP actions (served from .convex.site, not .convex.cloud)
+export function convexSiteUrl(): string {
+  return (
+    // || not ??: .env.local.example ships the variable empty
+    process.env.NEXT_PUBLIC_CONVEX_SITE_URL ||
+    process.env.NEXT_PUBLIC_CONVEX_URL!.replace(/\.cloud$/, ".site")
+  );
 }
 
-export function insightsToCSV(insights: InsightExport[]): string {
-  const headers = [
-    "Title",
-    "URL",
-    "Published At",
-    "Analyzed At",
-    "Sentiment Score",
-    "Sentiment Label",
-    "Actionability",
-    "Summary",
-    "Themes",
-    "Entities",
-  ];
+export type ExportResult = "downloaded" | "empty" | "cancelled";
 
-  const escapeCSV = (value: string | number): string => {
-    const stringValue = String(value);
-    // If the value contains a comma, newline, or quote, wrap it in quotes and escape any quotes
-    if (
-      stringValue.includes(",") ||
-      stringValue.includes("\n") ||
-      stringValue.includes('"')
-    ) {
-      return `"${stringValue.replace(/"/g, '""')}"`;
-    }
-    return stringValue;
-  };
+// File System Access API (Chromium); showSaveFilePicker is not in TypeScript's DOM lib
+type SaveFilePicker = (options: {
+  suggestedName?: string;
+  types?: { description: string; accept: Record<string, string[]> }[];
+}) => Promise<FileSystemFileHandle>;
+
+function saveFilePicker(): SaveFilePicker | undefined {
+  return (window as unknown as { showSaveFilePicker?: SaveFilePicker }).showSaveFilePicker;
+}
 
-  const rows = insights.map((insight) =>
-    [
-      insight.title,
-      insight.url,
-      insight.publishedAt,
-      insight.analyzedAt,
-      insight.sentimentScore,
-      insight.sentimentLabel,
-      insight.actionability,
-      insight.summary,
-      insight.themes,
-      insight.entities,
-    ]
-      .map(escapeCSV)
-      .join(",")
+function insightsCSVRequest(projectId: string, token: string | null): Promise<Response> {
+  return fetch(
+    `${convexSiteUrl()}/export/insights.csv?projectId=${encodeURIComponent(projectId)}`,
+    { headers: token ? { Authorization: `Bearer ${token}` } : {} }
   );
+}
+
+// Download a streamed insights CSV for a project. Where the browser can write
+// files directly, the response body is piped to the file the user picks, so
+// the CSV is never held in memory. Elsewhere it is collected into a Blob first
+// (known limit: the whole export is buffered by the browser).
+export async function downloadInsightsCSV(
+  projectId: string,
+  token: string | null,
+  fallbackFilename: string
+): Promise<ExportResult> {
+  const showSaveFilePicker = saveFilePicker();
+  if (showSaveFilePicker) {
+    // Ask first: the picker needs the click's user activation, which a fetch can outlast
+    let file: FileSystemFileHandle;
+    try {
+      file = await showSaveFilePicker({
+        suggestedName: fallbackFilename,
+        types: [{ description: "CSV file", accept: { "text/csv": [".csv"] } }],
+      });
+    } catch (error) {
+      if (error instanceof DOMException && error.name === "AbortError") return "cancelled";
+      throw error;
+    }
+
+    const writable = await file.createWritable();
+    const response = await insightsCSVRequest(projectId, token);
+    if (!response.ok || response.status === 204 || !response.body) {
+      await writable.abort();
+      if (!response.ok) throw new Error(`Export failed: ${response.status} ${await response.text()}`);
+      return "empty";
+    }
+    // pipeTo closes the file when the stream ends (and aborts it on error)
+    await response.body.pipeTo(writable);
+    return "downloaded";
+  }
+
+  const response = await insightsCSVRequest(projectId, token);
+  if (!response.ok) {
+    throw new Error(`Export failed: ${response.status} ${await response.text()}`);
+  }
+
+  // The server answers 204 when the project has no insights
+  if (response.status === 204) return "empty";
 
-  return [headers.join(","), ...rows].join("\n");
+  const blob = await response.blob();
+  const disposition = response.headers.get("Content-Disposition");
+  const filename = disposition?.match(/filename="([^"]+)"/)?.[1] ?? fallbackFilename;
+  downloadBlob(blob, filename);
+  return "downloaded";
 }
 
-export function downloadCSV(content: string, filename: string): void {
-  const blob = new Blob([content], { type: "text/csv;charset=utf-8;" });
+export function downloadBlob(blob: Blob, filename: string): void {
   const url = URL.createObjectURL(blob);
   const link = document.createElement("a");
   link.setAttribute("href", url);
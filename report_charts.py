@@ -0,0 +1,237 @@
+"""
+Analytics charts for the DOCX report (Appendix B)
+Builds the volume trend, competitor mention and sentiment charts from insight CSV
+exports (dashboard export or `scripts/insight_snapshot.py csv`) and renders them
+to PNG with matplotlib's Agg backend in a process pool. PNGs are cached by a hash
+of each chart's input series, so unchanged charts are never re-rasterized.
+
+    python report_charts.py insights/acme.csv insights/globex.csv --competitors notion,asana
+"""
+import argparse
+import csv
+import hashlib
+import json
+import os
+import sys
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timedelta
+
+try:
+    import matplotlib
+except ImportError:  # Optional: cached charts are still embedded without it
+    matplotlib = None
+
+DEFAULT_CACHE_DIR = '.chart_cache'
+
+# Bump when the drawing code changes so cached PNGs are re-rendered
+CHART_STYLE = {'version': 1, 'size': (8.0, 3.4), 'dpi': 150}
+
+# Same colors as the dashboard charts and the report palette
+CHART_COLORS = {
+    'volume': '#3182ce',       # accent_blue
+    'moving_avg': '#c53030',   # red
+    'positive': '#22c55e',
+    'neutral': '#94a3b8',
+    'negative': '#ef4444',
+    'text': '#333333',
+    'grid': '#e2e8f0',         # card_border
+}
+
+MOVING_AVG_DAYS = 7
+TOP_ENTITIES = 8  # Bars shown when no competitors are given
+
+
+def read_insights(path):
+    """Rows of an insight CSV export as dicts with parsed day, score and lists"""
+    rows = []
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        for row in csv.DictReader(f):
+            rows.append({
+                'day': datetime.fromisoformat(row['Analyzed At'].replace('Z', '+00:00')).date().isoformat(),
+                'score': float(row['Sentiment Score'] or 0),
+                'label': row['Sentiment Label'],
+                'entities': [e.strip() for e in row['Entities'].split(';') if e.strip()],
+            })
+    return rows
+
+
+def _day_range(days):
+    """Every ISO day from the first to the last of days (gaps filled)"""
+    first, last = date.fromisoformat(min(days)), date.fromisoformat(max(days))
+    return [(first + timedelta(n)).isoformat() for n in range((last - first).days + 1)]
+
+
+def chart_specs(name, rows, competitors=None):
+    """Volume trend, competitor mention and sentiment chart specs for one project"""
+    if not rows:
+        return []
+    days = _day_range([row['day'] for row in rows])
+    per_day = Counter(row['day'] for row in rows)
+    counts = [per_day[day] for day in days]
+    moving_avg = [
+        round(sum(counts[max(0, i - MOVING_AVG_DAYS + 1):i + 1]) / min(i + 1, MOVING_AVG_DAYS), 2)
+        for i in range(len(counts))
+    ]
+
+    labels = defaultdict(Counter)
+    for row in rows:
+        labels[row['day']][row['label']] += 1
+
+    # Mentions and average sentiment per competitor (substring match, as on the dashboard)
+    mentions = defaultdict(lambda: [0, 0.0])
+    keys = [c.lower() for c in competitors] if competitors else None
+    display = dict(zip(keys, competitors)) if keys else {}
+    for row in rows:
+        for entity in row['entities']:
+            entity_lower = entity.lower()
+            display.setdefault(entity_lower, entity)
+            matched = [c for c in keys if c in entity_lower or entity_lower in c] if keys else [entity_lower]
+            for comp in matched:
+                mentions[comp][0] += 1
+                mentions[comp][1] += row['score']
+    top = sorted(mentions.items(), key=lambda item: -item[1][0])[:len(keys) if keys else TOP_ENTITIES]
+
+    return [
+        {
+            'kind': 'volume',
+            'title': f'{name}: Insight Volume',
+            'days': days,
+            'counts': counts,
+            'moving_avg': moving_avg,
+        },
+        {
+            'kind': 'competitors',
+            'title': f'{name}: {"Competitor" if keys else "Entity"} Mentions',
+            'names': [display[comp] for comp, _ in top],
+            'mentions': [n for _, (n, _) in top],
+            'avg_sentiment': [round(total / n, 3) for _, (n, total) in top],
+        },
+        {
+            'kind': 'sentiment',
+            'title': f'{name}: Sentiment by Day',
+            'days': days,
+            **{label: [labels[day][label] for day in days] for label in ('positive', 'neutral', 'negative')},
+        },
+    ]
+
+
+def chart_key(spec):
+    """Cache key: hash of the chart's input series and the drawing style"""
+    payload = json.dumps({'spec': spec, 'style': CHART_STYLE}, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:32]
+
+
+def _bar_color(sentiment):
+    if sentiment > 0.2:
+        return CHART_COLORS['positive']
+    if sentiment < -0.2:
+        return CHART_COLORS['negative']
+    return CHART_COLORS['neutral']
+
+
+def render_chart(spec, path):
+    """Draw one chart spec to a PNG at path (runs in a pool worker)"""
+    matplotlib.use('Agg')  # Headless; must be selected before pyplot is imported
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots(figsize=CHART_STYLE['size'])
+    try:
+        if spec['kind'] == 'volume':
+            x = range(len(spec['days']))
+            ax.fill_between(x, spec['counts'], color=CHART_COLORS['volume'], alpha=0.2)
+            ax.plot(x, spec['counts'], color=CHART_COLORS['volume'], linewidth=2, label='Insights')
+            ax.plot(x, spec['moving_avg'], color=CHART_COLORS['moving_avg'], linewidth=2,
+                    linestyle='--', label=f'{MOVING_AVG_DAYS}-day Moving Avg')
+            _day_ticks(ax, spec['days'])
+            ax.legend(loc='upper left', frameon=False, fontsize=8)
+        elif spec['kind'] == 'competitors':
+            y = range(len(spec['names']))
+            ax.barh(y, spec['mentions'], color=[_bar_color(s) for s in spec['avg_sentiment']])
+            ax.set_yticks(list(y), spec['names'], fontsize=8)
+            ax.invert_yaxis()
+            ax.set_xlabel('Mentions', fontsize=8)
+        elif spec['kind'] == 'sentiment':
+            # Stacked areas: 3 artists instead of 3 bar patches per day
+            labels = ('positive', 'neutral', 'negative')
+            ax.stackplot(range(len(spec['days'])), *(spec[label] for label in labels),
+                         colors=[CHART_COLORS[label] for label in labels],
+                         labels=[label.title() for label in labels], alpha=0.85)
+            _day_ticks(ax, spec['days'])
+            ax.legend(loc='upper left', frameon=False, fontsize=8)
+        else:
+            raise ValueError(f'Unknown chart kind: {spec["kind"]}')
+
+        ax.set_title(spec['title'], loc='left', fontsize=11, color=CHART_COLORS['text'])
+        ax.grid(axis='y' if spec['kind'] != 'competitors' else 'x', color=CHART_COLORS['grid'], linestyle='--')
+        ax.set_axisbelow(True)
+        ax.spines[['top', 'right']].set_visible(False)
+        ax.tick_params(labelsize=8)
+        # Fixed margins: tight_layout would draw the figure an extra time
+        fig.subplots_adjust(left=0.2 if spec['kind'] == 'competitors' else 0.07, right=0.98, top=0.88, bottom=0.14)
+        # Write then rename, so a crashed worker never leaves a truncated cache entry
+        fig.savefig(path + '.part', format='png', dpi=CHART_STYLE['dpi'])
+        os.replace(path + '.part', path)
+    finally:
+        plt.close(fig)
+    return path
+
+
+def _day_ticks(ax, days):
+    """At most ~8 date labels along the x axis"""
+    step = max(1, len(days) // 8)
+    ticks = list(range(0, len(days), step))
+    ax.set_xticks(ticks, [days[i][5:] for i in ticks], fontsize=8)
+
+
+def render_charts(specs, cache_dir=DEFAULT_CACHE_DIR, workers=None):
+    """PNG path for each spec (in order), rendering only charts not in the cache; returns (paths, rendered)"""
+    os.makedirs(cache_dir, exist_ok=True)
+    paths = [os.path.join(cache_dir, f'{chart_key(spec)}.png') for spec in specs]
+    missing = {path: spec for path, spec in zip(paths, specs) if not os.path.exists(path)}
+    if not missing:
+        return paths, 0
+    if matplotlib is None:
+        raise RuntimeError('matplotlib is required to render charts (pip install matplotlib)')
+
+    workers = min(workers or os.cpu_count() or 1, len(missing))
+    if workers == 1:
+        # Not worth a pool: render in this process
+        for path, spec in missing.items():
+            render_chart(spec, path)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(render_chart, missing.values(), missing.keys()))
+    return paths, len(missing)
+
+
+def project_name(path):
+    """Report name for an insight CSV (file name without extension)"""
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Render report charts from insight CSV exports')
+    parser.add_argument('csv', nargs='+', help='Insight CSV export, one per project')
+    parser.add_argument('--competitors', help='Comma-separated competitor names (default: top entities)')
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR)
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args()
+
+    competitors = [c.strip() for c in args.competitors.split(',')] if args.competitors else None
+    specs = []
+    for path in args.csv:
+        specs.extend(chart_specs(project_name(path), read_insights(path), competitors))
+
+    started = time.perf_counter()
+    try:
+        paths, rendered = render_charts(specs, args.cache_dir, args.workers)
+    except RuntimeError as e:
+        sys.exit(str(e))
+    print(f'{len(paths)} chart(s), {rendered} rendered, {len(paths) - rendered} cached '
+          f'in {time.perf_counter() - started:.2f}s -> {args.cache_dir}')
+
+
+if __name__ == '__main__':
+    main()
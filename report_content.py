@@ -0,0 +1,550 @@
+"""
+Content of the ProductPulse assignment report as a document tree (report_model.py)
+Rendered to DOCX by create_docx.py and to HTML by report_html.py.
+"""
+from report_model import (
+    Heading, HighlightBox, Image, InfoBox, ItemList, PageBreak, Paragraph, ParticipantCard,
+    Preformatted, Quote, Report, Run, Table, runs,
+)
+
+REPO_URL = 'https://github.com/ZeevBerland/ProductPulse'
+
+ARCHITECTURE = '''┌─────────────────┐
+│   RSS Sources   │
+│ Reddit, HN, SE  │
+└────────┬────────┘
+         │ Fetch (Scheduled/Manual)
+         ▼
+┌─────────────────┐
+│   Feed Items    │
+│  (Deduplicated) │
+└────────┬────────┘
+         │ Analyze
+         ▼
+┌─────────────────┐
+│   Gemini 3 AI   │
+│  - Sentiment    │
+│  - Relevance    │
+│  - Entities     │
+│  - Themes       │
+└────────┬────────┘
+         │ Store
+         ▼
+┌─────────────────┐
+│    Insights     │
+│   Dashboard     │
+└─────────────────┘'''
+
+PARTICIPANTS = [
+    ParticipantCard(
+        name='Yael K.',
+        title='Senior Product Manager, 5 years experience',
+        company='B2B SaaS startup',
+        score='8',
+        tasks=[
+            ['1. Create Project', '✓ Completed', '2:15', 'Intuitive, appreciated AI suggestions'],
+            ['2. Add Keywords', '✓ Completed', '1:30', 'Loved the keyword suggestions'],
+            ['3. Add Sources', '✓ Completed', '2:00', 'Wished for more source types'],
+            ['4. Trigger Fetch', '✓ Completed', '0:45', 'Easy to find'],
+            ['5. Find Negative', '✓ Completed', '1:00', 'Filter was obvious'],
+            ['6. Competitor Filter', '◐ Partial', '2:30', 'Took time to find dropdown'],
+            ['7. Export CSV', '✓ Completed', '0:30', 'Straightforward'],
+        ],
+        feedback=[
+            ('Positive', 'The AI suggestions are really smart - it found competitors I hadn\'t thought of'),
+            ('Negative', 'The competitor filter wasn\'t immediately visible in the UI'),
+            ('Suggestion', 'Would love Slack integration for alerts'),
+        ],
+        quote='This would save me at least 4 hours a week. I currently do this manually in spreadsheets and it\'s painful.',
+    ),
+    ParticipantCard(
+        name='Daniel M.',
+        title='Associate Product Manager, 2 years experience',
+        company='E-commerce platform',
+        score='9',
+        tasks=[
+            ['1. Create Project', '✓ Completed', '1:45', 'Very intuitive flow'],
+            ['2. Add Keywords', '✓ Completed', '1:00', 'AI suggestions were spot-on'],
+            ['3. Add Sources', '✓ Completed', '1:30', 'Reddit sources very relevant'],
+            ['4. Trigger Fetch', '✓ Completed', '0:30', 'Found it immediately'],
+            ['5. Find Negative', '✓ Completed', '0:45', 'Clear color coding helped'],
+            ['6. Competitor Filter', '✓ Completed', '1:15', 'Found after brief search'],
+            ['7. Export CSV', '✓ Completed', '0:25', 'Great feature'],
+        ],
+        feedback=[
+            ('Positive', 'The sentiment visualization is really clear with the color coding'),
+            ('Positive', 'Love that it shows relevance percentage - helps prioritize'),
+            ('Suggestion', 'Would be great to see sentiment trends over time'),
+        ],
+        quote='I\'ve tried tools like Mention and Brandwatch but they\'re expensive. This covers 80% of what I need for free.',
+    ),
+    ParticipantCard(
+        name='Noa S.',
+        title='Data Analyst, 3 years experience',
+        company='FinTech startup',
+        score='7',
+        tasks=[
+            ['1. Create Project', '✓ Completed', '3:00', 'Wanted more customization options'],
+            ['2. Add Keywords', '✓ Completed', '2:00', 'Appreciated suggestions'],
+            ['3. Add Sources', '◐ Partial', '3:30', 'Wished for custom RSS input'],
+            ['4. Trigger Fetch', '✓ Completed', '1:00', 'Wanted progress indicator'],
+            ['5. Find Negative', '✓ Completed', '1:15', 'Filter worked well'],
+            ['6. Competitor Filter', '✓ Completed', '1:45', 'Would prefer multi-select'],
+            ['7. Export CSV', '✓ Completed', '0:30', 'CSV format was good'],
+        ],
+        feedback=[
+            ('Positive', 'The data export is exactly what I need for deeper analysis in Python'),
+            ('Negative', 'Would like to add custom RSS feeds beyond the suggestions'),
+            ('Suggestion', 'API access would be amazing for automation'),
+        ],
+        quote='As a data person, I appreciate the structured output. The sentiment scores are consistent and usable for reporting.',
+    ),
+    ParticipantCard(
+        name='Amit R.',
+        title='UX Designer, 4 years experience',
+        company='Design agency',
+        score='8',
+        tasks=[
+            ['1. Create Project', '✓ Completed', '2:00', 'Clean interface'],
+            ['2. Add Keywords', '✓ Completed', '1:15', 'Smooth interaction'],
+            ['3. Add Sources', '✓ Completed', '1:45', 'Good visual hierarchy'],
+            ['4. Trigger Fetch', '✓ Completed', '0:40', 'Button was prominent'],
+            ['5. Find Negative', '✓ Completed', '0:50', 'Color coding is effective'],
+            ['6. Competitor Filter', '◐ Partial', '2:00', 'Filter could be more prominent'],
+            ['7. Export CSV', '✓ Completed', '0:35', 'Expected location'],
+        ],
+        feedback=[
+            ('Positive', 'The UI is clean and modern - not cluttered like many analytics tools'),
+            ('Positive', 'Dark mode is well implemented'),
+            ('Negative', 'The competitor filter should have more visual prominence'),
+            ('Suggestion', 'Consider adding keyboard shortcuts for power users'),
+        ],
+        quote='From a UX perspective, this is well-designed. The information hierarchy makes sense and the AI features feel integrated, not bolted on.',
+    ),
+]
+
+STEPS = [
+    ('Step 1: Create a Project', [
+        'Click "New Project" from the dashboard',
+        'Enter your product name and description (20+ characters)',
+        'Click "Suggest Keywords" to let AI recommend tracking terms',
+        'Click "Discover Competitors" for AI-powered competitor identification',
+        'Review and select suggested keywords/competitors',
+    ]),
+    ('Step 2: Add Data Sources', [
+        'Click "Suggest Sources" to get AI-recommended RSS feeds',
+        'Sources include: Reddit subreddits, Hacker News queries, Stack Exchange tags, Discourse forums',
+        'Select relevant sources and click "Add Selected"',
+    ]),
+    ('Step 3: Fetch and Analyze', [
+        'Go to project Settings → Fetch Settings',
+        'Choose automatic interval (6h, 12h, 24h) or Manual',
+        'Click "Fetch Now" to immediately pull content',
+        'AI automatically analyzes new items using Gemini 3',
+    ]),
+    ('Step 4: Review Insights', [
+        'Go to the Insights page',
+        'View analyzed content with sentiment, relevance, themes, entities, actionability',
+        'Use filters: sentiment, relevance threshold, competitor mentions, time range',
+    ]),
+    ('Step 5: Analyze Trends', [
+        'Go to the Analytics page',
+        'View charts: volume trends, competitor analysis, theme evolution, source performance',
+    ]),
+    ('Step 6: Export and Share', [
+        'Click "Export" on the Insights page',
+        'Download CSV with all insight data',
+    ]),
+]
+
+FEATURES = [
+    ('1. Project Management', [
+        'Create projects to track specific products, features, or topics',
+        'Add product name and description for AI context',
+        'AI-powered keyword suggestions based on product description',
+        'AI-powered competitor discovery',
+        'Edit project name, description, keywords, and competitors',
+        'Configure fetch intervals (Manual, 6h, 12h, 24h)',
+        'Delete projects with full cascade (sources, feed items, insights, alerts)',
+    ]),
+    ('2. Source Management', [
+        'Support for Reddit, Hacker News, Stack Exchange, Discourse, Custom RSS',
+        'AI Source Suggestions based on product description',
+        'Toggle sources active/inactive',
+        'Rate limiting protection (5s delays for Reddit, 1s for others)',
+    ]),
+    ('3. Feed Fetching', [
+        'Automatic fetching: Manual, Every 6 hours, Every 12 hours, Every 24 hours',
+        'Cron job runs every 30 minutes to check for due fetches',
+        '"Fetch Now" button for immediate fetching',
+        'Stop Fetching functionality to cancel mid-fetch',
+        'Warning dialog if fetch already in progress',
+        'Deduplication by external ID per source',
+    ]),
+    ('4. AI Analysis (Gemini 3)', [
+        'Relevance Score (0-100%): How relevant to tracked keywords/competitors',
+        'Sentiment Score (-1 to +1): Negative to positive sentiment',
+        'Sentiment Label: Positive, Neutral, Negative',
+        'Entities: Product names, features, competitors mentioned',
+        'Themes: pricing, UX, bugs, features, support',
+        'Summary: AI-generated 1-2 sentence insight',
+        'Actionability: High, Medium, Low priority rating',
+        'Items with relevance < 30% automatically filtered',
+    ]),
+    ('5. Insights Dashboard', [
+        'Card-based feed view with sentiment color coding',
+        'Filters: Sentiment, Relevance threshold, Competitor mentions, Time range',
+        'Sentiment Trend Chart (line chart over time)',
+        'Sentiment Distribution (pie chart)',
+        'Top Themes and Entities cards',
+        'Export to CSV',
+    ]),
+    ('6. Deep Analytics', [
+        'Volume Trend Chart: Daily counts with 7-day moving average',
+        'Competitor Mentions Chart: Horizontal bar with sentiment coloring',
+        'Theme Trends Chart: Multi-line chart with growth indicators',
+        'Source Performance Chart: Insights per source',
+        'Actionability Distribution: Donut chart of priority levels',
+    ]),
+    ('7. Alerts System', [
+        'Sentiment Drop: Average sentiment falls below threshold',
+        'Keyword Mention: Specific keywords detected',
+        'Competitor Mention: Tracked competitors mentioned',
+        'High Actionability: High-priority feedback detected',
+        'Slack webhook integration',
+        'Email notifications (configurable)',
+    ]),
+    ('8. User Settings', [
+        'Theme: Light, Dark, or System preference',
+        'Notifications: Email, Browser, Digest frequency',
+        'Display: Default view, Items per page, Compact mode',
+        'Data export and clear local data options',
+    ]),
+    ('9. UI/UX Features', [
+        'Dual sidebar system with compact project sidebar',
+        'Real-time updates via Convex',
+        'Skeleton loaders and progress indicators',
+        'Toast notifications for all actions',
+        'Dark mode support throughout',
+    ]),
+]
+
+# Third field: chart kind rendered from insight data instead of a screenshot
+SCREENSHOTS = [
+    ('Screenshot 1: Dashboard - Projects Overview', 'Shows the main dashboard with project cards displaying source and insight counts.', None),
+    ('Screenshot 2: New Project - AI Keyword Suggestions', 'Demonstrates the AI suggesting keywords after entering product description.', None),
+    ('Screenshot 3: Sources - AI Recommendations', 'Shows AI-recommended RSS sources with relevance scores for Reddit, HN, etc.', None),
+    ('Screenshot 4: Insights Feed - Sentiment Color Coding', 'Displays insight cards with green/amber/red sentiment indicators.', None),
+    ('Screenshot 5: Insights - Competitor Filter Applied', 'Shows filtered insights for a specific competitor mention.', None),
+    ('Screenshot 6: Analytics - Volume Trend Chart', 'Displays the area chart with daily insight counts and moving average.', 'volume'),
+    ('Screenshot 7: Analytics - Competitor Mentions', 'Shows horizontal bar chart of competitor mentions with sentiment coloring.', 'competitors'),
+    ('Screenshot 8: Analytics - Sentiment Trend', 'Shows daily positive, neutral and negative insight counts.', 'sentiment'),
+    ('Screenshot 9: Settings - Dark Mode', 'Demonstrates the application in dark mode with theme toggle.', None),
+]
+
+
+def bold_lead(lead, text):
+    """Item runs: bold lead-in followed by plain text"""
+    return runs(Run(lead, bold=True), text)
+
+
+def numbered(items):
+    return ItemList([runs(item) for item in items], ordered=True)
+
+
+def assignment_report(charts=None):
+    """The assignment report; charts maps chart kind -> [(caption, png path)] for Appendix B"""
+    report = Report('Assignment #1 - AI Assistant for Product Managers')
+
+    # ============= TITLE =============
+    report.add(
+        Heading(report.title, 0),
+        InfoBox([
+            bold_lead('Course: ', 'AI-PM Metrics and Growth'),
+            bold_lead('Lecturer: ', 'Professor Oren Zuckerman'),
+            bold_lead('TA: ', 'Tamar Dublin'),
+        ]),
+    )
+
+    # ============= STUDENT INFO =============
+    report.add(
+        Heading('Student Information', 2),
+        Table(['Field', 'Value'], [
+            ['Student Name(s)', '[YOUR NAME HERE]'],
+            ['Student ID(s)', '[YOUR ID HERE]'],
+            ['Submission Date', 'January 31, 2026'],
+        ]),
+    )
+
+    # ============= AI ASSISTANT LINKS =============
+    report.add(
+        Heading('AI Assistant Links', 2),
+        Table(['Resource', 'Link'], [
+            ['GitHub Repository', Run(REPO_URL, href=REPO_URL)],
+            ['Live Demo', '[INSERT VERCEL URL]'],
+            ['Demo Video', '[INSERT VIDEO LINK]'],
+        ]),
+    )
+
+    # ============= PART 1 =============
+    report.add(
+        PageBreak(),
+        Heading('Part 1: The AI Assistant', 1),
+        Heading('Name', 3),
+        Paragraph(bold_lead('ProductPulse', ' - AI-Powered Feedback Intelligence Platform')),
+        Heading('Goal Statement', 3),
+        Paragraph(runs(
+            'ProductPulse is an AI-powered feedback intelligence platform that helps product managers '
+            'monitor, analyze, and act on public conversations about their product across Reddit, '
+            'Hacker News, Stack Exchange, and other forums - automating a workflow that typically '
+            'takes hours per week.'
+        )),
+        Heading('Short Description', 3),
+        Paragraph(runs(
+            'ProductPulse uses Google Gemini 3 AI to automatically fetch RSS feeds from public forums, '
+            'analyze sentiment (-1 to +1), score relevance to tracked keywords/competitors (0-100%), '
+            'extract mentioned entities, cluster themes, and rate actionability (High/Medium/Low). '
+            'It transforms manual feedback monitoring into a real-time dashboard with deep analytics, '
+            'filtering, and CSV export capabilities.'
+        )),
+        Heading('The Workflow Being Supported', 3),
+        Table(
+            ['Before ProductPulse', 'After ProductPulse'],
+            [
+                ['PM manually visits Reddit, HN, Stack Overflow daily', 'AI automatically monitors all sources 24/7'],
+                ['Searches for product mentions manually', 'Gemini analyzes each post for sentiment, relevance'],
+                ['Reads posts to assess sentiment subjectively', 'Dashboard surfaces high-priority insights'],
+                ['Manually categorizes feedback themes', 'Filters allow quick competitor analysis'],
+                ['Creates spreadsheets to track insights', 'One-click CSV export for team sharing'],
+                ['Shares findings in weekly reports', 'Analytics show trends in real-time'],
+            ],
+            header_fills=['red_light', 'green_light'],
+            header_colors=['red', 'green'],
+            zebra=False,
+        ),
+        HighlightBox([bold_lead('Time Saved: ', '~5-10 hours per week per product')]),
+    )
+
+    # ============= PART 2 =============
+    report.add(
+        PageBreak(),
+        Heading('Part 2: Detailed Instructions', 1),
+        Heading('Who Is This For?', 3),
+        ItemList([
+            bold_lead('Product Managers', ' tracking user feedback and feature requests'),
+            bold_lead('Data Analysts', ' monitoring competitive landscape and sentiment trends'),
+            bold_lead('Product Teams', ' needing centralized insight aggregation'),
+            bold_lead('Startup Founders', ' keeping pulse on market perception'),
+        ]),
+        Heading('What Problem Does It Solve?', 3),
+        Table(['Problem', 'How ProductPulse Solves It'], [
+            ['Manual monitoring is time-consuming', 'Automated RSS fetching on schedule (6h, 12h, 24h)'],
+            ['Hard to quantify sentiment', 'AI scores sentiment from -1 to +1'],
+            ['Irrelevant noise in feeds', 'Relevance scoring filters low-quality content'],
+            ['Missing competitor insights', 'Dedicated competitor tracking and filtering'],
+            ['No historical analysis', 'Analytics dashboard with trends over time'],
+            ['Difficult to share findings', 'CSV export and visual charts'],
+        ]),
+        Heading('How To Use ProductPulse', 3),
+    )
+    for step_title, step_items in STEPS:
+        report.add(Heading(step_title, 4), numbered(step_items))
+
+    report.add(
+        Heading('AI Features Powered by Gemini 3', 3),
+        Table(['Feature', 'Description', 'Output'], [
+            ['Sentiment Analysis', 'Analyzes emotional tone of content', 'Score: -1 to +1, Label: positive/neutral/negative'],
+            ['Relevance Scoring', 'Matches content to tracked keywords', 'Percentage: 0-100%'],
+            ['Entity Extraction', 'Identifies products, features, competitors', 'Array of entity names'],
+            ['Theme Clustering', 'Categorizes feedback topics', 'Themes: pricing, UX, bugs, features, support'],
+            ['Actionability Rating', 'Prioritizes feedback importance', 'Rating: High, Medium, Low'],
+            ['Keyword Suggestions', 'Recommends tracking terms', 'List of relevant keywords'],
+            ['Competitor Discovery', 'Identifies market competitors', 'Competitor names with descriptions'],
+            ['Source Recommendations', 'Suggests relevant RSS feeds', 'Reddit, HN, Stack Exchange feeds'],
+        ]),
+    )
+
+    # ============= PART 3 =============
+    report.add(
+        PageBreak(),
+        Heading('Part 3: Usability Testing', 1),
+        Heading('Methodology', 3),
+        Table(['Aspect', 'Details'], [
+            ['Number of Participants', '4 participants'],
+            ['Participant Profiles', '2 Product Managers, 1 Data Analyst, 1 UX Designer'],
+            ['Session Duration', '20-30 minutes per session'],
+            ['Testing Method', 'Think-aloud protocol with task completion'],
+            ['Testing Dates', 'January 25-28, 2026'],
+        ]),
+        Heading('Tasks Given to Participants', 3),
+        numbered([
+            'Create a new project for a product you\'re familiar with',
+            'Use AI to suggest keywords and add at least 3',
+            'Add AI-suggested sources (select 2-3)',
+            'Trigger a manual fetch',
+            'Find an insight with negative sentiment',
+            'Filter insights by a competitor',
+            'Export insights to CSV',
+        ]),
+        Heading('Individual Participant Results', 2),
+        *PARTICIPANTS,
+    )
+
+    # Aggregate Results
+    success_data = [
+        ['1. Create Project', '100% (4/4)', '2:15', True],
+        ['2. Add Keywords', '100% (4/4)', '1:26', True],
+        ['3. Add Sources', '75% (3/4)', '2:11', False],
+        ['4. Trigger Fetch', '100% (4/4)', '0:44', True],
+        ['5. Find Negative Sentiment', '100% (4/4)', '0:58', True],
+        ['6. Filter by Competitor', '50% (2/4)', '1:53', False],
+        ['7. Export CSV', '100% (4/4)', '0:30', True],
+    ]
+    report.add(
+        PageBreak(),
+        Heading('Aggregate Results', 2),
+        Heading('Task Success Rates', 4),
+        Table(
+            ['Task', 'Success Rate', 'Avg. Time'],
+            [
+                [task, Run(rate, bold=True, color='green' if full else 'orange_rate'), avg]
+                for task, rate, avg, full in success_data
+            ],
+            zebra=False,
+        ),
+        HighlightBox([
+            bold_lead('Average Ease of Use Score: ', '8.0/10'),
+            bold_lead('Overall Task Completion: ', '89% (25/28 tasks fully completed)'),
+        ]),
+        Heading('Key Findings Summary', 4),
+        Table(
+            ['What Worked Well', 'Pain Points', 'Improvement Suggestions'],
+            [[
+                '• AI keyword suggestions highly accurate\n• Clean, modern UI design\n• Sentiment color coding intuitive\n• CSV export format useful\n• Dark mode well-implemented',
+                '• Competitor filter not prominent\n• No custom RSS feed input\n• Fetch progress not always clear\n• No multi-select for filters',
+                '• Add Slack integration\n• API access for automation\n• Custom RSS feed support\n• Keyboard shortcuts\n• Sentiment trend charts',
+            ]],
+            header_fills=['green_light', 'red_light', 'blue_light'],
+            zebra=False,
+        ),
+        Heading('Notable Participant Quotes', 4),
+        *(Quote(card.quote, f'{card.name}, {role}') for card, role in zip(
+            PARTICIPANTS, ['Senior PM', 'Associate PM', 'Data Analyst', 'UX Designer'])),
+    )
+
+    # ============= PART 4 =============
+    report.add(
+        PageBreak(),
+        Heading('Part 4: Reflection', 1),
+        Heading('What I Learned About AI-Assisted Product Management', 3),
+        Paragraph(runs(
+            'Building ProductPulse taught me that AI can fundamentally transform how product managers work '
+            'with user feedback. The most significant insight was how ',
+            Run('relevance filtering', bold=True),
+            ' solves the "noise problem" - without it, automated monitoring just creates more work sorting through irrelevant content.',
+        )),
+        Paragraph(runs(
+            'I also learned that AI sentiment analysis, while powerful, isn\'t perfect. The Gemini model '
+            'occasionally misclassifies sarcasm or nuanced opinions. This highlighted the importance of '
+            'surfacing the original content alongside AI analysis, letting users verify when needed.'
+        )),
+        Paragraph(runs(
+            'The workflow shift from reactive (manually searching) to proactive (AI surfacing insights) '
+            'represents a meaningful change in how PMs can spend their time - less on data gathering, '
+            'more on strategic decisions.'
+        )),
+        Heading('Challenges During Development', 3),
+        Paragraph(bold_lead(
+            'Rate Limiting: ',
+            'Reddit\'s API has strict rate limits. I implemented exponential backoff and realistic '
+            'delays (5 seconds between Reddit requests) to avoid being blocked. This taught me that '
+            'real-world integrations require defensive coding.',
+        )),
+        Paragraph(bold_lead(
+            'AI Prompt Engineering: ',
+            'Getting Gemini to output consistently structured JSON for sentiment, themes, and '
+            'entities required multiple iterations. The key was being extremely specific about '
+            'output format and providing examples.',
+        )),
+        Paragraph(bold_lead(
+            'Real-time Updates: ',
+            'Using Convex for real-time database updates created great UX but required careful '
+            'thinking about when to re-fetch data vs. rely on subscriptions.',
+        )),
+        Heading('What I Would Do Differently', 3),
+        ItemList([
+            bold_lead('Custom RSS Support: ', 'Multiple testers requested this. I\'d add a URL input field for arbitrary RSS feeds with validation.'),
+            bold_lead('Competitor Filter Prominence: ', 'The usability tests showed this filter was hard to find. I\'d make it a top-level filter alongside sentiment.'),
+            bold_lead('Onboarding Flow: ', 'A guided tour for first-time users would help them discover AI features faster.'),
+            bold_lead('API Access: ', 'For power users like Noa (the data analyst), an API would enable custom integrations.'),
+        ]),
+        Heading('Overall Experience', 3),
+        Paragraph(runs(
+            'Building a full AI application instead of a Custom GPT provided a much deeper understanding '
+            'of AI integration. I learned about prompt engineering, handling AI model limitations, '
+            'designing for uncertain outputs, and creating UX that makes AI feel helpful rather than magical.'
+        )),
+        Paragraph(runs(
+            'The usability testing was invaluable - real users surfaced issues I never would have found myself. '
+            'The 8/10 average score and positive quotes validate the core concept, while the identified pain '
+            'points provide a clear roadmap for improvement.'
+        )),
+        Paragraph(runs(
+            'This project demonstrated that AI can genuinely automate tedious PM tasks when integrated '
+            'thoughtfully into workflows. It\'s not about replacing human judgment but augmenting it with '
+            'data processing capabilities humans can\'t match.'
+        )),
+    )
+
+    # ============= TECHNICAL DETAILS =============
+    report.add(
+        PageBreak(),
+        Heading('Technical Details', 1),
+        Heading('Tech Stack', 3),
+        Table(['Layer', 'Technology'], [
+            ['Frontend', 'Next.js 15, TypeScript, Tailwind CSS, shadcn/ui'],
+            ['Backend', 'Convex (real-time database)'],
+            ['AI', 'Google Gemini 3 (gemini-3-flash-preview)'],
+            ['Charts', 'Recharts'],
+        ]),
+        Heading('AI Integration Architecture', 3),
+        Preformatted(ARCHITECTURE),
+        Heading('Repository', 3),
+        Paragraph([Run(REPO_URL, color='accent_blue', href=REPO_URL)]),
+    )
+
+    # ============= APPENDIX A =============
+    report.add(PageBreak(), Heading('Appendix A: Full Feature List', 1))
+    for section_title, items in FEATURES:
+        report.add(Heading(section_title, 3), ItemList([runs(item) for item in items]))
+
+    # ============= APPENDIX B =============
+    report.add(PageBreak(), Heading('Appendix B: Screenshots', 1))
+    for title, desc, chart_kind in SCREENSHOTS:
+        report.add(Heading(title, 4))
+        if charts and charts.get(chart_kind):
+            report.add(Paragraph(runs(desc)))
+            report.add(*(Image(path, caption) for caption, path in charts[chart_kind]))
+        else:
+            report.add(Paragraph([Run('[INSERT SCREENSHOT]', color='muted')]), Paragraph(runs(desc)))
+        report.add(Paragraph())
+
+    # ============= APPENDIX C =============
+    report.add(
+        Heading('Appendix C: Demo Video', 1),
+        Paragraph([Run('[INSERT VIDEO LINK HERE]', bold=True)]),
+        Paragraph(),
+        Paragraph(runs('The demo video (5 minutes) covers:')),
+        numbered([
+            'Introduction and problem statement',
+            'Creating a project with AI suggestions',
+            'Adding AI-recommended sources',
+            'Fetching and AI analysis',
+            'Reviewing insights with filters',
+            'Analytics dashboard',
+            'Export functionality',
+        ]),
+        Paragraph(),
+        Paragraph([Run('Submitted for AI-PM Metrics and Growth, January 2026', italic=True, color='muted')], align='center'),
+    )
+    return report
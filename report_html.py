@@ -0,0 +1,173 @@
+"""
+HTML backend for the report document model (report_model.py)
+Renders the same tree as the DOCX backend, with CSS generated from PALETTE so
+both outputs share one set of colors (see `create_docx.py --html`).
+"""
+import html
+import os
+
+from report_model import (
+    Heading, HighlightBox, Image, InfoBox, ItemList, PageBreak, Paragraph, ParticipantCard,
+    Preformatted, Quote, Table, PALETTE, Run,
+)
+
+STATUS_CLASSES = {'✓': 'success', '◐': 'partial', '✗': 'fail'}
+
+
+def stylesheet():
+    """Report CSS (matching ProductPulse_Assignment.html) from the shared palette"""
+    c = PALETTE
+    return f'''
+body {{ font-family: 'Calibri', 'Arial', sans-serif; max-width: 800px; margin: 40px auto; padding: 20px; line-height: 1.6; color: {c['text']}; }}
+h1 {{ color: {c['dark_blue']}; border-bottom: 3px solid {c['accent_blue']}; padding-bottom: 10px; font-size: 28px; }}
+h1.title {{ text-align: center; }}
+h2 {{ color: {c['medium_blue']}; border-bottom: 2px solid {c['blue_light']}; padding-bottom: 8px; margin-top: 30px; font-size: 22px; }}
+h3 {{ color: {c['light_blue']}; margin-top: 25px; font-size: 18px; }}
+h4 {{ color: {c['accent_blue']}; margin-top: 20px; font-size: 16px; }}
+table {{ border-collapse: collapse; width: 100%; margin: 15px 0; }}
+th, td {{ border: 1px solid {c['border']}; padding: 10px 12px; text-align: left; vertical-align: top; white-space: pre-line; }}
+th {{ background-color: {c['header_bg']}; font-weight: bold; color: {c['text_header']}; }}
+table.zebra tr:nth-child(even) {{ background-color: {c['row_alt']}; }}
+.header-info {{ background-color: {c['blue_info']}; padding: 20px; border-radius: 8px; margin-bottom: 20px; }}
+.header-info p, .highlight-box p {{ margin: 5px 0; }}
+.highlight-box {{ background-color: {c['yellow_box']}; border: 1px solid {c['yellow_border']}; padding: 15px; border-radius: 8px; margin: 15px 0; }}
+blockquote {{ background-color: {c['quote_bg']}; border-left: 4px solid {c['green_badge']}; padding: 15px 20px; margin: 15px 0; font-style: italic; color: {c['green']}; }}
+.participant-card {{ background-color: {c['card_bg']}; border: 1px solid {c['card_border']}; border-radius: 8px; padding: 20px; margin: 20px 0; }}
+.participant-header {{ display: flex; justify-content: space-between; border-bottom: 1px solid {c['card_border']}; padding-bottom: 10px; margin-bottom: 15px; }}
+.score-badge {{ background-color: {c['green_badge']}; color: white; padding: 5px 15px; border-radius: 20px; font-weight: bold; align-self: flex-start; }}
+.success {{ color: {c['green']}; }}
+.partial {{ color: {c['orange']}; }}
+.fail {{ color: {c['red']}; }}
+ul, ol {{ margin: 10px 0; padding-left: 25px; }}
+li {{ margin: 8px 0; }}
+code {{ background-color: {c['header_bg']}; padding: 2px 6px; border-radius: 4px; font-family: 'Consolas', monospace; }}
+.architecture {{ background-color: #1a202c; color: {c['card_border']}; padding: 20px; border-radius: 8px; font-family: 'Consolas', monospace; white-space: pre; overflow-x: auto; }}
+figure {{ margin: 15px 0; }}
+figure img {{ max-width: 100%; }}
+figcaption {{ font-size: 12px; font-style: italic; color: {c['muted']}; }}
+.page-break {{ page-break-before: always; }}
+'''
+
+
+def render_runs(runs):
+    """Inline HTML for a list of Runs"""
+    return ''.join(render_run(run) for run in runs)
+
+
+def render_run(run):
+    text = html.escape(run.text).replace('\n', '<br>')
+    if run.mono:
+        text = f'<code>{text}</code>'
+    if run.italic:
+        text = f'<em>{text}</em>'
+    if run.bold:
+        text = f'<strong>{text}</strong>'
+    if run.href:
+        style = f' style="color: {PALETTE[run.color]}"' if run.color else ''
+        return f'<a href="{html.escape(run.href)}"{style}>{text}</a>'
+    if run.color:
+        text = f'<span style="color: {PALETTE[run.color]}">{text}</span>'
+    return text
+
+
+def render_cell(value):
+    return render_run(value) if isinstance(value, Run) else html.escape(str(value))
+
+
+def render_table(table):
+    out = ['<table class="zebra">' if table.zebra else '<table>', '<tr>']
+    for i, header in enumerate(table.headers):
+        styles = []
+        if table.header_fills and i < len(table.header_fills):
+            styles.append(f'background-color: {PALETTE[table.header_fills[i]]}')
+        if table.header_colors and i < len(table.header_colors):
+            styles.append(f'color: {PALETTE[table.header_colors[i]]}')
+        style = f' style="{"; ".join(styles)}"' if styles else ''
+        out.append(f'<th{style}>{html.escape(header)}</th>')
+    out.append('</tr>')
+    for row in table.rows:
+        out.append('<tr>' + ''.join(f'<td>{render_cell(cell)}</td>' for cell in row) + '</tr>')
+    out.append('</table>')
+    return '\n'.join(out)
+
+
+def render_quote(quote):
+    text = f'"{html.escape(quote.text)}"'
+    if quote.author:
+        text += f' - {html.escape(quote.author)}'
+    return f'<blockquote>{text}</blockquote>'
+
+
+def render_participant_card(card, number):
+    out = [
+        '<div class="participant-card">',
+        '<div class="participant-header"><div>',
+        f'<strong>Participant {number}: {html.escape(card.name)}</strong><br>',
+        f'<em>{html.escape(card.title)}</em><br>',
+        f'<small>Company: {html.escape(card.company)}</small>',
+        f'</div><div class="score-badge">{html.escape(card.score)}/10</div></div>',
+        '<h4>Task Completion</h4>',
+        '<table class="zebra"><tr><th>Task</th><th>Status</th><th>Time</th><th>Notes</th></tr>',
+    ]
+    for task, status, time_taken, notes in card.tasks:
+        css = STATUS_CLASSES.get(status[:1])
+        status_cell = f'<td class="{css}">' if css else '<td>'
+        out.append(f'<tr><td>{html.escape(task)}</td>{status_cell}{html.escape(status)}</td>'
+                   f'<td>{html.escape(time_taken)}</td><td>{html.escape(notes)}</td></tr>')
+    out.append('</table>')
+    out.append('<h4>Feedback</h4><ul>')
+    for label, text in card.feedback:
+        out.append(f'<li><strong>{html.escape(label)}:</strong> "{html.escape(text)}"</li>')
+    out.append('</ul>')
+    out.append(render_quote(Quote(card.quote)))
+    out.append('</div>')
+    return '\n'.join(out)
+
+
+def render_html(report, base_dir='.'):
+    """Complete HTML page for a Report; image paths are made relative to base_dir (the page's directory)"""
+    body = []
+    participants = 0
+    for block in report.blocks:
+        if isinstance(block, Heading):
+            tag = f'h{max(block.level, 1)}'
+            css = ' class="title"' if block.level == 0 else ''
+            body.append(f'<{tag}{css}>{html.escape(block.text)}</{tag}>')
+        elif isinstance(block, Paragraph):
+            if block.runs:
+                align = f' style="text-align: {block.align}"' if block.align != 'left' else ''
+                body.append(f'<p{align}>{render_runs(block.runs)}</p>')
+        elif isinstance(block, ItemList):
+            tag = 'ol' if block.ordered else 'ul'
+            items = ''.join(f'<li>{render_runs(item)}</li>' for item in block.items)
+            body.append(f'<{tag}>{items}</{tag}>')
+        elif isinstance(block, Table):
+            body.append(render_table(block))
+        elif isinstance(block, (InfoBox, HighlightBox)):
+            css = 'header-info' if isinstance(block, InfoBox) else 'highlight-box'
+            lines = ''.join(f'<p>{render_runs(line)}</p>' for line in block.lines)
+            body.append(f'<div class="{css}">{lines}</div>')
+        elif isinstance(block, Quote):
+            body.append(render_quote(block))
+        elif isinstance(block, ParticipantCard):
+            participants += 1
+            body.append(render_participant_card(block, participants))
+        elif isinstance(block, Image):
+            caption = f'<figcaption>{html.escape(block.caption)}</figcaption>' if block.caption else ''
+            src = html.escape(os.path.relpath(block.path, base_dir).replace(os.sep, '/'))
+            body.append(f'<figure><img src="{src}" alt="{html.escape(block.caption or "")}">{caption}</figure>')
+        elif isinstance(block, Preformatted):
+            body.append(f'<div class="architecture">{html.escape(block.text)}</div>')
+        elif isinstance(block, PageBreak):
+            body.append('<div class="page-break"></div>')
+        else:
+            raise TypeError(f'Unknown report block: {type(block).__name__}')
+
+    return (
+        '<!DOCTYPE html>\n<html lang="en">\n<head>\n<meta charset="UTF-8">\n'
+        '<meta name="viewport" content="width=device-width, initial-scale=1.0">\n'
+        f'<title>{html.escape(report.title)}</title>\n<style>{stylesheet()}</style>\n</head>\n<body>\n'
+        + '\n'.join(body)
+        + '\n</body>\n</html>\n'
+    )
+
@@ -0,0 +1,141 @@
+"""
+Intermediate document model for the ProductPulse report
+The report is built once as a tree of blocks and rendered straight from memory
+by the DOCX backend (create_docx.py) and the HTML backend (report_html.py), so
+neither output is converted from the other.
+"""
+from dataclasses import dataclass, field
+
+# Report palette (matching the HTML styling); colors in the tree are keys of this dict
+PALETTE = {
+    'dark_blue': '#1a365d',      # h1
+    'medium_blue': '#2c5282',    # h2
+    'light_blue': '#2b6cb0',     # h3
+    'accent_blue': '#3182ce',    # h4, borders
+    'header_bg': '#edf2f7',      # table header
+    'row_alt': '#f7fafc',        # alternating rows
+    'green': '#276749',          # success
+    'green_light': '#c6f6d5',    # green bg
+    'green_badge': '#48bb78',    # score badge
+    'red': '#c53030',            # fail
+    'red_light': '#fed7d7',      # red bg
+    'orange': '#c05621',         # partial
+    'orange_rate': '#b7791f',    # 75% rate
+    'yellow_box': '#fffbeb',     # highlight box
+    'yellow_border': '#f6e05e',  # highlight border
+    'blue_info': '#ebf8ff',      # header info bg
+    'blue_light': '#bee3f8',     # h2 border
+    'card_bg': '#fafafa',        # card bg
+    'card_border': '#e2e8f0',    # card border
+    'text': '#333333',           # main text
+    'text_header': '#2d3748',    # table header text
+    'quote_bg': '#f0fff4',       # quote bg
+    'border': '#cbd5e0',         # table border
+    'muted': '#718096',          # placeholders, captions
+}
+
+
+@dataclass
+class Run:
+    text: str
+    bold: bool = False
+    italic: bool = False
+    color: str = None  # PALETTE key
+    mono: bool = False
+    href: str = None
+
+
+def runs(*parts):
+    """List of Runs from Run and plain-string parts"""
+    return [part if isinstance(part, Run) else Run(part) for part in parts]
+
+
+@dataclass
+class Heading:
+    text: str
+    level: int  # 0 = document title
+
+
+@dataclass
+class Paragraph:
+    runs: list = field(default_factory=list)  # Empty = spacer line (DOCX only)
+    align: str = 'left'
+
+
+@dataclass
+class ItemList:
+    items: list  # Each item is a list of Runs
+    ordered: bool = False
+
+
+@dataclass
+class Table:
+    headers: list
+    rows: list  # Cells are strings or Runs
+    header_fills: list = None  # PALETTE keys per column (default header_bg)
+    header_colors: list = None  # PALETTE keys for header text (default text_header)
+    zebra: bool = True  # Shade alternate rows
+
+
+@dataclass
+class InfoBox:
+    lines: list  # Each line is a list of Runs
+
+
+@dataclass
+class HighlightBox:
+    lines: list
+
+
+@dataclass
+class Quote:
+    text: str
+    author: str = None
+
+
+@dataclass
+class ParticipantCard:
+    name: str
+    title: str
+    company: str
+    score: str
+    tasks: list  # [task, status, time, notes]
+    feedback: list  # (label, text)
+    quote: str
+
+
+@dataclass
+class Image:
+    path: str
+    caption: str = None
+    width_in: float = 6.0
+
+
+@dataclass
+class Preformatted:
+    text: str
+
+
+@dataclass
+class PageBreak:
+    pass
+
+
+@dataclass
+class Report:
+    title: str
+    blocks: list = field(default_factory=list)
+
+    def add(self, *blocks):
+        self.blocks.extend(blocks)
+        return self
+
+    def sections(self):
+        """(title, blocks) for each top-level heading (levels 0 and 1) and the blocks under it"""
+        sections = []
+        for block in self.blocks:
+            if isinstance(block, Heading) and block.level <= 1 or not sections:
+                title = block.text if isinstance(block, Heading) else self.title
+                sections.append((title, []))
+            sections[-1][1].append(block)
+        return sections
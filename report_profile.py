@@ -0,0 +1,183 @@
+"""
+Opt-in profiling for the report builders (create_docx.py)
+Records call count, cumulative and self time, and tracemalloc peak per helper
+and per report section, and writes them as JSON plus a collapsed-stack profile
+(`frame;frame;frame microseconds` lines) for flamegraph.pl or speedscope.
+
+Enabled by the REPORT_PROFILE environment variable or create_docx's --profile:
+    REPORT_PROFILE=profiles/report python create_docx.py --output report.docx
+    python create_docx.py --output report.docx --profile profiles/report
+writes profiles/report.json and profiles/report.folded. Set
+REPORT_PROFILE_MEMORY=0 to skip tracemalloc (it slows allocation-heavy code).
+tracemalloc only sees Python allocations, not the lxml trees python-docx builds in C.
+"""
+import json
+import os
+import time
+import tracemalloc
+from collections import defaultdict
+from contextlib import contextmanager, nullcontext
+from functools import wraps
+
+ENV_VAR = 'REPORT_PROFILE'
+MEMORY_ENV_VAR = 'REPORT_PROFILE_MEMORY'
+
+
+class _Frame:
+    __slots__ = ('kind', 'name', 'start', 'child_time', 'base_mem', 'peak_mem')
+
+    def __init__(self, kind, name, base_mem):
+        self.kind = kind
+        self.name = name
+        self.start = time.perf_counter()
+        self.child_time = 0.0
+        self.base_mem = base_mem
+        self.peak_mem = base_mem  # Highest traced memory seen by finished children
+
+
+class Profiler:
+    """Per-helper and per-section timings and memory peaks"""
+
+    def __init__(self, memory=True):
+        self.memory = memory
+        self.stack = []
+        self.stats = {kind: defaultdict(lambda: {'calls': 0, 'total_s': 0.0, 'self_s': 0.0, 'peak_bytes': 0})
+                      for kind in ('sections', 'helpers')}
+        self.folded = defaultdict(float)  # Stack path -> self seconds
+        self.started_tracing = False
+
+    def start(self):
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.started_tracing = True
+        return self
+
+    def stop(self):
+        if self.started_tracing:
+            tracemalloc.stop()
+            self.started_tracing = False
+
+    def _enter(self, kind, name):
+        base_mem = 0
+        if self.memory and tracemalloc.is_tracing():
+            base_mem, peak = tracemalloc.get_traced_memory()
+            if self.stack:
+                # Keep the parent's peak so far before resetting the counter for this frame
+                self.stack[-1].peak_mem = max(self.stack[-1].peak_mem, peak)
+            tracemalloc.reset_peak()
+        self.stack.append(_Frame(kind, name, base_mem))
+
+    def _exit(self):
+        frame = self.stack[-1]
+        elapsed = time.perf_counter() - frame.start
+        peak = frame.peak_mem
+        if self.memory and tracemalloc.is_tracing():
+            peak = max(peak, tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+
+        path = ';'.join(f.name.replace(';', ',') for f in self.stack)
+        self.stack.pop()
+        stats = self.stats[frame.kind][frame.name]
+        stats['calls'] += 1
+        stats['self_s'] += elapsed - frame.child_time
+        # Recursive calls are already inside the outer call's time
+        if not any(f.kind == frame.kind and f.name == frame.name for f in self.stack):
+            stats['total_s'] += elapsed
+        stats['peak_bytes'] = max(stats['peak_bytes'], peak - frame.base_mem)
+        self.folded[path] += elapsed - frame.child_time
+
+        if self.stack:
+            parent = self.stack[-1]
+            parent.child_time += elapsed
+            parent.peak_mem = max(parent.peak_mem, peak)
+
+    @contextmanager
+    def section(self, name):
+        """Time a report section (a block of helper calls)"""
+        self._enter('sections', name)
+        try:
+            yield
+        finally:
+            self._exit()
+
+    def wrap(self, fn, name=None):
+        """fn, recording each call as a helper"""
+        name = name or fn.__name__
+
+        @wraps(fn)
+        def profiled(*args, **kwargs):
+            self._enter('helpers', name)
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self._exit()
+        profiled.__wrapped__ = fn
+        return profiled
+
+    @contextmanager
+    def instrument(self, namespace, names):
+        """Replace the named functions in a module namespace (e.g. vars(module)) with profiled ones"""
+        originals = {name: namespace[name] for name in names}
+        namespace.update({name: self.wrap(fn, name) for name, fn in originals.items()})
+        try:
+            yield self
+        finally:
+            namespace.update(originals)
+
+    def results(self):
+        """Stats as a JSON-ready dict, slowest first"""
+        def ordered(stats):
+            return {
+                name: {
+                    'calls': s['calls'],
+                    'total_ms': round(s['total_s'] * 1000, 3),
+                    'self_ms': round(s['self_s'] * 1000, 3),
+                    'peak_kb': round(s['peak_bytes'] / 1024, 1),
+                }
+                for name, s in sorted(stats.items(), key=lambda item: -item[1]['total_s'])
+            }
+        return {
+            'meta': {'createdAt': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()), 'memory': self.memory},
+            'sections': ordered(self.stats['sections']),
+            'helpers': ordered(self.stats['helpers']),
+        }
+
+    def collapsed(self):
+        """Collapsed-stack lines, self time in microseconds"""
+        return [f'{path} {round(seconds * 1e6)}' for path, seconds in sorted(self.folded.items()) if seconds > 0]
+
+    def write(self, prefix):
+        """Write <prefix>.json and <prefix>.folded; returns both paths"""
+        directory = os.path.dirname(prefix)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        json_path, folded_path = f'{prefix}.json', f'{prefix}.folded'
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump(self.results(), f, indent=2)
+        with open(folded_path, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(self.collapsed()) + '\n')
+        return json_path, folded_path
+
+    def summary(self, limit=10):
+        """Short text table of the slowest sections and helpers"""
+        lines = []
+        results = self.results()
+        for kind in ('sections', 'helpers'):
+            lines.append(f'{kind.title():<36} {"calls":>7} {"total ms":>10} {"self ms":>10} {"peak KB":>9}')
+            for name, s in list(results[kind].items())[:limit]:
+                lines.append(f'  {name[:34]:<34} {s["calls"]:>7} {s["total_ms"]:>10.1f} '
+                             f'{s["self_ms"]:>10.1f} {s["peak_kb"]:>9.1f}')
+        return '\n'.join(lines)
+
+
+def from_env():
+    """(Profiler, output prefix) when REPORT_PROFILE is set, else (None, None)"""
+    prefix = os.environ.get(ENV_VAR)
+    if not prefix:
+        return None, None
+    return Profiler(memory=os.environ.get(MEMORY_ENV_VAR, '1') != '0'), prefix
+
+
+def section(profiler, name):
+    """profiler.section(name), or a no-op context when profiling is off"""
+    return profiler.section(name) if profiler else nullcontext()
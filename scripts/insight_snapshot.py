@@ -0,0 +1,266 @@
+"""
+Read columnar insight snapshots (format in convex/exports/columnar.ts)
+Segments are memory-mapped; fixed-width columns are returned as memoryviews
+over the mapped file (no copies), numpy arrays when numpy is installed.
+
+Build and download a snapshot (later downloads only fetch new segments):
+    npx convex run exports/snapshot:buildInsightSnapshot '{"projectId": "..."}'
+    npx convex run exports/queries:getSnapshotDownload '{"projectId": "..."}' > snapshot.json
+    python scripts/insight_snapshot.py download snapshot.json snapshots/my-project
+    python scripts/insight_snapshot.py info snapshots/my-project
+    python scripts/insight_snapshot.py csv snapshots/my-project insights.csv
+"""
+import argparse
+import csv
+import json
+import mmap
+import os
+import sys
+import urllib.request
+from array import array
+from collections import Counter
+from datetime import datetime, timezone
+
+try:
+    import numpy
+except ImportError:  # Optional: memoryviews are used without it
+    numpy = None
+
+SUPPORTED_FORMAT = 1
+
+# Column type -> struct format character / numpy dtype (little-endian)
+FORMATS = {'f64': 'd', 'f32': 'f', 'u8': 'B', 'u32': 'I'}
+DTYPES = {'f64': '<f8', 'f32': '<f4', 'u8': 'u1', 'u32': '<u4'}
+
+# Columns holding dictionary codes -> manifest dictionary
+DICTIONARY_COLUMNS = {
+    'sentimentLabel': 'sentimentLabel',
+    'actionability': 'actionability',
+    'source': 'sources',
+    'themes': 'themes',
+    'entities': 'entities',
+}
+
+CSV_HEADERS = [
+    'Title', 'URL', 'Published At', 'Analyzed At', 'Sentiment Score', 'Sentiment Label',
+    'Actionability', 'Summary', 'Themes', 'Entities',
+]
+
+
+def _view(buffer, ref, fmt):
+    """Typed view of one buffer of a mapped segment"""
+    raw = memoryview(buffer)[ref['offset']:ref['offset'] + ref['length']]
+    if sys.byteorder == 'little' or fmt == 'B':
+        return raw.cast(fmt)
+    values = array(fmt, raw)  # Big-endian host: byte-swapped copy
+    values.byteswap()
+    return memoryview(values)
+
+
+class Segment:
+    def __init__(self, path, meta):
+        self.meta = meta
+        self.rows = meta['rowCount']
+        self.columns = {c['name']: c for c in meta['columns']}
+        with open(path, 'rb') as f:
+            self.mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def fixed(self, name):
+        column = self.columns[name]
+        return _view(self.mm, column['data'], FORMATS[column['type']])
+
+    def lists(self, name):
+        """(offsets, values): row i has values[offsets[i]:offsets[i + 1]]"""
+        column = self.columns[name]
+        return _view(self.mm, column['offsets'], 'I'), _view(self.mm, column['values'], 'I')
+
+    def strings(self, name):
+        """Decoded strings of a utf8 column"""
+        column = self.columns[name]
+        offsets = _view(self.mm, column['offsets'], 'I')
+        data = memoryview(self.mm)[column['data']['offset']:column['data']['offset'] + column['data']['length']]
+        return [bytes(data[offsets[i]:offsets[i + 1]]).decode('utf-8') for i in range(self.rows)]
+
+    def numpy(self, name):
+        column = self.columns[name]
+        ref = column['data']
+        return numpy.frombuffer(self.mm, dtype=DTYPES[column['type']],
+                                count=self.rows, offset=ref['offset'])
+
+    def close(self):
+        self.mm.close()
+
+
+class InsightSnapshot:
+    """A downloaded snapshot directory (manifest.json + segments/*.bin)"""
+
+    def __init__(self, path):
+        with open(os.path.join(path, 'manifest.json'), 'r', encoding='utf-8') as f:
+            self.manifest = json.load(f)
+        if self.manifest['formatVersion'] > SUPPORTED_FORMAT:
+            raise ValueError(f'Snapshot format {self.manifest["formatVersion"]} is newer than this reader')
+        self.dictionaries = self.manifest['dictionaries']
+        self.segments = [
+            Segment(os.path.join(path, 'segments', f'{meta["storageId"]}.bin'), meta)
+            for meta in self.manifest['segments']
+        ]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        for segment in self.segments:
+            segment.close()
+
+    @property
+    def row_count(self):
+        return self.manifest['rowCount']
+
+    def column(self, name):
+        """Zero-copy per-segment views (numpy arrays if available) of a fixed-width column"""
+        if numpy is not None:
+            return [segment.numpy(name) for segment in self.segments]
+        return [segment.fixed(name) for segment in self.segments]
+
+    def values(self, name):
+        """Iterate a column's decoded values across segments"""
+        dictionary = self.dictionaries.get(DICTIONARY_COLUMNS.get(name))
+        for segment in self.segments:
+            kind = segment.columns[name]['kind']
+            if kind == 'utf8':
+                yield from segment.strings(name)
+            elif kind == 'list':
+                offsets, codes = segment.lists(name)
+                for i in range(segment.rows):
+                    yield [dictionary[code] for code in codes[offsets[i]:offsets[i + 1]]]
+            elif dictionary is not None:
+                yield from (dictionary[code] for code in segment.fixed(name))
+            else:
+                yield from segment.fixed(name)
+
+    def code_counts(self, name):
+        """Occurrences per dictionary value of a list or code column, counted on codes"""
+        dictionary = self.dictionaries[DICTIONARY_COLUMNS[name]]
+        counts = Counter()
+        for segment in self.segments:
+            if segment.columns[name]['kind'] == 'list':
+                counts.update(segment.lists(name)[1])
+            else:
+                counts.update(segment.fixed(name))
+        return Counter({dictionary[code]: n for code, n in counts.items()})
+
+    def rows(self):
+        """Iterate rows as dicts (decodes every column)"""
+        names = [c['name'] for c in self.manifest['segments'][0]['columns']] if self.segments else []
+        columns = [self.values(name) for name in names]
+        for values in zip(*columns):
+            yield dict(zip(names, values))
+
+
+def iso_ms(ms):
+    """Same format as JavaScript's Date.toISOString()"""
+    ms = int(ms)
+    stamp = datetime.fromtimestamp(ms // 1000, timezone.utc).strftime('%Y-%m-%dT%H:%M:%S')
+    return f'{stamp}.{ms % 1000:03d}Z'
+
+
+def write_csv(snapshot, out, chunk_rows=5000):
+    """Stream the snapshot to CSV in chunks of chunk_rows (matches the dashboard export)"""
+    writer = csv.writer(out, lineterminator='\n')
+    writer.writerow(CSV_HEADERS)
+    chunk = []
+    written = 0
+    for row in snapshot.rows():
+        chunk.append([
+            row['title'], row['url'], iso_ms(row['publishedAt']), iso_ms(row['analyzedAt']),
+            round(row['sentimentScore'], 4), row['sentimentLabel'], row['actionability'],
+            row['summary'], '; '.join(row['themes']), '; '.join(row['entities']),
+        ])
+        if len(chunk) >= chunk_rows:
+            writer.writerows(chunk)
+            written += len(chunk)
+            chunk = []
+    writer.writerows(chunk)
+    return written + len(chunk)
+
+
+def download(info_path, out_dir):
+    """Fetch the manifest and any segments not already present; returns (fetched, kept)"""
+    with open(info_path, 'r', encoding='utf-8') as f:
+        info = json.load(f)
+    if not info:
+        sys.exit('No snapshot for this project yet (run exports/snapshot:buildInsightSnapshot)')
+
+    segments_dir = os.path.join(out_dir, 'segments')
+    os.makedirs(segments_dir, exist_ok=True)
+    with urllib.request.urlopen(info['manifestUrl']) as response:
+        manifest = json.load(response)
+
+    fetched = kept = 0
+    wanted = set()
+    for meta in manifest['segments']:
+        path = os.path.join(segments_dir, f'{meta["storageId"]}.bin')
+        wanted.add(os.path.basename(path))
+        if os.path.exists(path) and os.path.getsize(path) == meta['byteLength']:
+            kept += 1
+            continue
+        with urllib.request.urlopen(info['segmentUrls'][meta['storageId']]) as response, \
+                open(path + '.part', 'wb') as f:
+            while block := response.read(1 << 20):
+                f.write(block)
+        os.replace(path + '.part', path)
+        fetched += 1
+
+    # Segments dropped by a rebuild
+    for name in os.listdir(segments_dir):
+        if name not in wanted:
+            os.remove(os.path.join(segments_dir, name))
+
+    # Manifest last, so a reader never sees segments that are not on disk yet
+    with open(os.path.join(out_dir, 'manifest.json'), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f)
+    return fetched, kept
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Columnar insight snapshot tools')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    p = sub.add_parser('download', help='Download or update a snapshot directory')
+    p.add_argument('info', help='JSON from exports/queries:getSnapshotDownload')
+    p.add_argument('out', help='Snapshot directory')
+
+    p = sub.add_parser('info', help='Summarize a snapshot')
+    p.add_argument('path')
+    p.add_argument('--top', type=int, default=10)
+
+    p = sub.add_parser('csv', help='Write a snapshot as CSV')
+    p.add_argument('path')
+    p.add_argument('out')
+    p.add_argument('--chunk-rows', type=int, default=5000)
+
+    args = parser.parse_args()
+
+    if args.command == 'download':
+        fetched, kept = download(args.info, args.out)
+        print(f'Fetched {fetched} segment(s), {kept} already present -> {args.out}')
+    elif args.command == 'info':
+        with InsightSnapshot(args.path) as snapshot:
+            manifest = snapshot.manifest
+            print(f'{snapshot.row_count} insights in {len(snapshot.segments)} segment(s), '
+                  f'watermark {iso_ms(manifest["watermark"]) if manifest["watermark"] else "-"}')
+            for name in ('themes', 'entities', 'sentimentLabel'):
+                print(f'\n{name} ({len(snapshot.dictionaries[DICTIONARY_COLUMNS[name]])} distinct)')
+                for value, count in snapshot.code_counts(name).most_common(args.top):
+                    print(f'  {count:>8}  {value}')
+    elif args.command == 'csv':
+        with InsightSnapshot(args.path) as snapshot, open(args.out, 'w', encoding='utf-8', newline='') as f:
+            rows = write_csv(snapshot, f, args.chunk_rows)
+        print(f'Wrote {rows} rows to {args.out}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,189 @@
+"""
+Replay recorded fetch histories against the adaptive fetch scheduler
+Mirrors the policy in convex/feeds/scheduler.ts and compares it with the old
+fixed-interval policy (one fetch every fetchInterval): fetch volume saved and
+the latency added to item pickup
+
+Export a history first:
+    npx convex run feeds/queries:exportFetchHistory '{"daysBack": 14}' > history.json
+    python scripts/simulate_fetch_schedule.py history.json
+"""
+import argparse
+import bisect
+import json
+
+# Policy constants (keep in sync with convex/feeds/scheduler.ts)
+EWMA_ALPHA = 0.3
+WARMUP_FETCHES = 3
+TARGET_ITEMS_PER_FETCH = 3
+MIN_INTERVAL_FACTOR = 1
+MAX_INTERVAL_FACTOR = 4
+MAX_BACKOFF_EXPONENT = 6
+MAX_BACKOFF_MS = 48 * 60 * 60 * 1000
+
+# Items older than this are skipped by fetchSource (MAX_ITEM_AGE_DAYS)
+MAX_ITEM_AGE_MS = 2 * 24 * 60 * 60 * 1000
+
+FAILED = ('error', 'rate_limited')
+
+
+def ewma(prev, sample):
+    return prev + EWMA_ALPHA * (sample - prev)
+
+
+def update_stats(prev, outcome, items_added, latency_ms, at):
+    """Fold one fetch into the running stats (updateFetchStats)"""
+    failed = outcome in FAILED
+    if prev is None:
+        return {
+            'fetchCount': 1,
+            'yieldAvg': items_added,
+            'unchangedRate': 1 if outcome == 'unchanged' else 0,
+            'errorRate': 1 if outcome == 'error' else 0,
+            'rateLimitRate': 1 if outcome == 'rate_limited' else 0,
+            'latencyAvgMs': latency_ms,
+            'consecutiveFailures': 1 if failed else 0,
+            'lastAttemptAt': at,
+        }
+    return {
+        'fetchCount': prev['fetchCount'] + 1,
+        'yieldAvg': prev['yieldAvg'] if failed else ewma(prev['yieldAvg'], items_added),
+        'unchangedRate': ewma(prev['unchangedRate'], 1 if outcome == 'unchanged' else 0),
+        'errorRate': ewma(prev['errorRate'], 1 if outcome == 'error' else 0),
+        'rateLimitRate': ewma(prev['rateLimitRate'], 1 if outcome == 'rate_limited' else 0),
+        'latencyAvgMs': ewma(prev['latencyAvgMs'], latency_ms),
+        'consecutiveFailures': prev['consecutiveFailures'] + 1 if failed else 0,
+        'lastAttemptAt': at,
+    }
+
+
+def yield_interval_factor(stats):
+    """Interval multiplier from observed yield (yieldIntervalFactor)"""
+    if stats is None or stats['fetchCount'] < WARMUP_FETCHES:
+        return 1
+    factor = TARGET_ITEMS_PER_FETCH / max(stats['yieldAvg'], 0.01)
+    return max(MIN_INTERVAL_FACTOR, min(MAX_INTERVAL_FACTOR, factor))
+
+
+def next_due_at(stats, interval_minutes):
+    """Next fetch time for a source that has been fetched at least once (nextDueAt)"""
+    interval_ms = interval_minutes * 60 * 1000
+    if stats['consecutiveFailures'] > 0:
+        exponent = min(stats['consecutiveFailures'], MAX_BACKOFF_EXPONENT)
+        backoff_ms = min(interval_ms * 2 ** exponent, max(MAX_BACKOFF_MS, interval_ms))
+        return stats['lastAttemptAt'] + backoff_ms
+    return stats['lastAttemptAt'] + interval_ms * yield_interval_factor(stats)
+
+
+def fixed_due_at(stats, interval_minutes):
+    """Next fetch time under the old policy: every fetchInterval, no backoff or yield scaling"""
+    return stats['lastAttemptAt'] + interval_minutes * 60 * 1000
+
+
+def replay(fetches, arrivals, interval, cron_minutes, due_at):
+    """Run one scheduling policy over a source's recorded feed behaviour"""
+    times = [f['fetchedAt'] for f in fetches]
+    stats = None
+    result = {'fetches': 0, 'collected': 0, 'lost': 0, 'delayMs': 0.0}
+    next_arrival = 0
+
+    tick_ms = cron_minutes * 60 * 1000
+    t = times[0]
+    while t <= times[-1] + tick_ms:
+        if stats is None or t >= due_at(stats, interval):
+            result['fetches'] += 1
+            # The feed behaves as it did at the closest earlier recorded fetch
+            recorded = fetches[max(0, bisect.bisect_right(times, t) - 1)]
+
+            if recorded['outcome'] in FAILED:
+                stats = update_stats(stats, recorded['outcome'], 0, recorded['latencyMs'], t)
+            else:
+                new_items = 0
+                while next_arrival < len(arrivals) and arrivals[next_arrival][0] <= t:
+                    arrived_at, count = arrivals[next_arrival]
+                    if t - arrived_at > MAX_ITEM_AGE_MS:
+                        result['lost'] += count
+                    else:
+                        new_items += count
+                        result['delayMs'] += (t - arrived_at) * count
+                    next_arrival += 1
+                result['collected'] += new_items
+                outcome = 'new_items' if new_items > 0 else 'unchanged'
+                stats = update_stats(stats, outcome, new_items, recorded['latencyMs'], t)
+        t += tick_ms
+
+    # Items the policy never picked up before the history ends
+    result['missed'] = sum(n for _, n in arrivals[next_arrival:])
+    result['avgDelayMin'] = result['delayMs'] / result['collected'] / 60000 if result['collected'] else 0.0
+    return result
+
+
+def simulate_source(history, cron_minutes):
+    """Replay one source under the old fixed-interval policy (baseline) and the adaptive policy"""
+    fetches = sorted(history['fetches'], key=lambda f: f['fetchedAt'])
+    interval = history['fetchInterval']
+
+    # Items became visible no later than the recorded fetch that picked them up
+    arrivals = [(f['fetchedAt'], f['itemsAdded']) for f in fetches if f['itemsAdded'] > 0]
+
+    return {
+        'sourceId': history['sourceId'],
+        'interval': interval,
+        'items': sum(n for _, n in arrivals),
+        'fixed': replay(fetches, arrivals, interval, cron_minutes, fixed_due_at),
+        'adaptive': replay(fetches, arrivals, interval, cron_minutes, next_due_at),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Simulate adaptive fetch scheduling on recorded histories')
+    parser.add_argument('history', help='JSON exported by feeds/queries:exportFetchHistory')
+    parser.add_argument('--cron-minutes', type=int, default=30, help='Scheduler cron period (default: 30)')
+    parser.add_argument('--top', type=int, default=10, help='Sources to list individually (default: 10)')
+    args = parser.parse_args()
+
+    with open(args.history, 'r', encoding='utf-8') as f:
+        histories = json.load(f)
+
+    results = [
+        simulate_source(h, args.cron_minutes)
+        for h in histories
+        if h['fetches'] and h['fetchInterval'] > 0
+    ]
+    if not results:
+        print('No fetch history to simulate')
+        return
+
+    def total(policy, key):
+        return sum(r[policy][key] for r in results)
+
+    baseline = total('fixed', 'fetches')
+    adaptive = total('adaptive', 'fetches')
+    items = sum(r['items'] for r in results)
+    saved = baseline - adaptive
+
+    def avg_delay(policy):
+        collected = total(policy, 'collected')
+        return total(policy, 'delayMs') / collected / 60000 if collected else 0.0
+
+    print(f'Sources simulated:      {len(results)}')
+    print(f'Fixed-interval fetches: {baseline}')
+    print(f'Adaptive fetches:       {adaptive}')
+    print(f'Fetches saved:          {saved} ({saved / baseline * 100:.1f}%)' if baseline else 'Fetches saved: -')
+    for policy in ('fixed', 'adaptive'):
+        print(f'{policy.title() + " items:":<23} {total(policy, "collected")}/{items} '
+              f'({total(policy, "lost")} past max item age, {total(policy, "missed")} not fetched), '
+              f'avg delay {avg_delay(policy):.1f} min')
+    print(f'Added item latency:     {avg_delay("adaptive") - avg_delay("fixed"):+.1f} min')
+    print()
+    print(f'{"Source":<34} {"Interval":>8} {"Fixed":>6} {"Adapt":>6} {"Items":>6} '
+          f'{"Delay fixed":>12} {"Delay adapt":>12}')
+    results.sort(key=lambda r: r['fixed']['fetches'] - r['adaptive']['fetches'], reverse=True)
+    for r in results[:args.top]:
+        fixed, adaptive_r = r['fixed'], r['adaptive']
+        print(f'{r["sourceId"]:<34} {r["interval"]:>8} {fixed["fetches"]:>6} {adaptive_r["fetches"]:>6} '
+              f'{adaptive_r["collected"]:>6} {fixed["avgDelayMin"]:>12.1f} {adaptive_r["avgDelayMin"]:>12.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+"""
+Summarize an exported pipeline trace dump
+Prints p50/p95/p99 latency per stage and the slowest sources
+
+Export spans first:
+    npx convex run metrics:exportTraceSpans '{"hoursBack": 24}' > trace.json
+    python scripts/trace_report.py trace.json
+"""
+import argparse
+import json
+import math
+from collections import defaultdict
+
+# Pipeline order (matches TraceStage in convex/tracing.ts)
+STAGES = [
+    'schedule', 'http_fetch', 'parse', 'dedup', 'insert', 'queue_wait', 'prompt_build',
+    'prompt_cache', 'model_latency', 'json_parse', 'insight_write', 'alert_dispatch',
+]
+
+
+def percentile(sorted_values, p):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0
+    rank = max(1, math.ceil(p / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def format_ms(ms):
+    if ms >= 60000:
+        return f'{ms / 60000:.1f}m'
+    if ms >= 1000:
+        return f'{ms / 1000:.2f}s'
+    return f'{ms:.0f}ms'
+
+
+def load_spans(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    # Accept a bare list or {"spans": [...]}
+    return data['spans'] if isinstance(data, dict) else data
+
+
+def stage_table(spans):
+    """Rows of (stage, count, errors, p50, p95, p99, max)"""
+    by_stage = defaultdict(list)
+    errors = defaultdict(int)
+    for span in spans:
+        by_stage[span['stage']].append(span['durationMs'])
+        if not span.get('ok', True):
+            errors[span['stage']] += 1
+
+    rows = []
+    for stage in STAGES + sorted(set(by_stage) - set(STAGES)):
+        durations = sorted(by_stage.get(stage, []))
+        if not durations:
+            continue
+        rows.append((stage, len(durations), errors[stage],
+                     percentile(durations, 50), percentile(durations, 95),
+                     percentile(durations, 99), durations[-1]))
+    return rows
+
+
+def slowest_sources(spans, stage, top):
+    """Sources ranked by p95 latency of one stage"""
+    by_source = defaultdict(list)
+    errors = defaultdict(int)
+    for span in spans:
+        if span['stage'] != stage or not span.get('sourceId'):
+            continue
+        by_source[span['sourceId']].append(span['durationMs'])
+        if not span.get('ok', True):
+            errors[span['sourceId']] += 1
+
+    rows = []
+    for source_id, durations in by_source.items():
+        durations.sort()
+        rows.append((source_id, len(durations), errors[source_id],
+                     percentile(durations, 50), percentile(durations, 95)))
+    rows.sort(key=lambda r: r[4], reverse=True)
+    return rows[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Per-stage latency report from a trace dump')
+    parser.add_argument('trace', help='JSON exported by metrics:exportTraceSpans')
+    parser.add_argument('--top', type=int, default=10, help='Slowest sources to list (default: 10)')
+    parser.add_argument('--source-stage', default='http_fetch',
+                        help='Stage used to rank sources (default: http_fetch)')
+    args = parser.parse_args()
+
+    spans = load_spans(args.trace)
+    if not spans:
+        print('No spans in trace dump')
+        return
+
+    traces = len({s['traceId'] for s in spans})
+    print(f'{len(spans)} spans from {traces} traces')
+    print()
+    print(f'{"Stage":<15} {"Count":>7} {"Errors":>7} {"p50":>9} {"p95":>9} {"p99":>9} {"Max":>9}')
+    for stage, count, errs, p50, p95, p99, mx in stage_table(spans):
+        print(f'{stage:<15} {count:>7} {errs:>7} {format_ms(p50):>9} {format_ms(p95):>9} '
+              f'{format_ms(p99):>9} {format_ms(mx):>9}')
+
+    rows = slowest_sources(spans, args.source_stage, args.top)
+    if rows:
+        print()
+        print(f'Slowest sources by {args.source_stage} p95')
+        print(f'{"Source":<34} {"Count":>7} {"Errors":>7} {"p50":>9} {"p95":>9}')
+        for source_id, count, errs, p50, p95 in rows:
+            print(f'{source_id:<34} {count:>7} {errs:>7} {format_ms(p50):>9} {format_ms(p95):>9}')
+
+
+if __name__ == '__main__':
+    main()